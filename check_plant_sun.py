@@ -29,7 +29,9 @@ from datetime import datetime
 # Add project to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from sun_plant_simulator.homeassistant.service import check_sunlight, get_sunlight_details
+# The simulator (and NumPy with it) is imported inside the code paths that
+# need it: this script runs once per Home Assistant poll, so interpreter
+# startup is most of its wall time.
 
 
 def get_current_sun_position(config_path: str | None = None):
@@ -80,11 +82,24 @@ def main():
                 print("off")
                 sys.exit(0)
 
-        if args.json:
+        if elevation <= 0:
+            # Sun below horizon: no direct sunlight, so no config or ray tests
+            if args.json:
+                import json
+                from sun_plant_simulator.homeassistant.service import get_below_horizon_details
+
+                print(json.dumps(get_below_horizon_details(azimuth, elevation)))
+            else:
+                print("off")
+        elif args.json:
             import json
+            from sun_plant_simulator.homeassistant.service import get_sunlight_details
+
             details = get_sunlight_details(azimuth, elevation, config_path)
             print(json.dumps(details))
         else:
+            from sun_plant_simulator.homeassistant.service import check_sunlight
+
             is_hit = check_sunlight(azimuth, elevation, config_path)
             print("on" if is_hit else "off")
 
@@ -12,6 +12,7 @@ Usage:
 import json
 import sys
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
 from sun_plant_simulator.core.models import Config
@@ -23,6 +24,7 @@ from sun_plant_simulator.core.sun_position import (
 from sun_plant_simulator.visualization.interactive import create_time_slider_visualization
 
 
+@lru_cache(maxsize=64)
 def _format_utc_offset(hours: float) -> str:
     """Format a UTC offset in hours as UTC±HH:MM."""
     sign = "+" if hours >= 0 else "-"
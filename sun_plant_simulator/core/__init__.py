@@ -1,9 +1,19 @@
 """Core hit-test algorithm components."""
 
-from .models import Window, Plant, HitResult, Config
+from .models import Window, WindowsSoA, Plant, HitResult, BatchHitResult, Config
 from .geometry import sun_direction_from_angles
-from .ray_casting import ray_intersects_window
-from .hit_test import check_sun_hits_plant, generate_plant_sample_points
+from .ray_casting import (
+    ray_intersects_window,
+    rays_hit_any_window,
+    rays_intersect_window,
+    specialize_ray_hits_any_window,
+)
+from .hit_test import (
+    check_sun_hits_plant,
+    check_sun_hits_plant_batch,
+    generate_plant_sample_points,
+    generate_plant_sample_points_array,
+)
 from .coordinates import (
     position_from_wall_distances,
     wall_distances_from_position,
@@ -12,13 +22,20 @@ from .coordinates import (
 
 __all__ = [
     "Window",
+    "WindowsSoA",
     "Plant",
     "HitResult",
+    "BatchHitResult",
     "Config",
     "sun_direction_from_angles",
     "ray_intersects_window",
+    "rays_intersect_window",
+    "rays_hit_any_window",
+    "specialize_ray_hits_any_window",
     "check_sun_hits_plant",
+    "check_sun_hits_plant_batch",
     "generate_plant_sample_points",
+    "generate_plant_sample_points_array",
     "position_from_wall_distances",
     "wall_distances_from_position",
     "plant_position_from_wall_distances",
@@ -0,0 +1,27 @@
+"""Lookup of the optional compiled kernels shared by the hot-path modules.
+
+Imports nothing from the rest of the package, so any module can ask whether
+the Numba kernels are loaded without importing them (or Numba) itself.
+"""
+
+import sys
+from types import ModuleType
+from typing import Optional
+
+_KERNELS_MODULE = f"{__package__}._kernels"
+
+
+def loaded_kernels() -> Optional[ModuleType]:
+    """Return the compiled-kernel module if something already loaded it.
+
+    Never imports it: see hit_test.load_compiled_kernels for how the
+    optional Numba kernels get loaded. The kernels give bit-identical
+    results to the Python and NumPy paths, so using them only changes speed.
+
+    Returns:
+        The _kernels module, or None if it is not loaded or Numba is missing.
+    """
+    kernels = sys.modules.get(_KERNELS_MODULE)
+    if kernels is None or not kernels.HAS_NUMBA:
+        return None
+    return kernels
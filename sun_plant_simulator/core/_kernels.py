@@ -0,0 +1,243 @@
+"""Optional Numba-compiled kernels for the hit-test and sun-position hot paths.
+
+Numba is an optional dependency. When it is not installed, HAS_NUMBA is False
+and callers fall back to the NumPy implementations in ray_casting.
+
+The kernels operate on the packed window arrays of a WindowsSoA (see
+kernel_window_args) so that no Python objects are touched inside the loops.
+"""
+
+import numpy as np
+
+from . import sun_position
+from .models import WindowsSoA
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAS_NUMBA = False
+else:
+    HAS_NUMBA = True
+
+# Fast-math flags that never change how finite values round. Contraction into
+# FMA and reassociation are left out so the compiled kernels give bit-identical
+# answers to the NumPy path, including when the sun grazes a wall.
+_FASTMATH = {"nnan", "ninf", "nsz"}
+
+
+def kernel_window_args(windows: WindowsSoA) -> tuple[np.ndarray, ...]:
+    """Return the WindowsSoA arrays in the positional order the kernels expect."""
+    return (
+        windows.normal_x,
+        windows.normal_y,
+        windows.plane_axis,
+        windows.inner_coord,
+        windows.thickness,
+        windows.center_h,
+        windows.center_z,
+        windows.half_width,
+        windows.half_height,
+        windows.bbox_min,
+        windows.bbox_max,
+    )
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _ray_in_plane_bounds(ox, oy, oz, sx, sy, sz, plane_axis, plane_coord,
+                             center_h, center_z, half_w, half_h, epsilon):
+        # Branch-free: every reject condition is evaluated and the results are
+        # combined with "&", so LLVM can use selects instead of jumps
+        axis_is_y = plane_axis == 1
+        o_axis = oy if axis_is_y else ox
+        d_axis = sy if axis_is_y else sx
+        o_other = ox if axis_is_y else oy
+        d_other = sx if axis_is_y else sy
+
+        # A ray parallel to the plane is rejected; divide by 1 instead of by
+        # (nearly) zero so no inf reaches the fast-math arithmetic
+        not_parallel = abs(d_axis) >= epsilon
+        t = (plane_coord - o_axis) / (d_axis if not_parallel else 1.0)
+
+        local_h = o_other + t * d_other - center_h
+        local_v = oz + t * sz - center_z
+        return (
+            not_parallel
+            & (t >= 0)
+            & (abs(local_h) <= half_w + epsilon)
+            & (abs(local_v) <= half_h + epsilon)
+        )
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _window_reachable(origins_min, origins_max, sun_dir, box_min, box_max, margin):
+        # Slab test of the swept origin box against one window box; see
+        # ray_casting._windows_reachable
+        # Large finite bound instead of inf: the "ninf" fast-math flag lets
+        # the compiler assume infinities never occur
+        t_enter = 0.0
+        t_exit = 1e300
+        for k in range(3):
+            lo = box_min[k] - margin - origins_max[k]
+            hi = box_max[k] + margin - origins_min[k]
+            d = sun_dir[k]
+            if d > 0:
+                t_enter = max(t_enter, lo / d)
+                t_exit = min(t_exit, hi / d)
+            elif d < 0:
+                t_enter = max(t_enter, hi / d)
+                t_exit = min(t_exit, lo / d)
+            elif lo > 0 or hi < 0:
+                return False
+        return t_enter <= t_exit
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _fill_first_windows(origins, origins_min, origins_max, sun_dir, normal_x,
+                            normal_y, plane_axis, inner_coord, thickness, center_h,
+                            center_z, half_width, half_height, bbox_min, bbox_max,
+                            epsilon, candidate, out):
+        # Write into out[i] the index of the first window hit by origin i.
+        # candidate is a caller-provided (W,) scratch buffer, so parallel
+        # callers do not allocate inside their loop.
+        n = origins.shape[0]
+        n_windows = normal_x.shape[0]
+        sx, sy, sz = sun_dir[0], sun_dir[1], sun_dir[2]
+
+        # Bounding-box early-out: windows no ray can reach are skipped
+        for w in range(n_windows):
+            # Sun must be on the outside of the wall
+            candidate[w] = (
+                sx * normal_x[w] + sy * normal_y[w] > 0
+                and _window_reachable(origins_min, origins_max, sun_dir,
+                                      bbox_min[w], bbox_max[w], 1e-6)
+            )
+
+        for i in range(n):
+            ox, oy, oz = origins[i, 0], origins[i, 1], origins[i, 2]
+            for w in range(n_windows):
+                if not candidate[w]:
+                    continue
+
+                # Both tunnel planes are always tested; with no thickness the
+                # outer plane is the inner one and the result is unchanged
+                axis = plane_axis[w]
+                inner = inner_coord[w]
+                hit = _ray_in_plane_bounds(
+                    ox, oy, oz, sx, sy, sz, axis, inner, center_h[w], center_z[w],
+                    half_width[w], half_height[w], epsilon,
+                ) & _ray_in_plane_bounds(
+                    ox, oy, oz, sx, sy, sz, axis, inner - thickness[w], center_h[w],
+                    center_z[w], half_width[w], half_height[w], epsilon,
+                )
+                if hit:
+                    out[i] = w
+                    break
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _origins_bounds(origins):
+        origins_min = np.empty(3)
+        origins_max = np.empty(3)
+        for k in range(3):
+            origins_min[k] = origins[:, k].min()
+            origins_max[k] = origins[:, k].max()
+        return origins_min, origins_max
+
+    # Entry points release the GIL, so hit tests from several Python threads
+    # (e.g. concurrent service calls) run at the same time
+    @njit(nogil=True, cache=True, fastmath=_FASTMATH)
+    def _rays_hit_any_window(origins, sun_dir, normal_x, normal_y, plane_axis,
+                             inner_coord, thickness, center_h, center_z, half_width,
+                             half_height, bbox_min, bbox_max, epsilon=1e-10):
+        """Return, for each origin, the index of the first window hit (-1 if none)."""
+        out = np.full(origins.shape[0], -1, dtype=np.int32)
+        if origins.shape[0] == 0:
+            return out
+
+        origins_min, origins_max = _origins_bounds(origins)
+        candidate = np.empty(normal_x.shape[0], dtype=np.bool_)
+        _fill_first_windows(origins, origins_min, origins_max, sun_dir, normal_x,
+                            normal_y, plane_axis, inner_coord, thickness, center_h,
+                            center_z, half_width, half_height, bbox_min, bbox_max,
+                            epsilon, candidate, out)
+        return out
+
+    @njit(parallel=True, nogil=True, cache=True, fastmath=_FASTMATH)
+    def _rays_hit_any_window_batch(origins, sun_dirs, normal_x, normal_y, plane_axis,
+                                   inner_coord, thickness, center_h, center_z,
+                                   half_width, half_height, bbox_min, bbox_max,
+                                   epsilon=1e-10):
+        """Batched _rays_hit_any_window over sun directions of shape (T, 3).
+
+        Timestamps are independent, so they are spread over threads with
+        prange. Returns first-window indices of shape (T, N).
+        """
+        n_times = sun_dirs.shape[0]
+        out = np.full((n_times, origins.shape[0]), -1, dtype=np.int32)
+        if origins.shape[0] == 0:
+            return out
+
+        origins_min, origins_max = _origins_bounds(origins)
+        # Scratch rows allocated once up front: heap allocation inside prange
+        # serializes the threads on the allocator
+        candidates = np.empty((n_times, normal_x.shape[0]), dtype=np.bool_)
+        for t in prange(n_times):
+            _fill_first_windows(origins, origins_min, origins_max, sun_dirs[t],
+                                normal_x, normal_y, plane_axis, inner_coord,
+                                thickness, center_h, center_z, half_width,
+                                half_height, bbox_min, bbox_max, epsilon,
+                                candidates[t], out[t])
+        return out
+
+    @njit(parallel=True, nogil=True, cache=True, fastmath=_FASTMATH)
+    def _rays_hit_any_window_per_ray(origins, directions, normal_x, normal_y,
+                                     plane_axis, inner_coord, thickness, center_h,
+                                     center_z, half_width, half_height, bbox_min,
+                                     bbox_max, epsilon=1e-10):
+        """_rays_hit_any_window with one direction per origin, shape (N, 3).
+
+        The whole (N, W) loop is fused: rays are spread over threads and each
+        stops at its first window. There is no shared sun direction to cull
+        windows with, so bbox_min/bbox_max are accepted only to keep the
+        kernel_window_args order and each window is tested on the sun-side
+        check alone.
+        """
+        n = origins.shape[0]
+        n_windows = normal_x.shape[0]
+        out = np.full(n, -1, dtype=np.int32)
+        for i in prange(n):
+            ox, oy, oz = origins[i, 0], origins[i, 1], origins[i, 2]
+            sx, sy, sz = directions[i, 0], directions[i, 1], directions[i, 2]
+            for w in range(n_windows):
+                if not sx * normal_x[w] + sy * normal_y[w] > 0:
+                    continue
+                axis = plane_axis[w]
+                inner = inner_coord[w]
+                hit = _ray_in_plane_bounds(
+                    ox, oy, oz, sx, sy, sz, axis, inner, center_h[w], center_z[w],
+                    half_width[w], half_height[w], epsilon,
+                ) & _ray_in_plane_bounds(
+                    ox, oy, oz, sx, sy, sz, axis, inner - thickness[w], center_h[w],
+                    center_z[w], half_width[w], half_height[w], epsilon,
+                )
+                if hit:
+                    out[i] = w
+                    break
+        return out
+
+    # Same source as the pure-Python solar position arithmetic, compiled;
+    # calculate_sun_position switches to it once this module is loaded
+    _sun_position_core = njit(cache=True, fastmath=_FASTMATH)(sun_position._sun_position_core)
+
+    # Compile (or load from the on-disk cache) once at import time so the
+    # first hit test does not pay the JIT cost. Sample points and single sun
+    # directions come from shared read-only caches, which Numba types
+    # separately from writable arrays.
+    _warmup_origins = np.zeros((1, 3))
+    _warmup_origins.setflags(write=False)
+    _warmup_sun_dir = np.array([0.0, 0.0, 1.0])
+    _warmup_sun_dir.setflags(write=False)
+    _warmup_windows = kernel_window_args(WindowsSoA.from_windows([]))
+    _rays_hit_any_window(_warmup_origins, _warmup_sun_dir, *_warmup_windows)
+    _rays_hit_any_window_batch(_warmup_origins, np.array([[0.0, 0.0, 1.0]]), *_warmup_windows)
+    _rays_hit_any_window_per_ray(_warmup_origins, np.array([[0.0, 0.0, 1.0]]), *_warmup_windows)
+    _sun_position_core(0.5, -1.5, 0.4, 12, 0, 0, -81.0, -5.0)
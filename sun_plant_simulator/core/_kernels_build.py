@@ -0,0 +1,31 @@
+"""Precompile the optional Numba kernels ahead of time.
+
+Run once after installing with the ``fast`` extra (and again after
+upgrading Numba or this package):
+
+    python -m sun_plant_simulator.core._kernels_build
+
+Importing _kernels compiles every kernel with cache=True, so this fills
+Numba's on-disk cache and later processes load machine code instead of
+invoking LLVM. Set NUMBA_CACHE_DIR beforehand if the package directory
+is not writable.
+"""
+
+import sys
+import time
+
+
+def main() -> int:
+    start = time.perf_counter()
+    from . import _kernels
+
+    if not _kernels.HAS_NUMBA:
+        print("numba is not installed; nothing to compile", file=sys.stderr)
+        return 1
+
+    print(f"Numba kernels compiled and cached in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,21 +12,18 @@ from typing import Optional
 import numpy as np
 
 
-def wall_normal_to_inward_direction(wall_normal_azimuth_deg: float) -> np.ndarray:
+def wall_normal_to_inward_direction(wall_normal_azimuth_deg: float) -> tuple[float, float]:
     """Get the inward direction (into the room) from a wall's outward normal.
 
     Args:
         wall_normal_azimuth_deg: Outward normal azimuth in degrees.
 
     Returns:
-        2D unit vector pointing into the room (opposite of outward normal).
+        2D unit vector (x, y) pointing into the room (opposite of outward normal).
     """
-    # Outward normal direction
+    # Outward normal direction is (sin, cos); inward is opposite
     az_rad = math.radians(wall_normal_azimuth_deg)
-    outward = np.array([math.sin(az_rad), math.cos(az_rad)])
-
-    # Inward is opposite
-    return -outward
+    return -math.sin(az_rad), -math.cos(az_rad)
 
 
 def position_from_wall_distances(
@@ -63,14 +60,14 @@ def position_from_wall_distances(
         ... )
     """
     # Get inward directions for each wall
-    dir1 = wall_normal_to_inward_direction(wall1_normal_azimuth)
-    dir2 = wall_normal_to_inward_direction(wall2_normal_azimuth)
+    d1x, d1y = wall_normal_to_inward_direction(wall1_normal_azimuth)
+    d2x, d2y = wall_normal_to_inward_direction(wall2_normal_azimuth)
 
     # Position = corner + dist1 * dir1 + dist2 * dir2
-    corner = np.array([corner_x, corner_y])
-    position = corner + dist_from_wall1 * dir1 + dist_from_wall2 * dir2
+    x = corner_x + dist_from_wall1 * d1x + dist_from_wall2 * d2x
+    y = corner_y + dist_from_wall1 * d1y + dist_from_wall2 * d2y
 
-    return float(position[0]), float(position[1])
+    return float(x), float(y)
 
 
 def wall_distances_from_position(
@@ -97,18 +94,88 @@ def wall_distances_from_position(
         Tuple of (dist_from_wall1, dist_from_wall2) in meters.
     """
     # Get inward directions
-    dir1 = wall_normal_to_inward_direction(wall1_normal_azimuth)
-    dir2 = wall_normal_to_inward_direction(wall2_normal_azimuth)
+    d1x, d1y = wall_normal_to_inward_direction(wall1_normal_azimuth)
+    d2x, d2y = wall_normal_to_inward_direction(wall2_normal_azimuth)
 
     # Offset from corner
-    offset = np.array([x - corner_x, y - corner_y])
+    ox = x - corner_x
+    oy = y - corner_y
 
     # Solve: offset = d1 * dir1 + d2 * dir2
-    # This is a 2x2 linear system: [dir1 | dir2] * [d1, d2]^T = offset
-    A = np.column_stack([dir1, dir2])
-    distances = np.linalg.solve(A, offset)
+    # This is a 2x2 linear system [dir1 | dir2] * [d1, d2]^T = offset,
+    # solved directly with Cramer's rule
+    det = d1x * d2y - d1y * d2x
+    if det == 0:
+        raise np.linalg.LinAlgError("Walls are parallel; distances are not unique")
+
+    dist1 = (ox * d2y - oy * d2x) / det
+    dist2 = (d1x * oy - d1y * ox) / det
+
+    return float(dist1), float(dist2)
+
+
+def position_from_wall_distances_array(
+    dist_from_wall1: np.ndarray,
+    dist_from_wall2: np.ndarray,
+    wall1_normal_azimuth: float,
+    wall2_normal_azimuth: float,
+    corner_x: float = 0.0,
+    corner_y: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized version of position_from_wall_distances for many points.
+
+    Args:
+        dist_from_wall1: Distances from wall 1 in meters, shape (N,).
+        dist_from_wall2: Distances from wall 2 in meters, shape (N,).
+        wall1_normal_azimuth: Wall 1 outward normal azimuth (degrees).
+        wall2_normal_azimuth: Wall 2 outward normal azimuth (degrees).
+        corner_x: X coordinate of the corner where walls meet.
+        corner_y: Y coordinate of the corner where walls meet.
+
+    Returns:
+        Tuple of (x, y) coordinate arrays in meters.
+    """
+    d1x, d1y = wall_normal_to_inward_direction(wall1_normal_azimuth)
+    d2x, d2y = wall_normal_to_inward_direction(wall2_normal_azimuth)
+
+    dist1 = np.asarray(dist_from_wall1, dtype=float)
+    dist2 = np.asarray(dist_from_wall2, dtype=float)
+
+    return corner_x + dist1 * d1x + dist2 * d2x, corner_y + dist1 * d1y + dist2 * d2y
+
+
+def wall_distances_from_position_array(
+    x: np.ndarray,
+    y: np.ndarray,
+    wall1_normal_azimuth: float,
+    wall2_normal_azimuth: float,
+    corner_x: float = 0.0,
+    corner_y: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized version of wall_distances_from_position for many points.
+
+    Args:
+        x: X coordinates in meters, shape (N,).
+        y: Y coordinates in meters, shape (N,).
+        wall1_normal_azimuth: Wall 1 outward normal azimuth (degrees).
+        wall2_normal_azimuth: Wall 2 outward normal azimuth (degrees).
+        corner_x: X coordinate of the corner where walls meet.
+        corner_y: Y coordinate of the corner where walls meet.
+
+    Returns:
+        Tuple of (dist_from_wall1, dist_from_wall2) arrays in meters.
+    """
+    d1x, d1y = wall_normal_to_inward_direction(wall1_normal_azimuth)
+    d2x, d2y = wall_normal_to_inward_direction(wall2_normal_azimuth)
+
+    det = d1x * d2y - d1y * d2x
+    if det == 0:
+        raise np.linalg.LinAlgError("Walls are parallel; distances are not unique")
+
+    ox = np.asarray(x, dtype=float) - corner_x
+    oy = np.asarray(y, dtype=float) - corner_y
 
-    return float(distances[0]), float(distances[1])
+    return (ox * d2y - oy * d2x) / det, (d1x * oy - d1y * ox) / det
 
 
 def print_coordinate_info(
@@ -135,7 +202,8 @@ def print_coordinate_info(
     print(f"  - Wall faces: {(wall2_normal_azimuth + 180) % 360:.0f}° (into room)")
 
     # Angle between walls
-    angle = math.degrees(math.acos(np.clip(np.dot(dir1, dir2), -1, 1)))
+    cos_angle = dir1[0] * dir2[0] + dir1[1] * dir2[1]
+    angle = math.degrees(math.acos(min(1.0, max(-1.0, cos_angle))))
     print(f"\nAngle between walls: {angle:.1f}°")
 
     print("\nTo convert wall distances to x/y:")
@@ -17,6 +17,7 @@ Azimuth Convention:
 """
 
 import math
+from functools import lru_cache
 
 import numpy as np
 
@@ -51,6 +52,22 @@ def sun_direction_from_angles(azimuth_deg: float, elevation_deg: float) -> np.nd
         >>> sun_direction_from_angles(180, 30)  # Sun in South, 30° up
         array([ 0.        , -0.8660254 ,  0.5       ])
     """
+    return np.array(sun_direction_components(azimuth_deg, elevation_deg))
+
+
+def sun_direction_components(azimuth_deg: float, elevation_deg: float) -> tuple[float, float, float]:
+    """Scalar version of sun_direction_from_angles returning a plain tuple.
+
+    Avoids allocating an array when the caller only needs the three
+    components, e.g. for a single ray test.
+
+    Args:
+        azimuth_deg: Sun azimuth in degrees, clockwise from North.
+        elevation_deg: Sun elevation above horizon in degrees.
+
+    Returns:
+        Tuple (x_east, y_north, z_up) of the unit vector pointing toward the sun.
+    """
     az_rad = math.radians(azimuth_deg)
     el_rad = math.radians(elevation_deg)
 
@@ -65,7 +82,56 @@ def sun_direction_from_angles(azimuth_deg: float, elevation_deg: float) -> np.nd
     y = cos_el * math.cos(az_rad)  # North component
     z = sin_el  # Up component
 
-    return np.array([x, y, z])
+    return x, y, z
+
+
+@lru_cache(maxsize=4096)
+def _sun_direction_quantized(azimuth_centideg: int, elevation_centideg: int) -> tuple[float, float, float]:
+    return sun_direction_components(azimuth_centideg / 100, elevation_centideg / 100)
+
+
+def sun_direction_from_angles_cached(azimuth_deg: float, elevation_deg: float) -> tuple[float, float, float]:
+    """Memoized sun direction for angles quantized to 0.01°.
+
+    Intended for display code that revisits the same sun positions (e.g.
+    repeated day sweeps). The quantization moves the direction by up to
+    ~1e-4 rad, so numerical code should keep using sun_direction_from_angles.
+
+    Args:
+        azimuth_deg: Sun azimuth in degrees, clockwise from North.
+        elevation_deg: Sun elevation above horizon in degrees.
+
+    Returns:
+        Tuple (x_east, y_north, z_up) for the rounded angles.
+    """
+    return _sun_direction_quantized(round(azimuth_deg * 100), round(elevation_deg * 100))
+
+
+def sun_direction_from_angles_array(
+    azimuth_deg: np.ndarray,
+    elevation_deg: np.ndarray,
+) -> np.ndarray:
+    """Convert arrays of sun azimuths and elevations to direction vectors.
+
+    Vectorized version of sun_direction_from_angles for many timestamps.
+
+    Args:
+        azimuth_deg: Sun azimuths in degrees, clockwise from North, shape (T,).
+        elevation_deg: Sun elevations above horizon in degrees, shape (T,).
+
+    Returns:
+        Array of shape (T, 3) with one unit vector [x_east, y_north, z_up] per row.
+    """
+    az_rad = np.radians(np.asarray(azimuth_deg, dtype=float))
+    el_rad = np.radians(np.asarray(elevation_deg, dtype=float))
+
+    cos_el = np.cos(el_rad)
+
+    directions = np.empty(az_rad.shape + (3,), dtype=float)
+    directions[..., 0] = cos_el * np.sin(az_rad)  # East component
+    directions[..., 1] = cos_el * np.cos(az_rad)  # North component
+    directions[..., 2] = np.sin(el_rad)  # Up component
+    return directions
 
 
 def angles_from_sun_direction(direction: np.ndarray) -> tuple[float, float]:
@@ -85,14 +151,40 @@ def angles_from_sun_direction(direction: np.ndarray) -> tuple[float, float]:
     horizontal_distance = math.sqrt(x * x + y * y)
     elevation_deg = math.degrees(math.atan2(z, horizontal_distance))
 
-    # Azimuth is the angle from North, clockwise
-    azimuth_deg = math.degrees(math.atan2(x, y))
-    if azimuth_deg < 0:
-        azimuth_deg += 360.0
+    # Azimuth is the angle from North, clockwise, wrapped from (-180, 180] to [0, 360)
+    azimuth_deg = math.degrees(math.atan2(x, y)) % 360.0
 
     return azimuth_deg, elevation_deg
 
 
+# Use plain-float arithmetic for 3-vectors in the helpers below; NumPy's
+# per-call overhead dwarfs the handful of FLOPs involved.
+FAST_SCALAR = True
+
+
+def _dot3(a, b) -> float:
+    """Dot product of two 3-sequences with scalar math."""
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross3(a, b) -> tuple[float, float, float]:
+    """Cross product of two 3-sequences with scalar math."""
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def _norm3(a) -> float:
+    """Euclidean length of a 3-sequence with scalar math."""
+    return math.sqrt(a[0] * a[0] + a[1] * a[1] + a[2] * a[2])
+
+
+def _is_vec3(v) -> bool:
+    return FAST_SCALAR and len(v) == 3
+
+
 def normalize(v: np.ndarray) -> np.ndarray:
     """Normalize a vector to unit length.
 
@@ -105,10 +197,10 @@ def normalize(v: np.ndarray) -> np.ndarray:
     Raises:
         ValueError: If the vector has zero length.
     """
-    length = np.linalg.norm(v)
+    length = _norm3(v) if _is_vec3(v) else np.linalg.norm(v)
     if length < 1e-10:
         raise ValueError("Cannot normalize zero-length vector")
-    return v / length
+    return np.asarray(v) / length
 
 
 def dot(a: np.ndarray, b: np.ndarray) -> float:
@@ -121,6 +213,8 @@ def dot(a: np.ndarray, b: np.ndarray) -> float:
     Returns:
         Scalar dot product.
     """
+    if _is_vec3(a) and len(b) == 3:
+        return float(_dot3(a, b))
     return float(np.dot(a, b))
 
 
@@ -134,11 +228,17 @@ def cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     Returns:
         Cross product vector a × b.
     """
+    if _is_vec3(a) and len(b) == 3:
+        return np.array(_cross3(a, b))
     return np.cross(a, b)
 
 
 def angle_between_vectors(a: np.ndarray, b: np.ndarray) -> float:
-    """Compute the angle between two vectors in degrees.
+    """Compute the angle between two 3D vectors in degrees.
+
+    Uses atan2(|a x b|, a . b), which needs no normalization and stays
+    accurate for nearly parallel or anti-parallel vectors where acos of the
+    dot product loses precision.
 
     Args:
         a: First vector.
@@ -146,11 +246,16 @@ def angle_between_vectors(a: np.ndarray, b: np.ndarray) -> float:
 
     Returns:
         Angle in degrees [0, 180].
+
+    Raises:
+        ValueError: If either vector has zero length.
     """
-    a_norm = normalize(a)
-    b_norm = normalize(b)
-    cos_angle = np.clip(dot(a_norm, b_norm), -1.0, 1.0)
-    return math.degrees(math.acos(cos_angle))
+    if _dot3(a, a) < 1e-20 or _dot3(b, b) < 1e-20:
+        raise ValueError("Cannot compute angle with a zero-length vector")
+
+    sin_term = _norm3(_cross3(a, b))
+    cos_term = _dot3(a, b)
+    return math.degrees(math.atan2(sin_term, cos_term))
 
 
 def project_onto_plane(v: np.ndarray, plane_normal: np.ndarray) -> np.ndarray:
@@ -164,20 +269,20 @@ def project_onto_plane(v: np.ndarray, plane_normal: np.ndarray) -> np.ndarray:
         Component of v that lies in the plane.
     """
     n = normalize(plane_normal)
-    return v - dot(v, n) * n
+    return np.asarray(v) - dot(v, n) * n
 
 
-def azimuth_to_direction_2d(azimuth_deg: float) -> np.ndarray:
+def azimuth_to_direction_2d(azimuth_deg: float) -> tuple[float, float]:
     """Convert an azimuth angle to a 2D direction vector (xy plane).
 
     Args:
         azimuth_deg: Azimuth in degrees, clockwise from North.
 
     Returns:
-        2D unit vector [x_east, y_north].
+        2D unit vector (x_east, y_north).
     """
     az_rad = math.radians(azimuth_deg)
-    return np.array([math.sin(az_rad), math.cos(az_rad)])
+    return math.sin(az_rad), math.cos(az_rad)
 
 
 def sun_direction_simplified(
@@ -211,3 +316,51 @@ def sun_direction_simplified(
 
     # Now compute direction using standard formula
     return sun_direction_from_angles(simplified_azimuth, sun_elevation_deg)
+
+
+@lru_cache(maxsize=4096)
+def sun_direction_simplified_cached(
+    sun_azimuth_deg: float,
+    sun_elevation_deg: float,
+    wall1_normal_azimuth: float = 210.0,
+) -> np.ndarray:
+    """Memoized sun_direction_simplified.
+
+    Keyed on the exact input angles, so the result is bit-identical to
+    sun_direction_simplified. That matters because the hit test works on
+    window edges, and even 1e-4° of rounding can flip a grazing ray.
+    Repeated positions (day sweeps replayed for several configs, or a
+    hit check followed by its detailed variant) skip the trig. The
+    returned array is shared between callers and is read-only.
+
+    Args:
+        sun_azimuth_deg: Sun azimuth in degrees, clockwise from North (real world).
+        sun_elevation_deg: Sun elevation above horizon in degrees.
+        wall1_normal_azimuth: Real-world azimuth of wall 1's outward normal.
+
+    Returns:
+        Read-only unit vector [x, y, z] pointing toward the sun in simplified coordinates.
+    """
+    direction = sun_direction_simplified(sun_azimuth_deg, sun_elevation_deg, wall1_normal_azimuth)
+    direction.flags.writeable = False
+    return direction
+
+
+def sun_direction_simplified_array(
+    sun_azimuth_deg: np.ndarray,
+    sun_elevation_deg: np.ndarray,
+    wall1_normal_azimuth: float = 210.0,
+) -> np.ndarray:
+    """Vectorized version of sun_direction_simplified for many timestamps.
+
+    Args:
+        sun_azimuth_deg: Sun azimuths in degrees (real world), shape (T,).
+        sun_elevation_deg: Sun elevations above horizon in degrees, shape (T,).
+        wall1_normal_azimuth: Real-world azimuth of wall 1's outward normal.
+
+    Returns:
+        Array of shape (T, 3) with sun directions in simplified coordinates.
+    """
+    rotation = wall1_normal_azimuth - 180.0
+    simplified_azimuth = np.asarray(sun_azimuth_deg, dtype=float) - rotation
+    return sun_direction_from_angles_array(simplified_azimuth, sun_elevation_deg)
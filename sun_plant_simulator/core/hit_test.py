@@ -4,14 +4,116 @@ This module contains the core algorithm that determines whether direct sunlight
 passes through a window and strikes the plant.
 """
 
+import importlib.util
 import math
+from functools import lru_cache
+from types import ModuleType
 from typing import Optional
 
 import numpy as np
 
-from .geometry import sun_direction_from_angles, sun_direction_simplified
-from .models import Config, HitResult, Plant, Window
-from .ray_casting import ray_intersects_window, ray_window_intersection
+from ._backend import loaded_kernels
+from .geometry import (
+    sun_direction_from_angles,
+    sun_direction_simplified_array,
+    sun_direction_simplified_cached,
+)
+from .models import BatchHitResult, Config, HitResult, Plant, Window, WindowsSoA
+from .ray_casting import (
+    _rays_through_window_soa,
+    _rays_through_windows_soa,
+    _windows_facing_sun,
+    _windows_reachable,
+    rays_window_intersection,
+)
+
+
+@lru_cache(maxsize=8)
+def _unit_circle(n_angular: int) -> tuple[np.ndarray, np.ndarray]:
+    """Read-only cosines and sines of the n_angular sample angles.
+
+    Depends only on the sampling resolution, so every plant (e.g. each
+    candidate position in a placement sweep) shares one trig evaluation.
+    """
+    angles = 2 * math.pi * np.arange(n_angular) / n_angular
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    cos_a.setflags(write=False)
+    sin_a.setflags(write=False)
+    return cos_a, sin_a
+
+
+def generate_plant_sample_points_array(
+    plant: Plant,
+    n_angular: int = 8,
+    n_vertical: int = 3,
+) -> np.ndarray:
+    """Generate sample points on the plant cylinder surface as a single array.
+
+    Points are ordered angle-major (all heights for the first angle, then the
+    next angle), followed by the top-center and mid-height center points.
+
+    Args:
+        plant: Plant geometry definition.
+        n_angular: Number of angular divisions around the cylinder (default 8).
+        n_vertical: Number of vertical divisions along the cylinder (default 3).
+
+    Returns:
+        Array of shape (n_angular * n_vertical + 2, 3) with one point per row.
+    """
+    cos_a, sin_a = _unit_circle(n_angular)
+    xs = plant.center_x + plant.radius * cos_a
+    ys = plant.center_y + plant.radius * sin_a
+
+    if n_vertical > 1:
+        zs = plant.z_min + (plant.z_max - plant.z_min) * np.arange(n_vertical) / (n_vertical - 1)
+    else:
+        zs = np.array([(plant.z_min + plant.z_max) / 2])
+
+    n_surface = n_angular * n_vertical
+    points = np.empty((n_surface + 2, 3), dtype=float)
+    points[:n_surface, 0] = np.repeat(xs, n_vertical)
+    points[:n_surface, 1] = np.repeat(ys, n_vertical)
+    points[:n_surface, 2] = np.tile(zs, n_angular)
+
+    # Center point at the top of the plant
+    points[n_surface] = (plant.center_x, plant.center_y, plant.z_max)
+
+    # Center point at the middle height
+    points[n_surface + 1] = (plant.center_x, plant.center_y, (plant.z_min + plant.z_max) / 2)
+
+    return points
+
+
+@lru_cache(maxsize=8)
+def _sample_points(
+    plant_key: tuple[float, float, float, float, float],
+    n_angular: int,
+    n_vertical: int,
+) -> np.ndarray:
+    """Cached sample points keyed by (center_x, center_y, radius, z_min, z_max).
+
+    The returned array is shared between callers and therefore read-only.
+    """
+    center_x, center_y, radius, z_min, z_max = plant_key
+    plant = Plant(center_x=center_x, center_y=center_y, radius=radius, z_min=z_min, z_max=z_max)
+    points = generate_plant_sample_points_array(plant, n_angular, n_vertical)
+    points.setflags(write=False)
+    return points
+
+
+def _plant_sample_points(plant: Plant, n_angular: int, n_vertical: int) -> np.ndarray:
+    """Return the (read-only) sample points for a plant, computing them once.
+
+    Points are memoized on the Plant instance, so a sweep over one plant
+    skips even the cache-key lookup; plants with equal geometry also share
+    one array through _sample_points.
+    """
+    points = plant._sample_cache.get((n_angular, n_vertical))
+    if points is None:
+        plant_key = (plant.center_x, plant.center_y, plant.radius, plant.z_min, plant.z_max)
+        points = _sample_points(plant_key, n_angular, n_vertical)
+        plant._sample_cache[(n_angular, n_vertical)] = points
+    return points
 
 
 def generate_plant_sample_points(
@@ -25,6 +127,9 @@ def generate_plant_sample_points(
     Points are distributed around the circumference and along the height.
     Additional points are added at the center of the top surface.
 
+    The hit test itself reads a shared cached array instead; this list form
+    is kept for visualization code.
+
     Args:
         plant: Plant geometry definition.
         n_angular: Number of angular divisions around the cylinder (default 8).
@@ -33,30 +138,109 @@ def generate_plant_sample_points(
     Returns:
         List of 3D points on the plant surface.
     """
-    points = []
+    return list(generate_plant_sample_points_array(plant, n_angular, n_vertical))
 
-    # Points around the cylinder surface
-    for i in range(n_angular):
-        angle = 2 * math.pi * i / n_angular
-        x = plant.center_x + plant.radius * math.cos(angle)
-        y = plant.center_y + plant.radius * math.sin(angle)
 
-        for j in range(n_vertical):
-            if n_vertical > 1:
-                z = plant.z_min + (plant.z_max - plant.z_min) * j / (n_vertical - 1)
-            else:
-                z = (plant.z_min + plant.z_max) / 2
-            points.append(np.array([x, y, z]))
+# Checked without importing: loading Numba and the compiled kernels costs
+# around half a second, which would dominate a one-shot hit test such as a
+# check_plant_sun.py poll.
+_NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
-    # Center point at the top of the plant
-    points.append(np.array([plant.center_x, plant.center_y, plant.z_max]))
 
-    # Center point at the middle height
-    points.append(
-        np.array([plant.center_x, plant.center_y, (plant.z_min + plant.z_max) / 2])
+def _compiled_kernels(load: bool) -> Optional[ModuleType]:
+    """Return the compiled-kernel module, or None to use the NumPy path.
+
+    With load=False the kernels are only used if something already loaded
+    them in this process; with load=True they are imported (and compiled or
+    read from Numba's cache) on first use.
+    """
+    if not _NUMBA_AVAILABLE:
+        return None
+    kernels = loaded_kernels()
+    if kernels is None and load:
+        from . import _kernels
+
+        kernels = _kernels if _kernels.HAS_NUMBA else None
+    return kernels
+
+
+def load_compiled_kernels() -> bool:
+    """Load the optional Numba kernels so every later hit test uses them.
+
+    Batched hit tests load the kernels on first use, while a single sun
+    position keeps the NumPy path unless they are already loaded. Once loaded,
+    calculate_sun_position also uses its compiled arithmetic. Long-running
+    processes that make many single-position checks can call this once
+    at startup.
+
+    Returns:
+        True if the compiled kernels are available, False if Numba is not
+        installed.
+    """
+    return _compiled_kernels(load=True) is not None
+
+
+# Checked without importing for the same reason as Numba
+_CUPY_AVAILABLE = importlib.util.find_spec("cupy") is not None
+
+
+def _gpu_backend() -> Optional[ModuleType]:
+    """Return the CuPy backend module, or None when CuPy is not installed."""
+    if not _CUPY_AVAILABLE:
+        return None
+    from . import _ray_gpu
+
+    return _ray_gpu if _ray_gpu.HAS_CUPY else None
+
+
+def _first_window_per_point(
+    sample_points: np.ndarray,
+    sun_dir: np.ndarray,
+    windows: WindowsSoA,
+) -> np.ndarray:
+    """Return the index of the first window hit by each sample point's ray (-1 if none).
+
+    sun_dir may be a single direction (3,) or one direction per timestamp
+    (T, 3); the result then has shape (N,) or (T, N) respectively. Indices
+    are int32, which is plenty for a room's windows and halves the size of
+    the (T, N) result.
+    """
+    # A single sun direction is cheap in NumPy, so only batches pay for loading
+    kernels = _compiled_kernels(load=sun_dir.ndim > 1) if len(windows) else None
+    if kernels is not None:
+        window_args = kernels.kernel_window_args(windows)
+        if sun_dir.ndim == 1:
+            return kernels._rays_hit_any_window(sample_points, sun_dir, *window_args)
+        return kernels._rays_hit_any_window_batch(sample_points, sun_dir, *window_args)
+
+    # Early-outs: skip (direction, window) pairs where the sun is behind the
+    # wall or no ray can reach the window's bounding box
+    reachable = _windows_facing_sun(sun_dir, windows) & _windows_reachable(
+        sample_points, sun_dir, windows
     )
 
-    return points
+    if sun_dir.ndim == 1:
+        # All candidate windows at once as an (N, K) mask; first True wins
+        candidates = np.flatnonzero(reachable)
+        point_window = np.full(len(sample_points), -1, dtype=np.int32)
+        if len(candidates):
+            mask = _rays_through_windows_soa(sample_points, sun_dir, windows, candidates)
+            point_hit = mask.any(axis=1)
+            point_window[point_hit] = candidates[mask.argmax(axis=1)[point_hit]]
+        return point_window
+
+    point_window = np.full(sun_dir.shape[:-1] + (len(sample_points),), -1, dtype=np.int32)
+
+    # One pass per window (W is small) over just the timestamps that can
+    # reach it; no per-point or per-timestamp Python loop
+    for w_idx in np.flatnonzero(reachable.any(axis=0)):
+        rows = np.flatnonzero(reachable[:, w_idx])
+        mask = _rays_through_window_soa(sample_points, sun_dir[rows], windows, w_idx)
+        # Point can only be hit through one window: keep the first one
+        row_windows = point_window[rows]
+        row_windows[mask & (row_windows < 0)] = w_idx
+        point_window[rows] = row_windows
+    return point_window
 
 
 def check_sun_hits_plant(
@@ -67,6 +251,7 @@ def check_sun_hits_plant(
     n_angular: int = 8,
     n_vertical: int = 3,
     wall1_normal_azimuth: float = 210.0,
+    window_soa: Optional[WindowsSoA] = None,
 ) -> HitResult:
     """Determine if direct sunlight hits the plant through any window.
 
@@ -84,12 +269,15 @@ def check_sun_hits_plant(
         n_angular: Number of angular divisions for plant sampling.
         n_vertical: Number of vertical divisions for plant sampling.
         wall1_normal_azimuth: Real-world azimuth of wall 1's outward normal.
+        window_soa: Packed constants for `windows` (e.g. Config.window_soa).
+            Built from `windows` when not given.
 
     Returns:
         HitResult containing:
         - is_hit: True if any sample point receives direct sunlight
         - window_id: ID of the window through which light passes (if hit)
-        - hit_points: List of sample points that receive sunlight
+        - hit_points: (K, 3) array of sample points that receive sunlight
+        - hit_mask: (N,) mask of the sample points that receive sunlight
         - sun_direction: Direction vector toward the sun
         - reason: Explanation if not hit (e.g., "sun_below_horizon")
     """
@@ -98,35 +286,43 @@ def check_sun_hits_plant(
         return HitResult(is_hit=False, reason="sun_below_horizon")
 
     # Compute sun direction vector in simplified coordinate system
-    sun_dir = sun_direction_simplified(sun_azimuth_deg, sun_elevation_deg, wall1_normal_azimuth)
+    sun_dir = sun_direction_simplified_cached(
+        sun_azimuth_deg, sun_elevation_deg, wall1_normal_azimuth
+    )
 
-    # Generate sample points on the plant
-    sample_points = generate_plant_sample_points(plant, n_angular, n_vertical)
+    if window_soa is None:
+        window_soa = WindowsSoA.from_windows(windows)
 
-    hit_points = []
-    hit_window_id: Optional[str] = None
+    # Sun behind every wall: no window can pass light, decided in O(W)
+    if not _windows_facing_sun(sun_dir, window_soa).any():
+        return HitResult(is_hit=False, sun_direction=sun_dir, reason="no_window_path")
+
+    # Sample points on the plant (depend only on the plant geometry)
+    sample_points = _plant_sample_points(plant, n_angular, n_vertical)
 
-    # Test each sample point
-    for point in sample_points:
-        for window in windows:
-            if ray_intersects_window(point, sun_dir, window):
-                hit_points.append(point)
-                if hit_window_id is None:
-                    hit_window_id = window.id
-                break  # Point can only be hit through one window
+    # Index of the first window each sample point sees the sun through (-1 = none)
+    point_window = _first_window_per_point(sample_points, sun_dir, window_soa)
+    point_hit = point_window >= 0
 
-    if hit_points:
+    hit_points = sample_points[point_hit]
+    hit_window_id: Optional[str] = None
+
+    if len(hit_points):
+        # The first hit point decides the reported window
+        hit_window_id = window_soa.ids[point_window[point_hit.argmax()]]
         return HitResult(
             is_hit=True,
             window_id=hit_window_id,
             hit_points=hit_points,
             sun_direction=sun_dir,
+            hit_mask=point_hit,
         )
     else:
         return HitResult(
             is_hit=False,
             sun_direction=sun_dir,
             reason="no_window_path",
+            hit_mask=point_hit,
         )
 
 
@@ -152,6 +348,79 @@ def check_sun_hits_plant_from_config(
         windows=config.windows,
         n_angular=config.simulation.sample_points_angular,
         n_vertical=config.simulation.sample_points_vertical,
+        window_soa=config.window_soa,
+    )
+
+
+def check_sun_hits_plant_batch(
+    sun_azimuths_deg: np.ndarray,
+    sun_elevations_deg: np.ndarray,
+    plant: Plant,
+    windows: list[Window],
+    n_angular: int = 8,
+    n_vertical: int = 3,
+    wall1_normal_azimuth: float = 210.0,
+    window_soa: Optional[WindowsSoA] = None,
+    use_gpu: bool = False,
+) -> BatchHitResult:
+    """Run check_sun_hits_plant for many sun positions at once.
+
+    The sample points and the packed window table are set up once, and all
+    timestamps with the sun above the horizon are evaluated together:
+    (T, 3) sun directions against (N, 3) sample points. Intended for day- or
+    year-long sweeps where per-call overhead would dominate.
+
+    Args:
+        sun_azimuths_deg: Sun azimuths in degrees, clockwise from North, shape (T,).
+        sun_elevations_deg: Sun elevations above horizon in degrees, shape (T,).
+        plant: Plant geometry definition.
+        windows: List of windows in the room.
+        n_angular: Number of angular sample divisions.
+        n_vertical: Number of vertical sample divisions.
+        wall1_normal_azimuth: Real-world azimuth of wall 1's outward normal.
+        window_soa: Packed window arrays for `windows` (e.g. config.window_soa).
+            Built from `windows` when not given.
+        use_gpu: Evaluate the rays on the GPU through CuPy. Falls back to the
+            CPU path when CuPy is not installed; results are the same either way.
+
+    Returns:
+        BatchHitResult whose hit_result(t) equals the check_sun_hits_plant
+        result for the t-th sun position.
+    """
+    azimuths = np.asarray(sun_azimuths_deg, dtype=float)
+    elevations = np.asarray(sun_elevations_deg, dtype=float)
+    sun_dirs = sun_direction_simplified_array(azimuths, elevations, wall1_normal_azimuth)
+    sample_points = _plant_sample_points(plant, n_angular, n_vertical)
+
+    if window_soa is None:
+        window_soa = WindowsSoA.from_windows(windows)
+
+    # Sun below horizon = no direct sunlight possible. Only timestamps with
+    # the sun up and outside at least one window's wall are ray-tested
+    above_horizon = elevations > 0
+    active = above_horizon & _windows_facing_sun(sun_dirs, window_soa).any(axis=-1)
+    # int32 indices halve the (T, N) result for long sweeps
+    point_window = np.full((len(elevations), len(sample_points)), -1, dtype=np.int32)
+    if active.any():
+        gpu = _gpu_backend() if use_gpu else None
+        first_window = gpu.first_window_per_point if gpu else _first_window_per_point
+        point_window[active] = first_window(sample_points, sun_dirs[active], window_soa)
+    point_hit = point_window >= 0
+
+    is_hit = point_hit.any(axis=1)
+    # First hit point of each timestamp determines the reported window
+    first_point = point_hit.argmax(axis=1)
+    window_index = np.where(is_hit, point_window[np.arange(len(elevations)), first_point], -1)
+
+    return BatchHitResult(
+        is_hit=is_hit,
+        window_index=window_index,
+        hit_counts=point_hit.sum(axis=1),
+        point_window=point_window,
+        above_horizon=above_horizon,
+        sun_directions=sun_dirs,
+        sample_points=sample_points,
+        window_ids=window_soa.ids,
     )
 
 
@@ -189,51 +458,55 @@ def get_detailed_hit_info(
         }
 
     sun_dir = sun_direction_from_angles(sun_azimuth_deg, sun_elevation_deg)
-    sample_points = generate_plant_sample_points(plant, n_angular, n_vertical)
+    sample_points = _plant_sample_points(plant, n_angular, n_vertical)
+
+    # One batched pass per window over all sample points. Hit state is
+    # reduced on the (W, N) mask; the per-point dicts are then assembled
+    # from lists converted once per window rather than once per element.
+    results = [rays_window_intersection(sample_points, sun_dir, w) for w in windows]
+    intersects = np.array([r.intersects for r in results], dtype=bool).reshape(
+        len(windows), len(sample_points)
+    )
+    point_hit = intersects.any(axis=0)
 
-    point_details = []
-    any_hit = False
     first_hit_window = None
+    if point_hit.any():
+        first_point = int(point_hit.argmax())
+        first_hit_window = windows[int(intersects[:, first_point].argmax())].id
+
+    per_window = [
+        (
+            window.id,
+            r.intersects.tolist(),
+            r.has_point.tolist(),
+            r.points.tolist(),
+            r.t.tolist(),
+            r.local_h.tolist(),
+            r.local_v.tolist(),
+        )
+        for window, r in zip(windows, results)
+    ]
 
-    for i, point in enumerate(sample_points):
-        point_info = {
-            "index": i,
-            "position": point.tolist(),
-            "windows": [],
-        }
-
-        for window in windows:
-            result = ray_window_intersection(point, sun_dir, window)
-            window_info = {
-                "window_id": window.id,
-                "intersects": result.intersects,
-            }
-            if result.point is not None:
-                window_info["intersection_point"] = result.point.tolist()
-                window_info["t"] = result.t
-                window_info["local_h"] = result.local_h
-                window_info["local_v"] = result.local_v
-
-            point_info["windows"].append(window_info)
-
-            if result.intersects:
-                any_hit = True
-                if first_hit_window is None:
-                    first_hit_window = window.id
-
-        point_details.append(point_info)
+    point_details = []
+    for i, position in enumerate(sample_points.tolist()):
+        window_details = []
+        for window_id, hit, has_point, points, t, local_h, local_v in per_window:
+            window_info = {"window_id": window_id, "intersects": hit[i]}
+            if has_point[i]:
+                window_info["intersection_point"] = points[i]
+                window_info["t"] = t[i]
+                window_info["local_h"] = local_h[i]
+                window_info["local_v"] = local_v[i]
+            window_details.append(window_info)
+        point_details.append({"index": i, "position": position, "windows": window_details})
 
     return {
-        "is_hit": any_hit,
+        "is_hit": bool(point_hit.any()),
         "window_id": first_hit_window,
         "sun_azimuth_deg": sun_azimuth_deg,
         "sun_elevation_deg": sun_elevation_deg,
         "sun_direction": sun_dir.tolist(),
         "n_sample_points": len(sample_points),
-        "n_hit_points": sum(
-            1
-            for p in point_details
-            if any(w["intersects"] for w in p["windows"])
-        ),
+        "n_hit_points": int(point_hit.sum()),
         "points": point_details,
     }
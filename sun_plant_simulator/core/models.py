@@ -4,14 +4,22 @@ from __future__ import annotations
 
 import json
 import math
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
 
-@dataclass
+# Parsed JSON of recently loaded config files, keyed on (absolute path,
+# mtime in ns, size) so an edited file is picked up on the next load
+_CONFIG_JSON_CACHE_SIZE = 8
+_config_json_cache: dict[tuple[str, int, int], dict] = {}
+
+
+@dataclass(slots=True)
 class Location:
     """Geographic location for sun position calculations.
 
@@ -27,7 +35,7 @@ class Location:
     timezone_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Window:
     """A rectangular window on a wall.
 
@@ -54,56 +62,283 @@ class Window:
     axis: Optional[str] = None
     position_along_wall: Optional[float] = None
 
+    # Frame vectors, bounds and corners derived from the geometry fields.
+    # Computed once in __post_init__ and recomputed whenever one of those
+    # fields is assigned.
+    _normal: np.ndarray = field(init=False, repr=False, compare=False)
+    _h_axis: np.ndarray = field(init=False, repr=False, compare=False)
+    _v_axis: np.ndarray = field(init=False, repr=False, compare=False)
+    _plane_axis: int = field(init=False, repr=False, compare=False)
+    _other_axis: int = field(init=False, repr=False, compare=False)
+    _center_xyz: tuple[float, float, float] = field(init=False, repr=False, compare=False)
+    _normal_xy: tuple[float, float] = field(init=False, repr=False, compare=False)
+    _inner_coord: float = field(init=False, repr=False, compare=False)
+    _outer_coord: float = field(init=False, repr=False, compare=False)
+    _w_half: float = field(init=False, repr=False, compare=False)
+    _h_half: float = field(init=False, repr=False, compare=False)
+    _z_bottom: float = field(init=False, repr=False, compare=False)
+    _z_top: float = field(init=False, repr=False, compare=False)
+    _corners: np.ndarray = field(init=False, repr=False, compare=False)
+    # Bumped on every change to a public field, so packed copies of this
+    # window (see Config.window_soa) can tell they are stale
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.center = np.asarray(self.center, dtype=np.float64)
+        self._refresh_frame()
+
+    def __setattr__(self, name: str, value) -> None:
+        # object.__setattr__ rather than super(): slots=True rebuilds the class,
+        # which breaks zero-argument super() in its methods
+        object.__setattr__(self, name, value)
+        # Skip while __init__ is still assigning fields; __post_init__ refreshes
+        if not hasattr(self, "_normal"):
+            return
+        if name in _WINDOW_FRAME_FIELDS:
+            self._refresh_frame()
+        elif not name.startswith("_"):
+            object.__setattr__(self, "_generation", self._generation + 1)
+
+    def _refresh_frame(self) -> None:
+        """Recompute the cached frame vectors and bounds from the geometry fields.
+
+        Called automatically when a geometry field is reassigned. Call it
+        directly after modifying ``center`` in place.
+        """
+        # Windows on the same wall share one (normal, h_axis) pair
+        nx, ny, normal, h_axis = _axes_for_azimuth(self.wall_normal_azimuth)
+
+        # Plain floats for the scalar ray tests and for packing, which would
+        # otherwise index the center and normal arrays on every call
+        center_xyz = tuple(self.center.tolist())
+
+        if self.axis == "x":
+            plane_axis = 1
+        elif self.axis == "y":
+            plane_axis = 0
+        else:
+            plane_axis = 1 if abs(center_xyz[1]) < abs(center_xyz[0]) else 0
+        inner_coord = center_xyz[plane_axis]
+
+        # Bypass __setattr__, which would otherwise trigger another refresh
+        set_field = object.__setattr__
+        set_field(self, "_generation", self._generation + 1)
+        set_field(self, "_normal", normal)
+        set_field(self, "_h_axis", h_axis)
+        set_field(self, "_v_axis", _VERTICAL_AXIS)
+        set_field(self, "_plane_axis", plane_axis)
+        # The non-plane horizontal axis, along which local_h is measured
+        set_field(self, "_other_axis", 1 - plane_axis)
+        set_field(self, "_center_xyz", center_xyz)
+        set_field(self, "_normal_xy", (nx, ny))
+        # Tunnel planes: the inner face holds the center, the outer face is
+        # offset by the (non-negative) wall thickness
+        set_field(self, "_inner_coord", inner_coord)
+        set_field(self, "_outer_coord", inner_coord - max(self.wall_thickness, 0.0))
+        w_half = self.width / 2
+        h_half = self.height / 2
+        cx, cy, cz = center_xyz
+        set_field(self, "_w_half", w_half)
+        set_field(self, "_h_half", h_half)
+        set_field(self, "_z_bottom", cz - h_half)
+        set_field(self, "_z_top", cz + h_half)
+
+        # center + sh * (w_half * h_axis) + sv * (h_half * v_axis) per corner,
+        # spelled out in floats: one array per window instead of a handful
+        # of broadcast temporaries, which dominate loading large configs
+        hx, hy, hz = w_half * -ny, w_half * nx, w_half * 0.0
+        v_xy, vz = h_half * 0.0, h_half * 1.0
+        corners = np.array([
+            (cx + sh * hx + sv * v_xy, cy + sh * hy + sv * v_xy, cz + sh * hz + sv * vz)
+            for sh, sv in _CORNER_SIGN_PAIRS
+        ])
+        corners.flags.writeable = False
+        set_field(self, "_corners", corners)
+
     @property
     def normal(self) -> np.ndarray:
-        """Outward-facing normal vector (horizontal, in xy plane)."""
-        az_rad = math.radians(self.wall_normal_azimuth)
-        return np.array([math.sin(az_rad), math.cos(az_rad), 0.0])
+        """Outward-facing normal vector (horizontal, in xy plane). Read-only."""
+        return self._normal
+
+    @property
+    def plane_axis(self) -> int:
+        """Axis (0=x, 1=y) that the window's wall plane is perpendicular to.
+
+        Windows on wall 1 (axis "x") lie in a y=const plane; windows on wall 2
+        (axis "y") lie in an x=const plane. Windows without an explicit axis fall
+        back to comparing their center coordinates.
+        """
+        return self._plane_axis
 
     @property
     def horizontal_axis(self) -> np.ndarray:
         """Horizontal axis along window (perpendicular to normal, in xy plane).
 
         This is the local "right" direction when facing the window from outside.
+        Read-only.
         """
-        n = self.normal
-        return np.array([-n[1], n[0], 0.0])
+        return self._h_axis
 
     @property
     def vertical_axis(self) -> np.ndarray:
-        """Vertical axis (always pointing up)."""
-        return np.array([0.0, 0.0, 1.0])
+        """Vertical axis (always pointing up). Read-only."""
+        return self._v_axis
+
+    @property
+    def half_width(self) -> float:
+        """Half of the window width."""
+        return self._w_half
+
+    @property
+    def half_height(self) -> float:
+        """Half of the window height."""
+        return self._h_half
 
     @property
     def z_bottom(self) -> float:
         """Bottom edge z-coordinate."""
-        return self.center[2] - self.height / 2
+        return self._z_bottom
 
     @property
     def z_top(self) -> float:
         """Top edge z-coordinate."""
-        return self.center[2] + self.height / 2
+        return self._z_top
 
-    def get_corners(self) -> list[np.ndarray]:
+    def get_corners(self, as_list: bool = False) -> np.ndarray | list[np.ndarray]:
         """Get the four corner points of the window.
 
         Returns corners in order: bottom-left, bottom-right, top-right, top-left
         when viewed from outside (looking at normal).
+
+        Args:
+            as_list: Return a list of four points instead of one array.
+
+        Returns:
+            Read-only array of shape (4, 3) with one corner per row, or a
+            list of the rows if as_list is True.
         """
-        h_half = self.width / 2
-        v_half = self.height / 2
-        h_axis = self.horizontal_axis
-        v_axis = self.vertical_axis
+        return list(self._corners) if as_list else self._corners
 
-        return [
-            self.center - h_half * h_axis - v_half * v_axis,  # bottom-left
-            self.center + h_half * h_axis - v_half * v_axis,  # bottom-right
-            self.center + h_half * h_axis + v_half * v_axis,  # top-right
-            self.center - h_half * h_axis + v_half * v_axis,  # top-left
-        ]
+
+# Horizontal and vertical offset signs of the corners returned by Window.get_corners
+_CORNER_SIGN_PAIRS = ((-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0))
+
+@lru_cache(maxsize=256)
+def _axes_for_azimuth(azimuth_deg: float) -> tuple[float, float, np.ndarray, np.ndarray]:
+    """Outward normal and horizontal axis of a wall with the given azimuth.
+
+    Returns (nx, ny, normal, h_axis), the arrays read-only so every window
+    with this azimuth can share them. The trig runs once per distinct
+    azimuth instead of once per window.
+    """
+    # "+ 0.0" maps -0.0 to 0.0, which the cache would treat as the same key
+    az_rad = math.radians(azimuth_deg + 0.0)
+    nx, ny = math.sin(az_rad), math.cos(az_rad)
+    normal = np.array([nx, ny, 0.0])
+    h_axis = np.array([-ny, nx, 0.0])
+    for arr in (normal, h_axis):
+        arr.flags.writeable = False
+    return nx, ny, normal, h_axis
+
+
+# Vertical axis shared by every window (read-only)
+_VERTICAL_AXIS = np.array([0.0, 0.0, 1.0])
+_VERTICAL_AXIS.flags.writeable = False
+
+# Window fields the cached frame in Window._refresh_frame is derived from
+_WINDOW_FRAME_FIELDS = frozenset(
+    {"center", "width", "height", "wall_normal_azimuth", "axis", "wall_thickness"}
+)
 
 
 @dataclass
+class WindowsSoA:
+    """Per-window plane constants packed into dense arrays.
+
+    Built once from a list of windows so the hit test can read contiguous
+    float arrays instead of re-deriving normals and bounds from each Window
+    on every call. Entry i describes windows[i]; order is priority order.
+    Per-window scalars are kept as separate 1-D float64 arrays so kernels
+    read each field with unit stride.
+
+    Attributes:
+        ids: Window IDs.
+        normal_x: x component of the outward wall normal, shape (W,).
+        normal_y: y component of the outward wall normal, shape (W,).
+        normal_z: z component of the outward wall normal, shape (W,).
+        plane_axis: Axis each window plane is perpendicular to (0=x, 1=y), shape (W,).
+        inner_coord: Inner wall plane coordinate along plane_axis, shape (W,).
+        thickness: Wall thickness (0 = thin plane model), shape (W,).
+        center_h: Window center along the wall, shape (W,).
+        center_z: Window center height, shape (W,).
+        half_width: Half of the window width, shape (W,).
+        half_height: Half of the window height, shape (W,).
+        bbox_min: Lower corner of the axis-aligned box spanned by the window
+            opening through the wall, shape (W, 3).
+        bbox_max: Upper corner of that box, shape (W, 3).
+    """
+
+    ids: list[str]
+    normal_x: np.ndarray
+    normal_y: np.ndarray
+    normal_z: np.ndarray
+    plane_axis: np.ndarray
+    inner_coord: np.ndarray
+    thickness: np.ndarray
+    center_h: np.ndarray
+    center_z: np.ndarray
+    half_width: np.ndarray
+    half_height: np.ndarray
+    bbox_min: np.ndarray
+    bbox_max: np.ndarray
+
+    @classmethod
+    def from_windows(cls, windows: list[Window]) -> WindowsSoA:
+        """Pack a list of windows into arrays."""
+        axes = [w.plane_axis for w in windows]
+        # Non-positive thickness means the thin-plane model, as in ray_window_intersection
+        thickness = [max(w.wall_thickness, 0.0) for w in windows]
+        # Normals are cached on each Window, so packing needs no trig. One
+        # transposed copy gives a contiguous row per component.
+        normal_x, normal_y, normal_z = (
+            np.array([w.normal for w in windows], dtype=float).reshape(-1, 3).T.copy()
+        )
+        # Centers as the float tuples each Window caches: indexing them is
+        # much cheaper than indexing the center arrays
+        centers = [w._center_xyz for w in windows]
+        inner_coord = [c[a] for c, a in zip(centers, axes)]
+        center_h = [c[1 - a] for c, a in zip(centers, axes)]
+        bbox_min = np.empty((len(windows), 3), dtype=float)
+        bbox_max = np.empty((len(windows), 3), dtype=float)
+        for i, (w, a, th, inner, h) in enumerate(zip(windows, axes, thickness, inner_coord, center_h)):
+            # Opening spans [inner - thickness, inner] through the wall
+            bbox_min[i, a] = inner - th
+            bbox_max[i, a] = inner
+            bbox_min[i, 1 - a] = h - w.half_width
+            bbox_max[i, 1 - a] = h + w.half_width
+            bbox_min[i, 2] = w.z_bottom
+            bbox_max[i, 2] = w.z_top
+        return cls(
+            ids=[w.id for w in windows],
+            normal_x=normal_x,
+            normal_y=normal_y,
+            normal_z=normal_z,
+            plane_axis=np.array(axes, dtype=np.int64),
+            inner_coord=np.array(inner_coord, dtype=float),
+            thickness=np.array(thickness, dtype=float),
+            center_h=np.array(center_h, dtype=float),
+            center_z=np.array([c[2] for c in centers], dtype=float),
+            half_width=np.array([w.half_width for w in windows], dtype=float),
+            half_height=np.array([w.half_height for w in windows], dtype=float),
+            bbox_min=bbox_min,
+            bbox_max=bbox_max,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass(slots=True)
 class Plant:
     """A vertical cylinder representing a plant.
 
@@ -121,6 +356,19 @@ class Plant:
     z_min: float
     z_max: float
 
+    # Sample points already computed for this plant, keyed on
+    # (n_angular, n_vertical); see hit_test._plant_sample_points
+    _sample_cache: dict[tuple[int, int], np.ndarray] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        # Any geometry change makes the cached sample points stale
+        cache = getattr(self, "_sample_cache", None)
+        if cache and name != "_sample_cache":
+            cache.clear()
+
     @property
     def center_xy(self) -> np.ndarray:
         """2D center point (x, y)."""
@@ -132,7 +380,7 @@ class Plant:
         return self.z_max - self.z_min
 
 
-@dataclass
+@dataclass(slots=True)
 class Wall:
     """A wall definition including visualization metadata."""
 
@@ -141,36 +389,104 @@ class Wall:
     draw_length: float = 15.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HitResult:
     """Result of a sun-plant hit test.
 
     Attributes:
         is_hit: Whether the plant is hit by direct sunlight.
         window_id: ID of the window through which sunlight passes (if hit).
-        hit_points: List of sample points that receive sunlight.
+        hit_points: Sample points that receive sunlight, one per row, shape (K, 3).
+            Iterating it yields the individual points.
         sun_direction: Direction vector toward the sun.
         reason: Explanation if not hit (e.g., "sun_below_horizon").
+        hit_mask: Which of the plant's sample points (in the order of
+            generate_plant_sample_points_array) receive sunlight, shape (N,);
+            hit_points is the masked rows. None when no points were tested.
     """
 
     is_hit: bool
     window_id: Optional[str] = None
-    hit_points: list[np.ndarray] = field(default_factory=list)
+    hit_points: np.ndarray = field(default_factory=lambda: np.empty((0, 3)))
     sun_direction: Optional[np.ndarray] = None
     reason: Optional[str] = None
+    hit_mask: Optional[np.ndarray] = None
 
 
 @dataclass
+class BatchHitResult:
+    """Results of a hit test over many sun positions.
+
+    Entry t of each per-timestamp array refers to the t-th input sun
+    position. Use hit_result() to get the equivalent HitResult for one
+    timestamp.
+
+    Attributes:
+        is_hit: Whether the plant is hit at each timestamp, shape (T,).
+        window_index: Index into window_ids of the reporting window, -1 if
+            not hit, shape (T,).
+        hit_counts: Number of sample points receiving sunlight, shape (T,).
+        point_window: Index of the first window hit by each sample point's
+            ray, -1 if none, shape (T, N).
+        above_horizon: Whether the sun is above the horizon, shape (T,).
+        sun_directions: Sun directions in simplified coordinates, shape (T, 3).
+        sample_points: Plant sample points the rays start from, shape (N, 3).
+        window_ids: Window IDs in priority order.
+    """
+
+    is_hit: np.ndarray
+    window_index: np.ndarray
+    hit_counts: np.ndarray
+    point_window: np.ndarray
+    above_horizon: np.ndarray
+    sun_directions: np.ndarray
+    sample_points: np.ndarray
+    window_ids: list[str]
+
+    def __len__(self) -> int:
+        return len(self.is_hit)
+
+    def hit_result(self, index: int) -> HitResult:
+        """Build the HitResult for a single timestamp."""
+        if not self.above_horizon[index]:
+            return HitResult(is_hit=False, reason="sun_below_horizon")
+        hit_mask = self.point_window[index] >= 0
+        if self.is_hit[index]:
+            return HitResult(
+                is_hit=True,
+                window_id=self.window_ids[self.window_index[index]],
+                hit_points=self.sample_points[hit_mask],
+                sun_direction=self.sun_directions[index],
+                hit_mask=hit_mask,
+            )
+        return HitResult(
+            is_hit=False,
+            sun_direction=self.sun_directions[index],
+            reason="no_window_path",
+            hit_mask=hit_mask,
+        )
+
+
+@dataclass(slots=True)
 class SimulationConfig:
     """Simulation parameters.
 
+    All geometry (window tables, sample points, sun directions) is float64.
+    The inputs are tiny (a few windows, a few dozen points), so float32 would
+    not save meaningful bandwidth, and it would move hits at window edges and
+    for grazing sun angles where the 1e-10 tolerance decides. Batched outputs,
+    which scale with the number of timestamps, use int32 indices.
+
     Attributes:
         sample_points_angular: Number of angular divisions around cylinder.
         sample_points_vertical: Number of vertical divisions on cylinder.
+        use_gpu: Run batched hit tests on the GPU through CuPy. Ignored (CPU
+            path) when CuPy is not installed.
     """
 
     sample_points_angular: int = 8
     sample_points_vertical: int = 3
+    use_gpu: bool = False
 
 
 @dataclass
@@ -194,12 +510,58 @@ class Config:
     location: Optional[Location] = None
     coordinate_system: str = "ENU"
     units: str = "meters"
+    # The windows (held, so their ids stay unique) and generations the
+    # packed table was built from
+    _window_soa: Optional[WindowsSoA] = field(default=None, init=False, repr=False, compare=False)
+    _window_soa_source: tuple[tuple[Window, int], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    @property
+    def window_soa(self) -> WindowsSoA:
+        """Packed window constants for the current windows.
+
+        Rebuilt on access whenever a window was edited, added, removed or
+        replaced since the last build, so it always matches `windows`.
+        """
+        source = self._window_soa_source
+        windows = self.windows
+        if (
+            self._window_soa is None
+            or len(source) != len(windows)
+            or any(w is not old or w._generation != gen for w, (old, gen) in zip(windows, source))
+        ):
+            self.refresh_window_soa()
+        return self._window_soa
+
+    def refresh_window_soa(self) -> None:
+        """Rebuild window_soa now.
+
+        window_soa already rebuilds itself after window edits, so this is
+        only needed to force a rebuild.
+        """
+        self._window_soa = WindowsSoA.from_windows(self.windows)
+        self._window_soa_source = tuple((w, w._generation) for w in self.windows)
 
     @classmethod
     def from_json_file(cls, path: str | Path) -> Config:
-        """Load configuration from a JSON file."""
-        with open(path, "r") as f:
-            data = json.load(f)
+        """Load configuration from a JSON file.
+
+        The parsed JSON is cached per file and reused while the file's
+        modification time and size are unchanged; each call still returns a
+        new Config, so callers may modify it freely.
+        """
+        abs_path = os.path.abspath(path)
+        stat = os.stat(abs_path)
+        key = (abs_path, stat.st_mtime_ns, stat.st_size)
+
+        data = _config_json_cache.get(key)
+        if data is None:
+            with open(abs_path, "r") as f:
+                data = json.load(f)
+            if len(_config_json_cache) >= _CONFIG_JSON_CACHE_SIZE:
+                del _config_json_cache[next(iter(_config_json_cache))]
+            _config_json_cache[key] = data
         return cls.from_dict(data)
 
     @classmethod
@@ -409,6 +771,7 @@ class Config:
         simulation = SimulationConfig(
             sample_points_angular=sim_data.get("sample_points_angular", 8),
             sample_points_vertical=sim_data.get("sample_points_vertical", 3),
+            use_gpu=sim_data.get("use_gpu", False),
         )
 
         # Parse location data
@@ -459,6 +822,7 @@ class Config:
             "simulation": {
                 "sample_points_angular": self.simulation.sample_points_angular,
                 "sample_points_vertical": self.simulation.sample_points_vertical,
+                "use_gpu": self.simulation.use_gpu,
             },
         }
 
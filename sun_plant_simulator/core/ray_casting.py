@@ -4,15 +4,22 @@ This module provides functions to determine if a ray (representing sunlight
 traveling from the sun toward a point on the plant) passes through a window.
 """
 
+import math
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional, Sequence, Union
 
 import numpy as np
 
-from .models import Window
+from ._backend import loaded_kernels
+from .models import Window, WindowsSoA
 
+# Scalar ray functions accept any 3-sequence (tuple or ndarray) for points
+# and directions, so callers need not build an array per ray.
+Vector3 = Union[np.ndarray, Sequence[float]]
 
-@dataclass
+
+@dataclass(slots=True)
 class RayIntersection:
     """Result of a ray-window intersection test.
 
@@ -31,9 +38,157 @@ class RayIntersection:
     local_v: Optional[float] = None
 
 
+@dataclass
+class RayIntersections:
+    """Batched RayIntersection for many ray origins and one direction.
+
+    Entry i holds what ray_window_intersection returns for origin i; fields
+    of rays without an intersection point (has_point False) are undefined.
+
+    Attributes:
+        intersects: Whether each ray passes through the window, shape (N,).
+        has_point: Whether an intersection point was computed, shape (N,).
+        points: Intersection points, shape (N, 3).
+        t: Ray parameters of the intersections, shape (N,).
+        local_h: Horizontal positions on the window, shape (N,).
+        local_v: Vertical positions on the window, shape (N,).
+    """
+
+    intersects: np.ndarray
+    has_point: np.ndarray
+    points: np.ndarray
+    t: np.ndarray
+    local_h: np.ndarray
+    local_v: np.ndarray
+
+
+def _as_floats(vector: Vector3) -> Sequence[float]:
+    """Return a 3-vector as plain Python floats for the scalar ray path.
+
+    Indexing an ndarray yields NumPy scalars, whose arithmetic is several
+    times slower than on floats; the values (and so the results) are the same.
+    """
+    if isinstance(vector, np.ndarray):
+        return vector.tolist()
+    return vector
+
+
+def _plane_offsets(
+    origin: Sequence[float],
+    direction: Sequence[float],
+    window: Window,
+    plane_coord: float,
+    epsilon: float,
+) -> Optional[tuple[float, float, float]]:
+    """Intersect a ray with one of a window's axis-aligned planes.
+
+    Reads the plane axis and center the window caches as plain values, so
+    no per-call axis resolution is needed.
+
+    Args:
+        origin: Ray origin as three floats.
+        direction: Ray direction as three floats.
+        window: The window whose plane and center are used.
+        plane_coord: Coordinate of the plane on the window's plane axis.
+        epsilon: Small value for numerical comparisons.
+
+    Returns:
+        Tuple of (t, local_h, local_v), or None if the ray is parallel to the
+        plane or the plane is behind the ray origin.
+    """
+    plane_axis = window._plane_axis
+    d_axis = direction[plane_axis]
+    if abs(d_axis) < epsilon:
+        return None
+
+    t = (plane_coord - origin[plane_axis]) / d_axis
+    if t < 0:
+        return None
+
+    # For wall 1 (plane_axis=1, y=const): offsets along x and z
+    # For wall 2 (plane_axis=0, x=const): offsets along y and z
+    h = window._other_axis
+    center = window._center_xyz
+    local_h = origin[h] + t * direction[h] - center[h]
+    local_v = origin[2] + t * direction[2] - center[2]
+    return t, local_h, local_v
+
+
+def _plane_offsets_within(
+    offsets: Optional[tuple[float, float, float]],
+    window: Window,
+    epsilon: float,
+) -> bool:
+    """Whether _plane_offsets found a point inside the window rectangle."""
+    if offsets is None:
+        return False
+    _, local_h, local_v = offsets
+    return (
+        abs(local_h) <= window._w_half + epsilon
+        and abs(local_v) <= window._h_half + epsilon
+    )
+
+
+def _ray_within_window_plane(
+    origin: Sequence[float],
+    direction: Sequence[float],
+    window: Window,
+    plane_coord: float,
+    epsilon: float,
+) -> bool:
+    """Bool-only plane test for a ray already known not to be parallel to it.
+
+    Same arithmetic as _plane_offsets + _plane_offsets_within, but the
+    vertical offset is checked first and a miss returns before the
+    horizontal offset is computed. t gets its own division per plane
+    (rather than the outer t being derived from the inner one) so it
+    rounds exactly like the batched and compiled tunnel tests.
+    """
+    plane_axis = window._plane_axis
+    t = (plane_coord - origin[plane_axis]) / direction[plane_axis]
+    if t < 0:
+        return False
+    center = window._center_xyz
+    # "not <=" rather than ">" so a NaN offset is rejected, as in the
+    # combined check
+    if not abs(origin[2] + t * direction[2] - center[2]) <= window._h_half + epsilon:
+        return False
+    h = window._other_axis
+    return abs(origin[h] + t * direction[h] - center[h]) <= window._w_half + epsilon
+
+
+def _sun_outside_wall(direction: Sequence[float], window: Window) -> bool:
+    """Whether the ray direction points to the outside of the window's wall.
+
+    The sun direction points toward the sun; dot with outward normal should
+    be > 0. Spelled out (the normal is horizontal) to round like
+    rays_intersect_window.
+    """
+    nx, ny = window._normal_xy
+    return direction[0] * nx + direction[1] * ny > 0
+
+
+def _intersection_result(
+    origin: Sequence[float],
+    direction: Sequence[float],
+    offsets: tuple[float, float, float],
+    intersects: bool,
+) -> RayIntersection:
+    """Build a RayIntersection, materializing the point only here."""
+    t, local_h, local_v = offsets
+    point = np.array([
+        origin[0] + t * direction[0],
+        origin[1] + t * direction[1],
+        origin[2] + t * direction[2],
+    ])
+    return RayIntersection(
+        intersects=intersects, point=point, t=t, local_h=local_h, local_v=local_v
+    )
+
+
 def ray_intersects_window(
-    ray_origin: np.ndarray,
-    ray_direction: np.ndarray,
+    ray_origin: Vector3,
+    ray_direction: Vector3,
     window: Window,
     epsilon: float = 1e-10,
 ) -> bool:
@@ -45,6 +200,9 @@ def ray_intersects_window(
     2. The intersection must be within the window's rectangular bounds
     3. The ray must be going outward (toward the sun, not into the room)
 
+    Same rules as ray_window_intersection, without building the
+    intersection point.
+
     Args:
         ray_origin: Starting point of the ray (point on plant).
         ray_direction: Direction of the ray (toward the sun), should be unit vector.
@@ -54,80 +212,25 @@ def ray_intersects_window(
     Returns:
         True if the ray passes through the window, False otherwise.
     """
-    result = ray_window_intersection(ray_origin, ray_direction, window, epsilon)
-    return result.intersects
-
-
-def _intersect_axis_aligned_plane(
-    ray_origin: np.ndarray,
-    ray_direction: np.ndarray,
-    plane_axis: int,
-    plane_coord: float,
-    window: Window,
-    epsilon: float = 1e-10,
-) -> RayIntersection:
-    """Intersect ray with an axis-aligned plane and check window bounds.
-
-    Args:
-        ray_origin: Starting point of the ray.
-        ray_direction: Direction of the ray (should be normalized).
-        plane_axis: Which axis the plane is perpendicular to (0=x, 1=y).
-        plane_coord: Coordinate of the plane on the given axis.
-        window: The window to check bounds against.
-        epsilon: Small value for numerical comparisons.
-
-    Returns:
-        RayIntersection with details about the intersection.
-    """
-    # Check if ray is parallel to plane
-    if abs(ray_direction[plane_axis]) < epsilon:
-        return RayIntersection(intersects=False)
-
-    # Compute t: distance along ray to plane intersection
-    t = (plane_coord - ray_origin[plane_axis]) / ray_direction[plane_axis]
+    direction = _as_floats(ray_direction)
+    if not _sun_outside_wall(direction, window):
+        return False
 
-    # Check if intersection is in front of ray origin (t > 0)
-    if t < 0:
-        return RayIntersection(intersects=False)
+    if abs(direction[window._plane_axis]) < epsilon:
+        # Parallel to the wall
+        return False
 
-    # Compute intersection point
-    intersection = ray_origin + t * ray_direction
-
-    # Check if within window bounds
-    # For wall 1 (plane_axis=1, y=const): check x and z
-    # For wall 2 (plane_axis=0, x=const): check y and z
-    if plane_axis == 1:  # Wall 1
-        local_h = intersection[0] - window.center[0]  # x offset
-    else:  # Wall 2
-        local_h = intersection[1] - window.center[1]  # y offset
-
-    local_v = intersection[2] - window.center[2]  # z offset
-
-    # Check if within window bounds
-    within_h = abs(local_h) <= window.width / 2 + epsilon
-    within_v = abs(local_v) <= window.height / 2 + epsilon
-
-    if within_h and within_v:
-        return RayIntersection(
-            intersects=True,
-            point=intersection,
-            t=t,
-            local_h=local_h,
-            local_v=local_v,
-        )
-    else:
-        return RayIntersection(
-            intersects=False,
-            point=intersection,
-            t=t,
-            local_h=local_h,
-            local_v=local_v,
-        )
+    origin = _as_floats(ray_origin)
+    if not _ray_within_window_plane(origin, direction, window, window._inner_coord, epsilon):
+        return False
+    if window.wall_thickness <= 0:
+        return True
+    return _ray_within_window_plane(origin, direction, window, window._outer_coord, epsilon)
 
 
 def ray_window_intersection(
-    ray_origin: np.ndarray,
-    ray_direction: np.ndarray,
+    ray_origin: Vector3,
+    ray_direction: Vector3,
     window: Window,
     epsilon: float = 1e-10,
 ) -> RayIntersection:
@@ -155,80 +258,543 @@ def ray_window_intersection(
     Returns:
         RayIntersection with details about the intersection.
     """
-    wall_normal = window.normal  # Direction wall faces (for sun angle check)
+    origin = _as_floats(ray_origin)
+    direction = _as_floats(ray_direction)
 
     # Check if sun is on the correct side of the wall (outside the room)
-    # The sun direction points toward the sun; dot with outward normal should be > 0
-    sun_side_check = np.dot(ray_direction, wall_normal)
-    if sun_side_check <= 0:
+    if not _sun_outside_wall(direction, window):
         # Sun is on the inside of the wall or parallel - can't shine through
         return RayIntersection(intersects=False)
 
-    # Determine plane properties based on window axis (simplified axis-aligned geometry)
-    if window.axis == "x":
-        plane_axis = 1
-    elif window.axis == "y":
-        plane_axis = 0
-    else:
-        is_wall1 = abs(window.center[1]) < abs(window.center[0])
-        plane_axis = 1 if is_wall1 else 0
-
-    # Inner plane coordinate (where window.center is located)
-    inner_plane_coord = window.center[plane_axis]
+    # Inner plane: where window.center is located (cached on the window,
+    # together with the plane axis and the outer plane)
+    inner = _plane_offsets(origin, direction, window, window._inner_coord, epsilon)
+    if inner is None:
+        return RayIntersection(intersects=False)
+    inner_within = _plane_offsets_within(inner, window, epsilon)
 
     # If wall has no thickness, use simple single-plane intersection
     if window.wall_thickness <= 0:
-        return _intersect_axis_aligned_plane(
-            ray_origin, ray_direction, plane_axis, inner_plane_coord, window, epsilon
-        )
+        return _intersection_result(origin, direction, inner, inner_within)
 
-    # Wall has thickness - model as tunnel (two planes)
-    # The outward normal determines which direction is "outside"
-    # For wall 1 (y=0): normal points outward (-Y direction in simplified coords)
-    # For wall 2 (x=0): normal points outward (-X direction in simplified coords)
-    # Outer plane is offset in the outward normal direction
-
-    # In the simplified coordinate system:
+    # Wall has thickness - model as tunnel (two planes). In the simplified
+    # coordinate system the outer plane is offset in the outward normal
+    # direction:
     # - Wall 1: inner at y=0, outer at y=-thickness (outside is -Y)
     # - Wall 2: inner at x=0, outer at x=-thickness (outside is -X)
-    outer_plane_coord = inner_plane_coord - window.wall_thickness
-
-    # Test inner plane intersection
-    inner_result = _intersect_axis_aligned_plane(
-        ray_origin, ray_direction, plane_axis, inner_plane_coord, window, epsilon
-    )
-
-    # Test outer plane intersection
-    outer_result = _intersect_axis_aligned_plane(
-        ray_origin, ray_direction, plane_axis, outer_plane_coord, window, epsilon
-    )
-
-    # Both must intersect within window bounds for light to pass through tunnel
-    if inner_result.intersects and outer_result.intersects:
-        # Return the inner intersection (where light enters room)
-        return inner_result
-    else:
-        # At least one intersection failed - light blocked by wall thickness
+    # Both must intersect within window bounds for light to pass through
+    # the tunnel; the outer plane needs no intersection point.
+    if not inner_within or not _ray_within_window_plane(
+        origin, direction, window, window._outer_coord, epsilon
+    ):
+        # Light blocked by wall thickness
         return RayIntersection(intersects=False)
 
+    # Return the inner intersection (where light enters room)
+    return _intersection_result(origin, direction, inner, True)
+
 
 def ray_hits_any_window(
-    ray_origin: np.ndarray,
-    ray_direction: np.ndarray,
-    windows: list[Window],
+    ray_origin: Vector3,
+    ray_direction: Vector3,
+    windows: Union[list[Window], WindowsSoA],
 ) -> tuple[bool, Optional[str]]:
     """Check if a ray passes through any of the provided windows.
 
+    Given a packed WindowsSoA (e.g. config.window_soa), all windows are
+    tested in one broadcast instead of one Python call per window.
+
     Args:
         ray_origin: Starting point of the ray.
         ray_direction: Direction of the ray.
-        windows: List of windows to test.
+        windows: Windows to test, as a list or a packed window table.
 
     Returns:
         Tuple of (hit_any, window_id) where window_id is the ID of the first
         window hit (or None if no hit).
     """
+    if isinstance(windows, WindowsSoA):
+        hit, window_index = rays_hit_any_window(ray_origin, ray_direction, windows)
+        if not hit[0]:
+            return False, None
+        return True, windows.ids[window_index[0]]
+
+    # Convert once for the whole loop; the per-window test returns a plain
+    # bool and builds no RayIntersection
+    origin = _as_floats(ray_origin)
+    direction = _as_floats(ray_direction)
     for window in windows:
-        if ray_intersects_window(ray_origin, ray_direction, window):
+        if ray_intersects_window(origin, direction, window):
             return True, window.id
     return False, None
+
+
+def _float_literal(value: float) -> str:
+    """Source text that evaluates to exactly `value` (repr round-trips floats)."""
+    value = float(value)
+    if math.isfinite(value):
+        return repr(value)
+    return f"float({str(value)!r})"
+
+
+@lru_cache(maxsize=64)
+def _compile_ray_hits_any_window(
+    constants: tuple[tuple, ...],
+    epsilon: float,
+) -> Callable[[Vector3, Vector3], tuple[bool, Optional[str]]]:
+    """Generate and exec the straight-line test for one set of window constants.
+
+    Each entry of `constants` is (id, normal_x, normal_y, plane_axis,
+    inner_coord, thickness, center_h, center_z, half_width, half_height).
+    """
+    names = ("o0", "o1", "o2")
+    dirs = ("d0", "d1", "d2")
+    eps = _float_literal(epsilon)
+    lines = [
+        "def ray_hits_any_window(ray_origin, ray_direction):",
+        "    o0, o1, o2 = _as_floats(ray_origin)",
+        "    d0, d1, d2 = _as_floats(ray_direction)",
+    ]
+    for index, (window_id, nx, ny, axis, inner, thickness, center_h, center_z,
+                half_w, half_h) in enumerate(constants):
+        o_axis, d_axis = names[axis], dirs[axis]
+        o_h, d_h = names[1 - axis], dirs[1 - axis]
+        # Bounds are compared against half + epsilon, folded into one literal
+        # with the same rounding as the generic test
+        bound_h = _float_literal(half_w + epsilon)
+        bound_v = _float_literal(half_h + epsilon)
+        planes = [inner] if thickness <= 0 else [inner, inner - thickness]
+
+        lines.append(f"    # {window_id!r}")
+        lines.append(
+            f"    if d0 * {_float_literal(nx)} + d1 * {_float_literal(ny)} > 0"
+            f" and abs({d_axis}) >= {eps}:"
+        )
+        indent = "        "
+        for plane in planes:
+            lines.append(f"{indent}t = ({_float_literal(plane)} - {o_axis}) / {d_axis}")
+            # Vertical bound first, as in _ray_within_window_plane
+            lines.append(
+                f"{indent}if (t >= 0"
+                f" and abs(o2 + t * d2 - {_float_literal(center_z)}) <= {bound_v}"
+                f" and abs({o_h} + t * {d_h} - {_float_literal(center_h)}) <= {bound_h}):"
+            )
+            indent += "    "
+        lines.append(f"{indent}return True, _IDS[{index}]")
+    lines.append("    return False, None")
+
+    namespace = {"_as_floats": _as_floats, "_IDS": tuple(c[0] for c in constants)}
+    exec(compile("\n".join(lines), "<specialized ray_hits_any_window>", "exec"), namespace)
+    return namespace["ray_hits_any_window"]
+
+
+def specialize_ray_hits_any_window(
+    windows: WindowsSoA,
+    epsilon: float = 1e-10,
+) -> Callable[[Vector3, Vector3], tuple[bool, Optional[str]]]:
+    """Build a ray_hits_any_window specialized for one packed window table.
+
+    The per-window loop is unrolled into generated Python source with every
+    window constant (normals, plane coordinates, bounds) written in as a
+    literal, so a call does no attribute lookups or array indexing. Meant
+    for loops that test many single rays against the same room; the
+    arithmetic is that of ray_intersects_window, so results are identical.
+
+    Functions are cached by the window constants, so rebuilding for an
+    unchanged table (e.g. after Config.refresh_window_soa) reuses the
+    compiled function.
+
+    Args:
+        windows: Packed window table (e.g. config.window_soa).
+        epsilon: Small value for numerical comparisons.
+
+    Returns:
+        Function (ray_origin, ray_direction) -> (hit_any, window_id) with
+        the same results as ray_hits_any_window(ray_origin, ray_direction,
+        windows).
+    """
+    constants = tuple(zip(
+        windows.ids,
+        windows.normal_x.tolist(),
+        windows.normal_y.tolist(),
+        windows.plane_axis.tolist(),
+        windows.inner_coord.tolist(),
+        windows.thickness.tolist(),
+        windows.center_h.tolist(),
+        windows.center_z.tolist(),
+        windows.half_width.tolist(),
+        windows.half_height.tolist(),
+    ))
+    return _compile_ray_hits_any_window(constants, float(epsilon))
+
+
+def _rays_within_plane_bounds(
+    ray_origins: np.ndarray,
+    ray_directions: np.ndarray,
+    plane_axis: int,
+    plane_coord: float,
+    center_h: float,
+    center_z: float,
+    half_width: float,
+    half_height: float,
+    epsilon: float,
+) -> np.ndarray:
+    """Vectorized counterpart of _plane_offsets + _plane_offsets_within for many rays.
+
+    ray_origins has shape (N, 3); ray_directions has shape (3,) or (T, 3).
+    Returns a boolean mask of shape (N,) or (T, N) marking rays that reach the
+    plane in front of their origin and land inside the window rectangle.
+    """
+    other_axis = 1 - plane_axis
+    d_axis = ray_directions[..., plane_axis, None]
+    d_other = ray_directions[..., other_axis, None]
+    d_z = ray_directions[..., 2, None]
+
+    # Rays parallel to the plane give inf/nan here; they are masked out below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (plane_coord - ray_origins[:, plane_axis]) / d_axis
+        local_h = ray_origins[:, other_axis] + t * d_other - center_h
+        local_v = ray_origins[:, 2] + t * d_z - center_z
+
+    return (
+        (np.abs(d_axis) >= epsilon)
+        & (t >= 0)
+        & (np.abs(local_h) <= half_width + epsilon)
+        & (np.abs(local_v) <= half_height + epsilon)
+    )
+
+
+def _windows_facing_sun(ray_directions: np.ndarray, windows: WindowsSoA) -> np.ndarray:
+    """Sun-side test for every window: is the sun outside that window's wall?
+
+    Uses the same spelled-out product as _rays_through_window_soa, so a
+    window rejected here would also fail the exact test.
+
+    Returns a boolean array of shape (W,) for a single direction (3,) or
+    (T, W) for directions of shape (T, 3).
+    """
+    return (
+        ray_directions[..., 0, None] * windows.normal_x
+        + ray_directions[..., 1, None] * windows.normal_y
+    ) > 0
+
+
+def _windows_reachable(
+    ray_origins: np.ndarray,
+    ray_directions: np.ndarray,
+    windows: WindowsSoA,
+    margin: float = 1e-6,
+) -> np.ndarray:
+    """Conservative slab test: can any of the rays reach each window's box?
+
+    Sweeps the bounding box of all ray origins along each direction and
+    checks it against each window's bbox (grown by `margin`) with the
+    standard slab test. False means no ray can pass through that
+    window, so the exact per-ray test can be skipped for it.
+
+    Returns a boolean array of shape (W,) for a single direction (3,) or
+    (T, W) for directions of shape (T, 3).
+    """
+    if len(ray_origins) == 0:
+        return np.zeros(ray_directions.shape[:-1] + (len(windows),), dtype=bool)
+
+    # Offsets from the origin box to the window box, per window and axis
+    lo = windows.bbox_min - margin - ray_origins.max(axis=0)
+    hi = windows.bbox_max + margin - ray_origins.min(axis=0)
+
+    d = ray_directions[..., None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_lo = lo / d
+        t_hi = hi / d
+
+    # Axis with no motion: either always overlapping or never
+    overlaps = (lo <= 0) & (hi >= 0)
+    t_enter = np.where(d > 0, t_lo, np.where(d < 0, t_hi, np.where(overlaps, -np.inf, np.inf)))
+    t_exit = np.where(d > 0, t_hi, np.where(d < 0, t_lo, np.where(overlaps, np.inf, -np.inf)))
+
+    return np.maximum(t_enter.max(axis=-1), 0.0) <= t_exit.min(axis=-1)
+
+
+def _rays_through_window_soa(
+    ray_origins: np.ndarray,
+    ray_direction: np.ndarray,
+    windows: WindowsSoA,
+    index: int,
+    epsilon: float = 1e-10,
+) -> np.ndarray:
+    """Batched tunnel test against row `index` of a packed window table.
+
+    Takes float arrays as returned by np.asarray; see rays_intersect_window.
+    """
+    # Sun must be on the outside of the wall. The dot product is spelled out
+    # (the normal is horizontal) so single and batched directions round the
+    # same way; BLAS-backed products can disagree in the last bit when the
+    # sun grazes the wall.
+    sun_side_check = (
+        ray_direction[..., 0] * windows.normal_x[index]
+        + ray_direction[..., 1] * windows.normal_y[index]
+    )
+    sun_side = (sun_side_check > 0)[..., None]
+
+    plane_axis = int(windows.plane_axis[index])
+    inner_plane_coord = windows.inner_coord[index]
+    thickness = windows.thickness[index]
+    bounds = (
+        windows.center_h[index],
+        windows.center_z[index],
+        windows.half_width[index],
+        windows.half_height[index],
+    )
+
+    mask = sun_side & _rays_within_plane_bounds(
+        ray_origins, ray_direction, plane_axis, inner_plane_coord, *bounds, epsilon
+    )
+
+    if thickness > 0:
+        outer_plane_coord = inner_plane_coord - thickness
+        mask &= _rays_within_plane_bounds(
+            ray_origins, ray_direction, plane_axis, outer_plane_coord, *bounds, epsilon
+        )
+
+    return mask
+
+
+def _rays_through_windows_soa(
+    ray_origins: np.ndarray,
+    ray_direction: np.ndarray,
+    windows: WindowsSoA,
+    indices: np.ndarray,
+    epsilon: float = 1e-10,
+) -> np.ndarray:
+    """Tunnel test of every ray against several rows of a packed window table.
+
+    Same arithmetic as _rays_through_window_soa, broadcast as (N, 1) origins
+    against (1, K) windows so no Python loop runs over the windows.
+
+    Args:
+        ray_origins: Array of shape (N, 3) with one ray origin per row.
+        ray_direction: Direction toward the sun shared by all rays, shape
+            (3,), or one direction per ray, shape (N, 3).
+        windows: Packed window table.
+        indices: Integer array of K window rows to test, in priority order.
+        epsilon: Small value for numerical comparisons.
+
+    Returns:
+        Boolean array of shape (N, K); column k refers to windows[indices[k]].
+    """
+    plane_axis = windows.plane_axis[indices]
+    other_axis = 1 - plane_axis
+    inner = windows.inner_coord[indices]
+    center_h = windows.center_h[indices]
+    center_z = windows.center_z[indices]
+    # Bounds with the tolerance folded in once, shared by both planes
+    bound_h = windows.half_width[indices] + epsilon
+    bound_v = windows.half_height[indices] + epsilon
+
+    # Direction terms have shape (K,) for a shared direction, (N, K) per ray
+    sun_side = (
+        ray_direction[..., 0, None] * windows.normal_x[indices]
+        + ray_direction[..., 1, None] * windows.normal_y[indices]
+    ) > 0
+    d_axis = ray_direction[..., plane_axis]
+    d_other = ray_direction[..., other_axis]
+    d_z = ray_direction[..., 2, None]
+    o_axis = ray_origins[:, plane_axis]
+    o_other = ray_origins[:, other_axis]
+    o_z = ray_origins[:, 2, None]
+
+    mask = sun_side & (np.abs(d_axis) >= epsilon)
+    # A thin wall (thickness 0) puts the outer plane on the inner one, which
+    # would repeat the same test, so it is skipped when no window is thick
+    thickness = windows.thickness[indices]
+    planes = (inner, inner - thickness) if np.any(thickness > 0) else (inner,)
+    for plane_coord in planes:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (plane_coord - o_axis) / d_axis
+            local_h = o_other + t * d_other - center_h
+            local_v = o_z + t * d_z - center_z
+        mask = (
+            mask
+            & (t >= 0)
+            & (np.abs(local_h) <= bound_h)
+            & (np.abs(local_v) <= bound_v)
+        )
+    return mask
+
+
+def rays_hit_any_window(
+    ray_origins: np.ndarray,
+    ray_directions: np.ndarray,
+    windows: WindowsSoA,
+    epsilon: float = 1e-10,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Check many rays against all windows of a packed table at once.
+
+    Batched version of ray_hits_any_window: windows the sun is behind are
+    dropped first, then the (R, K) intersection mask of the remaining K
+    windows is computed in one broadcast and reduced to the first window
+    per ray.
+    Once the optional Numba kernels are loaded, a compiled loop that stops
+    at each ray's first window is used instead, with identical results.
+
+    Args:
+        ray_origins: Array of shape (R, 3) with one ray origin per row.
+        ray_directions: Direction shared by all rays, shape (3,), or one
+            direction per ray, shape (R, 3).
+        windows: Packed window table (e.g. config.window_soa).
+        epsilon: Small value for numerical comparisons.
+
+    Returns:
+        Tuple (hit, window_index) of arrays with shape (R,). window_index is
+        the row in `windows` of the first window each ray passes through,
+        or -1 where hit is False.
+
+    Raises:
+        ValueError: If per-ray directions do not match the number of origins.
+    """
+    ray_origins = np.asarray(ray_origins, dtype=float).reshape(-1, 3)
+    ray_directions = np.asarray(ray_directions, dtype=float)
+    if ray_directions.ndim == 2 and len(ray_directions) != len(ray_origins):
+        raise ValueError(
+            f"Got {len(ray_directions)} ray directions for {len(ray_origins)} origins"
+        )
+
+    kernels = loaded_kernels() if len(windows) else None
+    if kernels is not None:
+        window_args = kernels.kernel_window_args(windows)
+        if ray_directions.ndim == 1:
+            window_index = kernels._rays_hit_any_window(
+                ray_origins, ray_directions, *window_args, epsilon
+            )
+        else:
+            window_index = kernels._rays_hit_any_window_per_ray(
+                ray_origins, ray_directions, *window_args, epsilon
+            )
+        return window_index >= 0, window_index
+
+    # Sun-side pre-filter: one product per window (per ray for per-ray
+    # directions) drops walls the sun is behind before any plane test
+    facing = _windows_facing_sun(ray_directions, windows)
+    candidates = np.flatnonzero(facing if facing.ndim == 1 else facing.any(axis=0))
+
+    window_index = np.full(len(ray_origins), -1, dtype=np.int32)
+    if len(candidates):
+        mask = _rays_through_windows_soa(
+            ray_origins, ray_directions, windows, candidates, epsilon
+        )
+        hit = mask.any(axis=1)
+        window_index[hit] = candidates[mask[hit].argmax(axis=1)]
+    return window_index >= 0, window_index
+
+
+def rays_intersect_window(
+    ray_origins: np.ndarray,
+    ray_direction: np.ndarray,
+    window: Window,
+    epsilon: float = 1e-10,
+) -> np.ndarray:
+    """Check which of many rays pass through a window.
+
+    Batched version of ray_intersects_window. Every origin is tested against
+    every direction, which covers both a single sun position for all sample
+    points on the plant and a whole series of sun positions at once.
+
+    Args:
+        ray_origins: Array of shape (N, 3) with one ray origin per row.
+        ray_direction: Direction toward the sun, shape (3,), or one direction
+            per timestamp, shape (T, 3).
+        window: The window to test against.
+        epsilon: Small value for numerical comparisons.
+
+    Returns:
+        Boolean array of shape (N,) for a single direction or (T, N) for many,
+        True where the ray passes through the window.
+    """
+    return _rays_through_window_soa(
+        np.asarray(ray_origins, dtype=float),
+        np.asarray(ray_direction, dtype=float),
+        WindowsSoA.from_windows([window]),
+        0,
+        epsilon,
+    )
+
+
+def _plane_intersections(
+    ray_origins: np.ndarray,
+    ray_direction: np.ndarray,
+    plane_axis: int,
+    plane_coord: float,
+    window: Window,
+    epsilon: float,
+) -> RayIntersections:
+    """Batched _plane_offsets with its bounds check, for one direction."""
+    other_axis = 1 - plane_axis
+    d_axis = ray_direction[plane_axis]
+    n = len(ray_origins)
+
+    if abs(d_axis) < epsilon:
+        no_point = np.zeros(n, dtype=bool)
+        nan = np.full(n, np.nan)
+        return RayIntersections(no_point, no_point, np.full((n, 3), np.nan), nan, nan, nan)
+
+    t = (plane_coord - ray_origins[:, plane_axis]) / d_axis
+    points = ray_origins + t[:, None] * ray_direction
+    local_h = points[:, other_axis] - window._center_xyz[other_axis]
+    local_v = points[:, 2] - window._center_xyz[2]
+
+    has_point = t >= 0
+    intersects = (
+        has_point
+        & (np.abs(local_h) <= window.half_width + epsilon)
+        & (np.abs(local_v) <= window.half_height + epsilon)
+    )
+    return RayIntersections(intersects, has_point, points, t, local_h, local_v)
+
+
+def rays_window_intersection(
+    ray_origins: np.ndarray,
+    ray_direction: np.ndarray,
+    window: Window,
+    epsilon: float = 1e-10,
+) -> RayIntersections:
+    """Compute detailed ray-window intersections for many rays at once.
+
+    Batched version of ray_window_intersection with the same rules: a thick
+    wall only reports a point when the ray clears both tunnel planes.
+
+    Args:
+        ray_origins: Array of shape (N, 3) with one ray origin per row.
+        ray_direction: Direction toward the sun, shape (3,).
+        window: The window to test against.
+        epsilon: Small value for numerical comparisons.
+
+    Returns:
+        RayIntersections with per-ray details.
+    """
+    ray_origins = np.asarray(ray_origins, dtype=float)
+    ray_direction = np.asarray(ray_direction, dtype=float)
+    n = len(ray_origins)
+
+    wall_normal = window.normal
+    sun_side_check = ray_direction[0] * wall_normal[0] + ray_direction[1] * wall_normal[1]
+    if sun_side_check <= 0:
+        no_point = np.zeros(n, dtype=bool)
+        nan = np.full(n, np.nan)
+        return RayIntersections(no_point, no_point, np.full((n, 3), np.nan), nan, nan, nan)
+
+    plane_axis = window.plane_axis
+    inner_plane_coord = window._inner_coord
+    inner = _plane_intersections(
+        ray_origins, ray_direction, plane_axis, inner_plane_coord, window, epsilon
+    )
+
+    if window.wall_thickness <= 0:
+        return inner
+
+    outer = _plane_intersections(
+        ray_origins, ray_direction, plane_axis, inner_plane_coord - window.wall_thickness,
+        window, epsilon,
+    )
+    # Only rays through both planes keep their (inner) intersection details
+    both = inner.intersects & outer.intersects
+    return RayIntersections(both, both, inner.points, inner.t, inner.local_h, inner.local_v)
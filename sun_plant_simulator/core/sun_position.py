@@ -4,14 +4,22 @@ This module calculates the sun's azimuth and elevation for a given
 latitude, longitude, date, and time using standard solar position algorithms.
 """
 
+import calendar
 import math
+from bisect import bisect_left
 from dataclasses import dataclass
-from datetime import datetime, date, timedelta
-from typing import Optional
+from datetime import datetime, date
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import numpy as np
+from numpy.typing import ArrayLike
 
-@dataclass
+from ._backend import loaded_kernels
+
+
+@dataclass(slots=True)
 class SunPosition:
     """Sun position at a specific time.
 
@@ -25,7 +33,7 @@ class SunPosition:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Geographic location.
 
@@ -51,61 +59,76 @@ class Location:
         )
 
 
-def calculate_sun_position(
-    latitude: float,
-    longitude: float,
-    dt: datetime,
-    timezone_offset: float = 0.0,
-) -> SunPosition:
-    """Calculate sun position for a given location and time.
-
-    Uses the NOAA solar position algorithm (simplified version).
-
-    Args:
-        latitude: Latitude in degrees (positive = North).
-        longitude: Longitude in degrees (negative = West).
-        dt: Local datetime.
-        timezone_offset: Hours offset from UTC.
+def _gamma_series(sin_g, cos_g):
+    """Equation of time (minutes) and declination (radians) from sin/cos of gamma.
 
-    Returns:
-        SunPosition with azimuth and elevation.
+    The harmonics of 2 and 3 gamma come from the double- and triple-angle
+    identities, so only one sin/cos pair is evaluated. Plain arithmetic, so
+    it works on floats and NumPy arrays alike.
     """
-    # Convert to radians
-    lat_rad = math.radians(latitude)
-
-    # Day of year (1-366)
-    day_of_year = dt.timetuple().tm_yday
-
-    # Fractional year (radians)
-    # For non-leap year
-    days_in_year = 366 if _is_leap_year(dt.year) else 365
-    gamma = 2 * math.pi / days_in_year * (day_of_year - 1 + (dt.hour - 12) / 24)
+    sin_2g = 2 * sin_g * cos_g
+    cos_2g = cos_g * cos_g - sin_g * sin_g
+    sin_3g = sin_g * (3 - 4 * sin_g * sin_g)
+    cos_3g = cos_g * (4 * cos_g * cos_g - 3)
 
     # Equation of time (minutes)
     eqtime = 229.18 * (
         0.000075
-        + 0.001868 * math.cos(gamma)
-        - 0.032077 * math.sin(gamma)
-        - 0.014615 * math.cos(2 * gamma)
-        - 0.040849 * math.sin(2 * gamma)
+        + 0.001868 * cos_g
+        - 0.032077 * sin_g
+        - 0.014615 * cos_2g
+        - 0.040849 * sin_2g
     )
 
     # Solar declination (radians)
     decl = (
         0.006918
-        - 0.399912 * math.cos(gamma)
-        + 0.070257 * math.sin(gamma)
-        - 0.006758 * math.cos(2 * gamma)
-        + 0.000907 * math.sin(2 * gamma)
-        - 0.002697 * math.cos(3 * gamma)
-        + 0.00148 * math.sin(3 * gamma)
+        - 0.399912 * cos_g
+        + 0.070257 * sin_g
+        - 0.006758 * cos_2g
+        + 0.000907 * sin_2g
+        - 0.002697 * cos_3g
+        + 0.00148 * sin_3g
     )
+    return eqtime, decl
+
 
+def _solar_params(day_of_year: int, hour: int, days_in_year: int) -> tuple[float, float]:
+    """Equation of time (minutes) and solar declination (radians).
+
+    These depend only on the day and the whole hour, so they are shared by
+    every timestamp in the same hour.
+    """
+    # Fractional year (radians)
+    gamma = 2 * math.pi / days_in_year * (day_of_year - 1 + (hour - 12) / 24)
+    return _gamma_series(math.sin(gamma), math.cos(gamma))
+
+
+# One entry per (day, hour) of a year fits
+_daily_solar_params = lru_cache(maxsize=366 * 24)(_solar_params)
+
+
+def _sun_position_core(
+    lat_rad: float,
+    eqtime: float,
+    decl: float,
+    hour: int,
+    minute: int,
+    second: int,
+    longitude: float,
+    timezone_offset: float,
+) -> tuple[float, float]:
+    """Solar azimuth and elevation in degrees for a local time of day.
+
+    eqtime and decl come from _solar_params. Plain arithmetic on scalars,
+    so the optional Numba kernels compile this same function (see
+    _kernels._sun_position_core).
+    """
     # Time offset (minutes)
     time_offset = eqtime + 4 * longitude - 60 * timezone_offset
 
     # True solar time (minutes)
-    tst = dt.hour * 60 + dt.minute + dt.second / 60 + time_offset
+    tst = hour * 60 + minute + second / 60 + time_offset
 
     # Hour angle (degrees)
     ha = (tst / 4) - 180
@@ -122,27 +145,62 @@ def calculate_sun_position(
     # Solar elevation
     elevation_deg = 90 - math.degrees(zenith_rad)
 
-    # Solar azimuth (measured clockwise from North)
-    sin_zenith = math.sin(zenith_rad)
-    if abs(sin_zenith) < 1e-10:
-        azimuth_deg = 180.0  # Sun at zenith, arbitrarily set to South
-    else:
-        cos_azimuth = (
-            (math.sin(lat_rad) * cos_zenith - math.sin(decl))
-            / (math.cos(lat_rad) * sin_zenith)
-        )
-        cos_azimuth = max(-1, min(1, cos_azimuth))  # Clamp
+    # Solar azimuth from South (increasing toward West), then clockwise from
+    # North (0 = North, 90 = East, 180 = South, 270 = West). atan2 takes the
+    # East/West side from the sign of the hour angle, so no clamp or
+    # morning/afternoon branch is needed
+    azimuth_from_south = math.atan2(
+        math.sin(ha_rad),
+        math.cos(ha_rad) * math.sin(lat_rad) - math.tan(decl) * math.cos(lat_rad),
+    )
+    azimuth_deg = (math.degrees(azimuth_from_south) + 180.0) % 360.0
+
+    return azimuth_deg, elevation_deg
+
+
+def _position_core() -> Callable[..., tuple[float, float]]:
+    """Return the compiled _sun_position_core if the kernels are loaded.
+
+    Like a single-position hit test, one sun position never loads Numba
+    itself; see hit_test.load_compiled_kernels.
+    """
+    kernels = loaded_kernels()
+    return _sun_position_core if kernels is None else kernels._sun_position_core
 
-        # This gives azimuth from South (0 = South, increases toward West)
-        azimuth_from_south = math.degrees(math.acos(cos_azimuth))
 
-        # Convert to azimuth from North (0 = North, 90 = East, 180 = South, 270 = West)
-        if ha <= 0:
-            # Morning: sun is in the East, azimuth should be < 180
-            azimuth_deg = 180 - azimuth_from_south
-        else:
-            # Afternoon: sun is in the West, azimuth should be > 180
-            azimuth_deg = 180 + azimuth_from_south
+def calculate_sun_position(
+    latitude: float,
+    longitude: float,
+    dt: datetime,
+    timezone_offset: float = 0.0,
+) -> SunPosition:
+    """Calculate sun position for a given location and time.
+
+    Uses the NOAA solar position algorithm (simplified version).
+
+    Args:
+        latitude: Latitude in degrees (positive = North).
+        longitude: Longitude in degrees (negative = West).
+        dt: Local datetime.
+        timezone_offset: Hours offset from UTC.
+
+    Returns:
+        SunPosition with azimuth and elevation.
+    """
+    day_of_year, days_in_year = _day_of_year(dt)
+
+    eqtime, decl = _daily_solar_params(day_of_year, dt.hour, days_in_year)
+
+    azimuth_deg, elevation_deg = _position_core()(
+        math.radians(latitude),
+        eqtime,
+        decl,
+        dt.hour,
+        dt.minute,
+        dt.second,
+        longitude,
+        timezone_offset,
+    )
 
     return SunPosition(
         azimuth_deg=azimuth_deg,
@@ -151,6 +209,145 @@ def calculate_sun_position(
     )
 
 
+def calculate_sun_position_array(
+    latitude: float,
+    longitude: float,
+    timestamps: ArrayLike,
+    timezone_offset: ArrayLike = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate sun positions for many local times at once.
+
+    Same NOAA algorithm and operation order as calculate_sun_position, on
+    whole float64 arrays, so a day or year of timestamps costs a handful of
+    NumPy calls instead of one interpreted call per timestamp. NumPy's
+    vectorized sin/cos may round differently from math's in the last bit,
+    so results can differ from calculate_sun_position by ~1e-12 degrees.
+
+    Args:
+        latitude: Latitude in degrees (positive = North).
+        longitude: Longitude in degrees (negative = West).
+        timestamps: Local times, as a datetime64 array or a sequence of
+            naive datetimes, shape (T,).
+        timezone_offset: Hours offset from UTC, a scalar or one per
+            timestamp.
+
+    Returns:
+        Tuple of (azimuth_deg, elevation_deg) arrays of shape (T,).
+    """
+    times = np.asarray(timestamps, dtype="datetime64[s]")
+    days = times.astype("datetime64[D]")
+    years = days.astype("datetime64[Y]")
+    day_of_year = (days - years).astype(np.int64) + 1
+    seconds_of_day = (times - days).astype(np.int64)
+    hour = seconds_of_day // 3600
+    minute = seconds_of_day // 60 % 60
+    second = seconds_of_day % 60
+
+    year = years.astype(np.int64) + 1970
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_year = np.where(is_leap, 366, 365)
+
+    lat_rad = math.radians(latitude)
+    # The gamma series depends only on the day and whole hour, so it is
+    # evaluated once per distinct hour (24 per day) and broadcast back
+    gamma_all = 2 * math.pi / days_in_year * (day_of_year - 1 + (hour - 12) / 24)
+    gamma, hour_index = np.unique(gamma_all, return_inverse=True)
+
+    eqtime, decl = _gamma_series(np.sin(gamma), np.cos(gamma))
+    eqtime = eqtime[hour_index]
+    decl = decl[hour_index]
+
+    time_offset = eqtime + 4 * longitude - 60 * np.asarray(timezone_offset, dtype=float)
+    tst = hour * 60 + minute + second / 60 + time_offset
+    ha = (tst / 4) - 180
+    ha_rad = np.radians(ha)
+
+    cos_zenith = np.clip(
+        math.sin(lat_rad) * np.sin(decl) + math.cos(lat_rad) * np.cos(decl) * np.cos(ha_rad),
+        -1,
+        1,
+    )
+    zenith_rad = np.arccos(cos_zenith)
+    elevation_deg = 90 - np.degrees(zenith_rad)
+
+    # Branch-free atan2 form, as in _sun_position_core
+    azimuth_from_south = np.arctan2(
+        np.sin(ha_rad),
+        np.cos(ha_rad) * math.sin(lat_rad) - np.tan(decl) * math.cos(lat_rad),
+    )
+    azimuth_deg = (np.degrees(azimuth_from_south) + 180.0) % 360.0
+
+    return azimuth_deg, elevation_deg
+
+
+def _local_offsets(
+    target_date: date,
+    minutes_of_day: Sequence[int],
+    timezone_offset: float,
+    timezone_name: Optional[str],
+) -> np.ndarray | float:
+    """UTC offsets for times of day; a scalar when no timezone name is given."""
+    if not timezone_name:
+        return timezone_offset
+    day = (target_date.year, target_date.month, target_date.day)
+    return np.fromiter(
+        (
+            resolve_timezone_offset(datetime(*day, m // 60, m % 60), timezone_offset, timezone_name)
+            for m in minutes_of_day
+        ),
+        dtype=float,
+        count=len(minutes_of_day),
+    )
+
+
+def _sun_position_from_minutes(
+    latitude: float,
+    longitude: float,
+    day_of_year: int,
+    days_in_year: int,
+    minute_of_day: int,
+    timezone_offset: float,
+) -> tuple[float, float]:
+    """calculate_sun_position for a whole minute of a known day, without a datetime.
+
+    Returns:
+        Tuple of (azimuth_deg, elevation_deg).
+    """
+    hour, minute = divmod(minute_of_day, 60)
+    eqtime, decl = _daily_solar_params(day_of_year, hour, days_in_year)
+    return _position_core()(
+        math.radians(latitude), eqtime, decl, hour, minute, 0, longitude, timezone_offset
+    )
+
+
+@lru_cache(maxsize=32)
+def _zone_info(timezone_name: str) -> Optional[ZoneInfo]:
+    """Look up an IANA timezone once; None if it is not known."""
+    try:
+        return ZoneInfo(timezone_name)
+    except ZoneInfoNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _cached_timezone_offset(
+    wall_time: datetime,
+    fold: int,
+    timezone_offset: float,
+    timezone_name: Optional[str],
+) -> float:
+    # fold is passed separately because naive datetimes compare and hash
+    # equal regardless of it, and it matters for ambiguous DST times.
+    if timezone_name:
+        tz = _zone_info(timezone_name)
+        if tz is not None:
+            offset = wall_time.replace(tzinfo=tz, fold=fold).utcoffset()
+            if offset is not None:
+                return offset.total_seconds() / 3600.0
+
+    return timezone_offset
+
+
 def resolve_timezone_offset(
     dt: datetime,
     timezone_offset: float = 0.0,
@@ -158,6 +355,11 @@ def resolve_timezone_offset(
 ) -> float:
     """Resolve the UTC offset (hours) for a local datetime.
 
+    Results are cached per local time, so repeated sweeps over the same
+    day do not redo the timezone lookups. The cache is keyed on the full
+    wall time rather than the date, since the offset changes within a day
+    at DST transitions.
+
     Args:
         dt: Naive datetime interpreted as local wall time.
         timezone_offset: Fallback fixed offset in hours.
@@ -166,28 +368,12 @@ def resolve_timezone_offset(
     Returns:
         Offset in hours to apply when computing solar position.
     """
-    if timezone_name:
-        try:
-            tz = ZoneInfo(timezone_name)
-        except ZoneInfoNotFoundError:
-            pass
-        else:
-            aware = datetime(
-                dt.year,
-                dt.month,
-                dt.day,
-                dt.hour,
-                dt.minute,
-                dt.second,
-                dt.microsecond,
-                tzinfo=tz,
-                fold=getattr(dt, "fold", 0),
-            )
-            offset = aware.utcoffset()
-            if offset is not None:
-                return offset.total_seconds() / 3600.0
-
-    return timezone_offset
+    return _cached_timezone_offset(
+        dt.replace(tzinfo=None, fold=0),
+        getattr(dt, "fold", 0),
+        timezone_offset,
+        timezone_name,
+    )
 
 
 def generate_sun_data_for_date(
@@ -215,26 +401,48 @@ def generate_sun_data_for_date(
     Returns:
         List of {timestamp, azimuth_deg, elevation_deg} dictionaries.
     """
-    data = []
-
-    current_time = datetime(target_date.year, target_date.month, target_date.day, start_hour, 0)
-    end_time = datetime(target_date.year, target_date.month, target_date.day, end_hour, 0)
-
-    while current_time <= end_time:
-        offset = resolve_timezone_offset(current_time, timezone_offset, timezone_name)
-        pos = calculate_sun_position(latitude, longitude, current_time, offset)
-
-        # Only include if sun is above horizon
-        if pos.elevation_deg > -5:  # Include slightly below for twilight
-            data.append({
-                "timestamp": current_time.strftime("%H:%M"),
-                "azimuth_deg": round(pos.azimuth_deg, 1),
-                "elevation_deg": round(pos.elevation_deg, 1),
-            })
-
-        current_time += timedelta(minutes=interval_minutes)
+    # All whole minutes from start_hour up to and including end_hour. The day
+    # is rebuilt as a date, so a datetime's time of day is ignored
+    minutes = range(start_hour * 60, end_hour * 60 + 1, interval_minutes)
+    day = date(target_date.year, target_date.month, target_date.day)
+    times = np.datetime64(day, "m") + np.asarray(minutes, dtype="timedelta64[m]")
+
+    azimuths, elevations = calculate_sun_position_array(
+        latitude,
+        longitude,
+        times,
+        _local_offsets(target_date, minutes, timezone_offset, timezone_name),
+    )
 
-    return data
+    # Only include if sun is above horizon, or slightly below for twilight
+    return [
+        {
+            "timestamp": f"{minute // 60:02d}:{minute % 60:02d}",
+            "azimuth_deg": round(azimuth, 1),
+            "elevation_deg": round(elevation, 1),
+        }
+        for minute, azimuth, elevation in zip(minutes, azimuths.tolist(), elevations.tolist())
+        if elevation > -5
+    ]
+
+
+def _first_slot_with_sun_up(
+    slots: Sequence[int],
+    sun_up: Callable[[int], bool],
+) -> Optional[int]:
+    """Return the first of slots (minutes of the day) with the sun up, or None.
+
+    The slots span less than half a day, so the elevation has at most one
+    turning point among them. When the first slot has the sun down and the
+    last has it up, the sun therefore comes up exactly once in between, and
+    that slot is found by bisection (about 7 evaluations for 96 slots).
+    Otherwise, e.g. in polar regions, the slots are scanned in order.
+    """
+    if sun_up(slots[0]):
+        return slots[0]
+    if not sun_up(slots[-1]):
+        return next((m for m in slots[1:-1] if sun_up(m)), None)
+    return slots[bisect_left(slots, True, lo=1, key=sun_up)]
 
 
 def get_sunrise_sunset(
@@ -256,36 +464,43 @@ def get_sunrise_sunset(
     Returns:
         Tuple of (sunrise_datetime, sunset_datetime). May be None for polar regions.
     """
-    sunrise = None
-    sunset = None
+    day = (target_date.year, target_date.month, target_date.day)
+    day_of_year, days_in_year = _day_of_year(target_date)
 
-    # Search for sunrise (morning)
-    for hour in range(4, 12):
-        for minute in range(0, 60, 5):
-            dt = datetime(target_date.year, target_date.month, target_date.day, hour, minute)
-            offset = resolve_timezone_offset(dt, timezone_offset, timezone_name)
-            pos = calculate_sun_position(latitude, longitude, dt, offset)
-            if pos.elevation_deg > 0 and sunrise is None:
-                sunrise = dt
-                break
-        if sunrise:
-            break
-
-    # Search for sunset (evening)
-    for hour in range(20, 12, -1):
-        for minute in range(55, -1, -5):
-            dt = datetime(target_date.year, target_date.month, target_date.day, hour, minute)
+    def sun_up(minute_of_day: int) -> bool:
+        offset = timezone_offset
+        if timezone_name:
+            dt = datetime(*day, minute_of_day // 60, minute_of_day % 60)
             offset = resolve_timezone_offset(dt, timezone_offset, timezone_name)
-            pos = calculate_sun_position(latitude, longitude, dt, offset)
-            if pos.elevation_deg > 0 and sunset is None:
-                sunset = dt
-                break
-        if sunset:
-            break
+        _, elevation = _sun_position_from_minutes(
+            latitude, longitude, day_of_year, days_in_year, minute_of_day, offset
+        )
+        return elevation > 0
+
+    def to_datetime(minute_of_day: Optional[int]) -> Optional[datetime]:
+        if minute_of_day is None:
+            return None
+        return datetime(*day, minute_of_day // 60, minute_of_day % 60)
+
+    # Sunrise: first 5-minute slot from 04:00 to 11:55 with the sun up.
+    # Sunset: first slot with the sun up going back from 20:55 to 13:00.
+    sunrise = to_datetime(_first_slot_with_sun_up(range(4 * 60, 12 * 60, 5), sun_up))
+    sunset = to_datetime(_first_slot_with_sun_up(range(20 * 60 + 55, 13 * 60 - 1, -5), sun_up))
 
     return sunrise, sunset
 
 
-def _is_leap_year(year: int) -> bool:
-    """Check if a year is a leap year."""
-    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+@lru_cache(maxsize=8)
+def _year_start(year: int) -> tuple[int, int]:
+    """Ordinal of the day before 1 January of year, and the year's length in days."""
+    return date(year, 1, 1).toordinal() - 1, 366 if calendar.isleap(year) else 365
+
+
+def _day_of_year(day: date) -> tuple[int, int]:
+    """Day of year (1-366) of a date or datetime, and the length of its year.
+
+    Uses the date's ordinal and a per-year cache, which is several times
+    cheaper than timetuple() on every call.
+    """
+    year_start, days_in_year = _year_start(day.year)
+    return day.toordinal() - year_start, days_in_year
@@ -2,7 +2,8 @@
 
 This module provides simple, automation-friendly functions for use with
 Home Assistant. These functions are designed to be called from HA Python
-scripts or custom components.
+scripts or custom components. Hit tests are cached per sun position rounded
+to 0.1 degree, so frequent polls with nearly unchanged angles are cheap.
 
 Example Home Assistant automation:
     ```yaml
@@ -32,55 +33,117 @@ Example Python script (python_scripts/check_plant_sunlight.py):
     ```
 """
 
+import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 from ..core.hit_test import check_sun_hits_plant
-from ..core.models import Config
+from ..core.models import Config, HitResult
 
 # Default config path (can be overridden)
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "default_config.json"
 
-# Cached config to avoid reloading on every call
-_cached_config: Optional[Config] = None
-_cached_config_path: Optional[str] = None
+# Loaded configs keyed on (path, modification time), least recently used
+# first. Editing the file changes its key, so the new contents are loaded
+# on the next call without clear_config_cache.
+_ConfigKey = tuple[str, int]
+_config_cache: OrderedDict[_ConfigKey, Config] = OrderedDict()
+_CONFIG_CACHE_SIZE = 4
+
+# Shared result for night-time calls, which need no geometry
+_BELOW_HORIZON = HitResult(is_hit=False, reason="sun_below_horizon")
+
+# Sun angles are rounded to this many decimals (0.1 degree, the precision
+# HA reports) before the hit test, so repeated polls share cached results
+_ANGLE_DECIMALS = 1
+_MIN_ELEVATION_BIN = 10.0 ** -_ANGLE_DECIMALS
+
+
+def _load_config_entry(config_path: Optional[Union[str, Path]]) -> tuple[_ConfigKey, Config]:
+    """Return the cache key and Config for a config file, loading it if needed."""
+    if config_path is None:
+        config_path = DEFAULT_CONFIG_PATH
+
+    config_path_str = str(config_path)
+    # One stat per call; nanoseconds so quick successive edits still differ
+    key = (config_path_str, os.stat(config_path_str).st_mtime_ns)
+
+    config = _config_cache.get(key)
+    if config is not None:
+        _config_cache.move_to_end(key)
+        return key, config
+
+    config = Config.from_json_file(config_path)
+    _config_cache[key] = config
+    if len(_config_cache) > _CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
+    return key, config
 
 
 def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     """Load configuration, with caching for performance.
 
+    The cache is keyed on the file's path and modification time, so an
+    edited config file is reloaded automatically.
+
     Args:
         config_path: Path to config file. If None, uses default.
 
     Returns:
         Config object.
     """
-    global _cached_config, _cached_config_path
+    return _load_config_entry(config_path)[1]
 
-    if config_path is None:
-        config_path = DEFAULT_CONFIG_PATH
 
-    config_path_str = str(config_path)
+def clear_config_cache() -> None:
+    """Clear the cached configurations and hit results.
 
-    # Return cached config if path matches
-    if _cached_config is not None and _cached_config_path == config_path_str:
-        return _cached_config
+    Edited config files are picked up automatically; call this to force a
+    reload anyway, e.g. after changing a file without changing its mtime.
+    """
+    _config_cache.clear()
+    _cached_hit.cache_clear()
 
-    # Load and cache
-    _cached_config = Config.from_json_file(config_path)
-    _cached_config_path = config_path_str
 
-    return _cached_config
+@lru_cache(maxsize=4096)
+def _cached_hit(azimuth_bin: float, elevation_bin: float, config_key: _ConfigKey) -> HitResult:
+    """Hit test for rounded sun angles against a cached config.
 
+    config_key is the (path, mtime) key the config is cached under. It names
+    the file contents, so results stay valid if that config is evicted and
+    later reloaded. Callers load the config first, so it is in the cache.
+    """
+    config = _config_cache[config_key]
+    return check_sun_hits_plant(
+        sun_azimuth_deg=azimuth_bin,
+        sun_elevation_deg=elevation_bin,
+        plant=config.plant,
+        windows=config.windows,
+        n_angular=config.simulation.sample_points_angular,
+        n_vertical=config.simulation.sample_points_vertical,
+        window_soa=config.window_soa,
+    )
 
-def clear_config_cache() -> None:
-    """Clear the cached configuration.
 
-    Call this if you've modified the config file and want to reload it.
-    """
-    global _cached_config, _cached_config_path
-    _cached_config = None
-    _cached_config_path = None
+def _hit_result(
+    sun_azimuth: float,
+    sun_elevation: float,
+    config_path: Optional[Union[str, Path]],
+) -> HitResult:
+    """Run (or reuse) the hit test for the given sun angles, rounded to 0.1 degree."""
+    # Sun below horizon: answered without loading the config
+    if sun_elevation <= 0:
+        return _BELOW_HORIZON
+
+    config_key, _ = _load_config_entry(config_path)
+    return _cached_hit(
+        round(sun_azimuth, _ANGLE_DECIMALS),
+        # The sun is up, so its bin must not round down to the horizon
+        max(round(sun_elevation, _ANGLE_DECIMALS), _MIN_ELEVATION_BIN),
+        config_key,
+    )
 
 
 def check_sunlight(
@@ -107,15 +170,7 @@ def check_sunlight(
         >>> if is_sunny:
         ...     print("Move the blinds!")
     """
-    config = load_config(config_path)
-    result = check_sun_hits_plant(
-        sun_azimuth_deg=sun_azimuth,
-        sun_elevation_deg=sun_elevation,
-        plant=config.plant,
-        windows=config.windows,
-        n_angular=config.simulation.sample_points_angular,
-        n_vertical=config.simulation.sample_points_vertical,
-    )
+    result = _hit_result(sun_azimuth, sun_elevation, config_path)
     return result.is_hit
 
 
@@ -147,16 +202,28 @@ def get_sunlight_details(
         >>> details = get_sunlight_details(180, 45)
         >>> print(f"Hit: {details['is_hit']}, Window: {details['window_id']}")
     """
-    config = load_config(config_path)
-    result = check_sun_hits_plant(
-        sun_azimuth_deg=sun_azimuth,
-        sun_elevation_deg=sun_elevation,
-        plant=config.plant,
-        windows=config.windows,
-        n_angular=config.simulation.sample_points_angular,
-        n_vertical=config.simulation.sample_points_vertical,
-    )
+    result = _hit_result(sun_azimuth, sun_elevation, config_path)
+    return _details(result, sun_azimuth, sun_elevation)
+
+
+def get_below_horizon_details(sun_azimuth: float, sun_elevation: float) -> dict:
+    """Get the get_sunlight_details() result for a sun below the horizon.
 
+    Needs no config, so callers that already know the sun is down can
+    report it without locating one.
+
+    Args:
+        sun_azimuth: Current sun azimuth in degrees.
+        sun_elevation: Current sun elevation in degrees (at or below 0).
+
+    Returns:
+        Dictionary with the same keys as get_sunlight_details().
+    """
+    return _details(_BELOW_HORIZON, sun_azimuth, sun_elevation)
+
+
+def _details(result: HitResult, sun_azimuth: float, sun_elevation: float) -> dict:
+    """Build the get_sunlight_details() payload for a hit result."""
     return {
         "is_hit": result.is_hit,
         "window_id": result.window_id,
@@ -195,15 +262,7 @@ def get_sunlight_state(
                   {{ result }}
         ```
     """
-    config = load_config(config_path)
-    result = check_sun_hits_plant(
-        sun_azimuth_deg=sun_azimuth,
-        sun_elevation_deg=sun_elevation,
-        plant=config.plant,
-        windows=config.windows,
-        n_angular=config.simulation.sample_points_angular,
-        n_vertical=config.simulation.sample_points_vertical,
-    )
+    result = _hit_result(sun_azimuth, sun_elevation, config_path)
 
     if result.is_hit:
         return "direct_sun"
@@ -5,16 +5,19 @@ and output hit intervals.
 """
 
 import json
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, TextIO
 
-from ..core.hit_test import check_sun_hits_plant
-from ..core.models import Config, HitResult
+import numpy as np
 
+from ..core.hit_test import check_sun_hits_plant_batch
+from ..core.models import BatchHitResult, Config, HitResult
 
-@dataclass
+
+@dataclass(slots=True)
 class SunDataPoint:
     """A single sun position data point.
 
@@ -46,7 +49,7 @@ class SunDataPoint:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TimestampResult:
     """Result for a single timestamp.
 
@@ -59,7 +62,7 @@ class TimestampResult:
     hit_result: HitResult
 
 
-@dataclass
+@dataclass(slots=True)
 class HitInterval:
     """A continuous interval where the plant is hit by sunlight.
 
@@ -85,7 +88,7 @@ class HitInterval:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     """Result of a time-range simulation.
 
@@ -150,6 +153,7 @@ def consolidate_to_intervals(results: list[TimestampResult]) -> list[HitInterval
     current_interval_start = None
     current_interval_window = None
     current_interval_count = 0
+    last_timestamp = None
 
     for result in results:
         if result.hit_result.is_hit:
@@ -167,9 +171,7 @@ def consolidate_to_intervals(results: list[TimestampResult]) -> list[HitInterval
                 intervals.append(
                     HitInterval(
                         start_timestamp=current_interval_start,
-                        end_timestamp=results[
-                            results.index(result) - 1
-                        ].timestamp,
+                        end_timestamp=last_timestamp,
                         window_id=current_interval_window,
                         n_timestamps=current_interval_count,
                     )
@@ -178,6 +180,10 @@ def consolidate_to_intervals(results: list[TimestampResult]) -> list[HitInterval
                 current_interval_window = None
                 current_interval_count = 0
 
+        # The previous timestamp is where an interval ends when the next miss
+        # arrives
+        last_timestamp = result.timestamp
+
     # Handle final interval if simulation ends with a hit
     if current_interval_start is not None:
         intervals.append(
@@ -192,8 +198,29 @@ def consolidate_to_intervals(results: list[TimestampResult]) -> list[HitInterval
     return intervals
 
 
+def _intervals_from_batch(timestamps: list[str], batch: BatchHitResult) -> list[HitInterval]:
+    """consolidate_to_intervals computed from the batch arrays.
+
+    Runs of hits are found from the transitions of is_hit, so no
+    per-timestamp result objects are needed.
+    """
+    # +1 where a run of hits starts, -1 one past where it ends
+    edges = np.diff(batch.is_hit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1).tolist()
+    ends = np.flatnonzero(edges == -1).tolist()
+    return [
+        HitInterval(
+            start_timestamp=timestamps[start],
+            end_timestamp=timestamps[end - 1],
+            window_id=batch.window_ids[batch.window_index[start]],
+            n_timestamps=end - start,
+        )
+        for start, end in zip(starts, ends)
+    ]
+
+
 def simulate_time_range(
-    sun_data: list[SunDataPoint],
+    sun_data: Iterable[SunDataPoint],
     config: Config,
     keep_details: bool = True,
 ) -> SimulationResult:
@@ -203,40 +230,172 @@ def simulate_time_range(
     Groups results into continuous hit intervals.
 
     Args:
-        sun_data: List of sun position data points.
+        sun_data: Sun position data points, e.g. a list or the iterator from
+            iter_sun_data_from_json. It is consumed in a single pass.
         config: Configuration with plant and window geometry.
         keep_details: Whether to keep per-timestamp results.
 
     Returns:
         SimulationResult with hit counts, intervals, and optionally per-timestamp details.
     """
-    results = []
-
+    # One pass into compact float buffers, so a streamed input never has all
+    # of its SunDataPoint objects alive at once
+    timestamps: list[str] = []
+    azimuth_buf = array("d")
+    elevation_buf = array("d")
     for point in sun_data:
-        hit = check_sun_hits_plant(
-            sun_azimuth_deg=point.azimuth_deg,
-            sun_elevation_deg=point.elevation_deg,
-            plant=config.plant,
-            windows=config.windows,
-            n_angular=config.simulation.sample_points_angular,
-            n_vertical=config.simulation.sample_points_vertical,
-        )
-        results.append(TimestampResult(timestamp=point.timestamp, hit_result=hit))
+        timestamps.append(point.timestamp)
+        azimuth_buf.append(point.azimuth_deg)
+        elevation_buf.append(point.elevation_deg)
+    azimuths = np.frombuffer(azimuth_buf, dtype=float)
+    elevations = np.frombuffer(elevation_buf, dtype=float)
+
+    # The scene is constant over the range, so all timestamps are evaluated
+    # in one broadcasted pass
+    batch = check_sun_hits_plant_batch(
+        azimuths,
+        elevations,
+        plant=config.plant,
+        windows=config.windows,
+        n_angular=config.simulation.sample_points_angular,
+        n_vertical=config.simulation.sample_points_vertical,
+        window_soa=config.window_soa,
+        use_gpu=config.simulation.use_gpu,
+    )
 
-    # Consolidate into intervals
-    intervals = consolidate_to_intervals(results)
+    hit_count = int(batch.is_hit.sum())
 
-    hit_count = sum(1 for r in results if r.hit_result.is_hit)
+    # Per-timestamp HitResult objects are only built when they are kept;
+    # intervals come straight from the batch arrays
+    results = []
+    if keep_details:
+        results = [
+            TimestampResult(timestamp=timestamp, hit_result=batch.hit_result(i))
+            for i, timestamp in enumerate(timestamps)
+        ]
 
     return SimulationResult(
-        total_timestamps=len(results),
+        total_timestamps=len(timestamps),
         hit_count=hit_count,
-        miss_count=len(results) - hit_count,
-        hit_intervals=intervals,
-        results=results if keep_details else [],
+        miss_count=len(timestamps) - hit_count,
+        hit_intervals=_intervals_from_batch(timestamps, batch),
+        results=results,
     )
 
 
+# Characters of JSON text read at a time when streaming sun data files
+_JSON_CHUNK_SIZE = 1 << 16
+
+
+class _JsonStream:
+    """Incremental reader for the values of a JSON document, using only the stdlib.
+
+    Text is read in chunks and values are decoded with JSONDecoder.raw_decode,
+    so memory stays bounded by the largest single value rather than the file.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, f: TextIO, chunk_size: int = _JSON_CHUNK_SIZE) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> None:
+        chunk = self._f.read(self._chunk_size)
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        self._eof = not chunk
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf) or self._eof:
+                return self._buf[self._pos:self._pos + 1]
+            self._fill()
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError("Invalid sun data format")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode and consume the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number at the very end of the buffer may continue in the
+                # next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            self._fill()
+
+    def array_items(self) -> Iterator[Any]:
+        """Yield the items of the JSON array that starts at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_sun_data_from_json(path: str | Path) -> Iterator[SunDataPoint]:
+    """Stream sun position data from a JSON file, one point at a time.
+
+    Accepts the same formats as load_sun_data_from_json, but never holds the
+    whole document in memory, so multi-year exports can be fed straight into
+    simulate_time_range.
+
+    Args:
+        path: Path to the JSON file.
+
+    Yields:
+        SunDataPoint objects in file order.
+
+    Raises:
+        ValueError: If the file is neither an array nor an object with "data".
+    """
+    with open(path, "r") as f:
+        stream = _JsonStream(f, _JSON_CHUNK_SIZE)
+        if stream.peek() == "[":
+            for item in stream.array_items():
+                yield SunDataPoint.from_dict(item)
+            return
+
+        # Object: skip other keys until "data"
+        stream.expect("{")
+        while stream.peek() == '"':
+            key = stream.value()
+            stream.expect(":")
+            if key == "data":
+                if stream.peek() != "[":
+                    break
+                for item in stream.array_items():
+                    yield SunDataPoint.from_dict(item)
+                return
+            stream.value()
+            if stream.expect(",}") == "}":
+                break
+        raise ValueError("Invalid sun data format")
+
+
 def load_sun_data_from_json(path: str | Path) -> list[SunDataPoint]:
     """Load sun position data from a JSON file.
 
@@ -254,24 +413,16 @@ def load_sun_data_from_json(path: str | Path) -> list[SunDataPoint]:
         ...
     ]
 
+    The file is parsed incrementally (see iter_sun_data_from_json), so only
+    the resulting SunDataPoint objects are held in memory.
+
     Args:
         path: Path to the JSON file.
 
     Returns:
         List of SunDataPoint objects.
     """
-    with open(path, "r") as f:
-        data = json.load(f)
-
-    # Handle both formats
-    if isinstance(data, list):
-        points = data
-    elif isinstance(data, dict) and "data" in data:
-        points = data["data"]
-    else:
-        raise ValueError("Invalid sun data format")
-
-    return [SunDataPoint.from_dict(p) for p in points]
+    return list(iter_sun_data_from_json(path))
 
 
 def save_simulation_result(
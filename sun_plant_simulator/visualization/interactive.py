@@ -4,18 +4,37 @@ This module creates an HTML visualization with a time slider to explore
 how sunlight hits the plant throughout the day.
 """
 
+import base64
 import json
-import math
+from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 import numpy as np
 import plotly.graph_objects as go
 
-from ..core.geometry import sun_direction_from_angles
-from ..core.hit_test import check_sun_hits_plant, generate_plant_sample_points
+from ..core.geometry import sun_direction_from_angles, sun_direction_simplified_array
 from ..core.models import Config, Plant, Window
 
+try:  # Optional: encodes NumPy arrays in C (pip install sun-plant-simulator[fast])
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    """Encode the NumPy values stdlib json does not know about."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _to_json(payload) -> str:
+    """Serialize a payload that may contain NumPy arrays, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(payload, default=_json_default)
+
 
 def create_time_slider_visualization(
     config: Config,
@@ -43,72 +62,81 @@ def create_time_slider_visualization(
         from datetime import date
         date_str = date.today().strftime("%Y-%m-%d")
 
-    # Pre-compute hit results for all timestamps
-    results = []
-    for point in sun_data:
-        hit = check_sun_hits_plant(
-            sun_azimuth_deg=point["azimuth_deg"],
-            sun_elevation_deg=point["elevation_deg"],
-            plant=config.plant,
-            windows=config.windows,
-        )
-        results.append({
+    # The page runs its own hit test, so only the timeline is passed on
+    results = [
+        {
             "timestamp": point["timestamp"],
             "azimuth": point["azimuth_deg"],
             "elevation": point["elevation_deg"],
-            "is_hit": hit.is_hit,
-            "window_id": hit.window_id,
-            "hit_points": [p.tolist() for p in hit.hit_points] if hit.hit_points else [],
-            "sun_direction": hit.sun_direction.tolist() if hit.sun_direction is not None else None,
-        })
-
-    # Build the HTML with embedded data and Plotly
-    html = build_interactive_html(config, results, date_str)
+        }
+        for point in sun_data
+    ]
 
+    # Build the HTML with embedded data and Plotly, streaming it straight to
+    # the output file when there is one
     if output_path:
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+            write_interactive_html(f, config, results, date_str)
         return output_path
-    return html
+    return build_interactive_html(config, results, date_str)
 
 
 def generate_sample_sun_data() -> list[dict]:
     """Generate sample sun position data for a day."""
-    data = []
-    # Simulate sun path for a mid-latitude summer day
-    for hour in range(5, 21):  # 5 AM to 8 PM
-        for minute in [0, 30]:
-            if hour == 20 and minute == 30:
-                continue
-
-            time_decimal = hour + minute / 60
-
-            # Simple sun path model
-            # Solar noon around 12:00
-            hour_angle = (time_decimal - 12) * 15  # degrees from noon
+    # Simulate sun path for a mid-latitude summer day, every 30 minutes from
+    # 5 AM to 8 PM
+    minutes_of_day = np.arange(5 * 60, 20 * 60 + 1, 30)
+    time_decimal = minutes_of_day / 60
+
+    # Simple sun path model
+    # Solar noon around 12:00
+    hour_angle = (time_decimal - 12) * 15  # degrees from noon
+
+    # Approximate azimuth (east in morning, west in afternoon)
+    azimuth = np.where(
+        time_decimal < 12,
+        90 + (12 - time_decimal) * 7.5,  # morning: east to south
+        180 + (time_decimal - 12) * 7.5,  # afternoon: south to west
+    )
+
+    # Approximate elevation (peaks at noon)
+    max_elevation = 65  # summer max
+    elevation = max_elevation * np.cos(np.radians(hour_angle))
+
+    up = elevation > 0
+    return [
+        {
+            "timestamp": f"{m // 60:02d}:{m % 60:02d}",
+            "azimuth_deg": az,
+            "elevation_deg": el,
+        }
+        for m, az, el in zip(
+            minutes_of_day[up].tolist(), azimuth[up].tolist(), elevation[up].tolist()
+        )
+    ]
 
-            # Approximate azimuth (east in morning, west in afternoon)
-            if time_decimal < 12:
-                azimuth = 90 + (12 - time_decimal) * 7.5  # morning: east to south
-            else:
-                azimuth = 180 + (time_decimal - 12) * 7.5  # afternoon: south to west
 
-            # Approximate elevation (peaks at noon)
-            max_elevation = 65  # summer max
-            elevation = max_elevation * math.cos(math.radians(hour_angle))
+def build_interactive_html(config: Config, results: list[dict], date_str: str = "") -> str:
+    """Build the complete interactive HTML page."""
+    buffer = StringIO()
+    write_interactive_html(buffer, config, results, date_str)
+    return buffer.getvalue()
 
-            if elevation > 0:
-                data.append({
-                    "timestamp": f"{hour:02d}:{minute:02d}",
-                    "azimuth_deg": azimuth,
-                    "elevation_deg": elevation,
-                })
 
-    return data
+def write_interactive_html(
+    file: TextIO, config: Config, results: list[dict], date_str: str = ""
+) -> None:
+    """Write the complete interactive HTML page to a text file.
 
+    The timeline payloads are written one at a time between the fixed parts
+    of the page, so no copy of the whole page is built in memory.
 
-def build_interactive_html(config: Config, results: list[dict], date_str: str = "") -> str:
-    """Build the complete interactive HTML page."""
+    Args:
+        file: Text file (or other writer) the page is written to.
+        config: Room configuration.
+        results: Timeline entries with timestamp, azimuth and elevation.
+        date_str: Date string to display.
+    """
 
     # Convert config to JSON for JavaScript
     window_payload = []
@@ -116,7 +144,7 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
         entry = {
             "id": w.id,
             "wall_id": w.wall_id,
-            "center": w.center.tolist(),
+            "center": w.center,
             "width": w.width,
             "height": w.height,
             "wall_normal_azimuth": w.wall_normal_azimuth,
@@ -134,7 +162,12 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
 
         window_payload.append(entry)
 
-    config_json = json.dumps({
+    # A wall is drawn with the thickness of its first window
+    thickness_by_wall = {}
+    for w in config.windows:
+        thickness_by_wall.setdefault(w.wall_id, w.wall_thickness)
+
+    config_json = _to_json({
         "plant": {
             "center_x": config.plant.center_x,
             "center_y": config.plant.center_y,
@@ -146,7 +179,7 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
             {
                 "id": wall.id,
                 "normal_azimuth": wall.outward_normal_azimuth_deg,
-                "thickness": next((w.wall_thickness for w in config.windows if w.wall_id == wall.id), 0.3),
+                "thickness": thickness_by_wall.get(wall.id, 0.3),
                 "draw_length": wall.draw_length,
             }
             for wall in config.walls
@@ -154,9 +187,23 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
         "windows": window_payload,
     })
 
-    results_json = json.dumps(results)
-
-    html = f'''<!DOCTYPE html>
+    # The timeline goes in as parallel arrays: timestamps as JSON, angles and
+    # sun directions as base64 little-endian float64 (float32 would flip
+    # grazing rays at the window edges). The page runs its own hit test on
+    # load, so the per-result hit fields are not embedded.
+    timestamps_json = _to_json([r["timestamp"] for r in results])
+    azimuths = np.array([r["azimuth"] for r in results], dtype=float)
+    elevations = np.array([r["elevation"] for r in results], dtype=float)
+    wall1_normal_azimuth = next(
+        (wall.outward_normal_azimuth_deg for wall in config.walls if wall.id == "wall_1"), None
+    ) or 210.0
+    sun_directions = sun_direction_simplified_array(azimuths, elevations, wall1_normal_azimuth)
+    azimuths_b64, elevations_b64, sun_directions_b64 = (
+        base64.b64encode(values.astype("<f8").tobytes()).decode("ascii")
+        for values in (azimuths, elevations, sun_directions)
+    )
+
+    file.write(f'''<!DOCTYPE html>
 <html>
 <head>
     <title>Sun-Plant Simulation</title>
@@ -465,19 +512,37 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
     <script>
         // Original config from file (immutable)
         const originalConfig = {config_json};
-        const sunPositions = {results_json};
+        function decodeFloat64(base64) {{
+            return new Float64Array(Uint8Array.from(atob(base64), c => c.charCodeAt(0)).buffer);
+        }}
 
-        function ensureWallDrawLengths(target) {{
-            if (!target.walls) {{
+        // Timeline, one entry per slider position
+        const sunTimestamps = ''')
+    file.write(timestamps_json)
+    file.write(";\n        const sunAzimuths = decodeFloat64('")
+    file.write(azimuths_b64)
+    file.write("');\n        const sunElevations = decodeFloat64('")
+    file.write(elevations_b64)
+    file.write('''\');
+        const sunPositions = sunTimestamps.map((timestamp, i) => ({
+            timestamp, azimuth: sunAzimuths[i], elevation: sunElevations[i]
+        }));
+        // Row i holds the sun direction for sunPositions[i] (x, y, z)
+        const sunDirections = decodeFloat64(\'''')
+    file.write(sun_directions_b64)
+    file.write('''\');
+
+        function ensureWallDrawLengths(target) {
+            if (!target.walls) {
                 target.walls = [];
-            }}
-            target.walls.forEach(wall => {{
-                if (typeof wall.draw_length !== 'number') {{
+            }
+            target.walls.forEach(wall => {
+                if (typeof wall.draw_length !== 'number') {
                     const fallback = wall.visualization?.wall_length ?? wall.visualization?.draw_length;
                     wall.draw_length = typeof fallback === 'number' ? fallback : 15;
-                }}
-            }});
-        }}
+                }
+            });
+        }
 
         ensureWallDrawLengths(originalConfig);
 
@@ -487,10 +552,10 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
         let results = [];  // Will be recalculated
 
         // Simulation settings
-        let simSettings = {{
+        let simSettings = {
             sampleAngular: 8,
             sampleVertical: 3
-        }};
+        };
 
         let currentIndex = 0;
         const STORAGE_KEY = 'sunPlantSimulator_config';
@@ -499,110 +564,110 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
         const ROOM_OFFSET_X = 30;
         const ROOM_OFFSET_Y = 30;
 
-        function getWindowAxis(window) {{
-            if (window.axis === 'x' || window.axis === 'y') {{
+        function getWindowAxis(window) {
+            if (window.axis === 'x' || window.axis === 'y') {
                 return window.axis;
-            }}
-            if (window.wall_id === 'wall_1') {{
+            }
+            if (window.wall_id === 'wall_1') {
                 return 'x';
-            }}
-            if (window.wall_id === 'wall_2') {{
+            }
+            if (window.wall_id === 'wall_2') {
                 return 'y';
-            }}
+            }
             return (window.id || '').startsWith('window_1') ? 'x' : 'y';
-        }}
+        }
 
-        function getWindowPositionAlongWall(window) {{
-            if (typeof window.position_along_wall === 'number') {{
+        function getWindowPositionAlongWall(window) {
+            if (typeof window.position_along_wall === 'number') {
                 return window.position_along_wall;
-            }}
-            if (typeof window.x_position === 'number') {{
+            }
+            if (typeof window.x_position === 'number') {
                 return window.x_position;
-            }}
-            if (typeof window.y_position === 'number') {{
+            }
+            if (typeof window.y_position === 'number') {
                 return window.y_position;
-            }}
+            }
             const axis = getWindowAxis(window);
-            if (window.center) {{
-                if (axis === 'x') {{
+            if (window.center) {
+                if (axis === 'x') {
                     return (window.center[0] || 0) - (window.width || 0) / 2;
-                }}
+                }
                 return (window.center[1] || 0) - (window.width || 0) / 2;
-            }}
+            }
             return 0;
-        }}
+        }
 
-        function getWindowCenterAlongWall(window) {{
+        function getWindowCenterAlongWall(window) {
             return getWindowPositionAlongWall(window) + (window.width || 0) / 2;
-        }}
+        }
 
         // ========== CONFIG PANEL FUNCTIONS ==========
 
-        function toggleConfig() {{
+        function toggleConfig() {
             const body = document.getElementById('configBody');
             const toggle = document.getElementById('configToggle');
             body.classList.toggle('open');
             toggle.classList.toggle('open');
-        }}
+        }
 
-        function loadConfigFromStorage() {{
-            try {{
+        function loadConfigFromStorage() {
+            try {
                 const saved = localStorage.getItem(STORAGE_KEY);
-                if (saved) {{
+                if (saved) {
                     const parsed = JSON.parse(saved);
                     // Merge saved config into active config
-                    if (parsed.plant) {{
-                        config.plant = {{ ...config.plant, ...parsed.plant }};
-                    }}
-                    if (parsed.wallThickness !== undefined) {{
+                    if (parsed.plant) {
+                        config.plant = { ...config.plant, ...parsed.plant };
+                    }
+                    if (parsed.wallThickness !== undefined) {
                         config.windows.forEach(w => w.wall_thickness = parsed.wallThickness);
-                    }}
-                    if (parsed.simulation) {{
-                        simSettings = {{ ...simSettings, ...parsed.simulation }};
-                    }}
-                    if (Array.isArray(parsed.wallDrawLengths)) {{
-                        parsed.wallDrawLengths.forEach(saved => {{
+                    }
+                    if (parsed.simulation) {
+                        simSettings = { ...simSettings, ...parsed.simulation };
+                    }
+                    if (Array.isArray(parsed.wallDrawLengths)) {
+                        parsed.wallDrawLengths.forEach(saved => {
                             const targetWall = config.walls?.find(w => w.id === saved.id);
-                            if (targetWall && typeof saved.draw_length === 'number') {{
+                            if (targetWall && typeof saved.draw_length === 'number') {
                                 targetWall.draw_length = saved.draw_length;
-                            }}
-                        }});
-                    }}
+                            }
+                        });
+                    }
                     ensureWallDrawLengths(config);
                     console.log('Loaded config from localStorage:', parsed);
-                }}
-            }} catch (e) {{
+                }
+            } catch (e) {
                 console.warn('Failed to load config from localStorage:', e);
-            }}
-        }}
+            }
+        }
 
-        function saveConfigToStorage() {{
-            try {{
-                const toSave = {{
-                    plant: {{
+        function saveConfigToStorage() {
+            try {
+                const toSave = {
+                    plant: {
                         center_x: config.plant.center_x,
                         center_y: config.plant.center_y,
                         radius: config.plant.radius,
                         z_max: config.plant.z_max
-                    }},
+                    },
                     wallThickness: config.windows[0]?.wall_thickness || 0,
                     simulation: simSettings,
-                    wallDrawLengths: config.walls?.map(w => {{
-                        return {{ id: w.id, draw_length: w.draw_length }};
-                    }}) || [],
-                }};
+                    wallDrawLengths: config.walls?.map(w => {
+                        return { id: w.id, draw_length: w.draw_length };
+                    }) || [],
+                };
                 localStorage.setItem(STORAGE_KEY, JSON.stringify(toSave));
 
                 // Show saved indicator
                 const indicator = document.getElementById('savedIndicator');
                 indicator.classList.add('show');
                 setTimeout(() => indicator.classList.remove('show'), 2000);
-            }} catch (e) {{
+            } catch (e) {
                 console.warn('Failed to save config to localStorage:', e);
-            }}
-        }}
+            }
+        }
 
-        function populateConfigFields() {{
+        function populateConfigFields() {
             document.getElementById('plantCenterX').value = config.plant.center_x;
             document.getElementById('plantCenterY').value = config.plant.center_y;
             document.getElementById('plantRadius').value = config.plant.radius;
@@ -610,9 +675,9 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
             document.getElementById('wallThickness').value = config.windows[0]?.wall_thickness || 0;
             document.getElementById('sampleAngular').value = simSettings.sampleAngular;
             document.getElementById('sampleVertical').value = simSettings.sampleVertical;
-        }}
+        }
 
-        function applyConfig() {{
+        function applyConfig() {
             // Read values from inputs
             config.plant.center_x = parseFloat(document.getElementById('plantCenterX').value);
             config.plant.center_y = parseFloat(document.getElementById('plantCenterY').value);
@@ -625,31 +690,29 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
             simSettings.sampleAngular = parseInt(document.getElementById('sampleAngular').value);
             simSettings.sampleVertical = parseInt(document.getElementById('sampleVertical').value);
 
-            // Save and recalculate
+            // Save and recalculate (the plot updates when the results arrive)
             saveConfigToStorage();
             recalculateAllResults();
-            updatePlot(currentIndex);
-        }}
+        }
 
-        function resetConfig() {{
-            if (confirm('Reset all settings to default values?')) {{
+        function resetConfig() {
+            if (confirm('Reset all settings to default values?')) {
                 localStorage.removeItem(STORAGE_KEY);
                 config = JSON.parse(JSON.stringify(originalConfig));
                 ensureWallDrawLengths(config);
-                simSettings = {{ sampleAngular: 8, sampleVertical: 3 }};
+                simSettings = { sampleAngular: 8, sampleVertical: 3 };
                 populateConfigFields();
                 recalculateAllResults();
-                updatePlot(currentIndex);
-            }}
-        }}
+            }
+        }
 
-        function exportConfig() {{
-            const exportData = {{
+        function exportConfig() {
+            const exportData = {
                 plant: config.plant,
-                windows: config.windows.map(w => {{
+                windows: config.windows.map(w => {
                     const axis = getWindowAxis(w);
                     const position = getWindowPositionAlongWall(w);
-                    const base = {{
+                    const base = {
                         id: w.id,
                         wall_id: w.wall_id,
                         axis,
@@ -658,162 +721,254 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
                         height: w.height,
                         wall_thickness: w.wall_thickness,
                         position_along_wall: position,
-                    }};
+                    };
 
-                    if (axis === 'x') {{
+                    if (axis === 'x') {
                         base.x_position = position;
-                    }} else if (axis === 'y') {{
+                    } else if (axis === 'y') {
                         base.y_position = position;
-                    }}
+                    }
 
                     return base;
-                }}),
+                }),
                 simulation: simSettings,
                 walls: config.walls,
-            }};
-            const blob = new Blob([JSON.stringify(exportData, null, 2)], {{ type: 'application/json' }});
+            };
+            const blob = new Blob([JSON.stringify(exportData, null, 2)], { type: 'application/json' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
             a.download = 'sun_plant_config.json';
             a.click();
             URL.revokeObjectURL(url);
-        }}
+        }
 
         // ========== RAY CASTING (JavaScript implementation) ==========
 
-        function generatePlantSamplePoints() {{
-            const points = [];
+        // Sample points packed as x, y, z triples in one Float64Array
+        function generatePlantSamplePoints() {
             const plant = config.plant;
             const nAngular = simSettings.sampleAngular;
             const nVertical = simSettings.sampleVertical;
+            const points = new Float64Array(3 * nAngular * nVertical);
 
-            for (let vi = 0; vi < nVertical; vi++) {{
+            let p = 0;
+            for (let vi = 0; vi < nVertical; vi++) {
                 const z = plant.z_min + (plant.z_max - plant.z_min) * (vi + 0.5) / nVertical;
-                for (let ai = 0; ai < nAngular; ai++) {{
+                for (let ai = 0; ai < nAngular; ai++) {
                     const angle = (2 * Math.PI * ai) / nAngular;
                     const x = plant.center_x + plant.radius * Math.cos(angle);
                     const y = plant.center_y + plant.radius * Math.sin(angle);
-                    points.push([x, y, z]);
-                }}
-            }}
+                    points[p++] = x;
+                    points[p++] = y;
+                    points[p++] = z;
+                }
+            }
             return points;
-        }}
-
-        function sunDirectionFromAngles(azimuthDeg, elevationDeg) {{
-            // In the simplified coordinate system, wall 1 is at y=0 along X-axis.
-            // The real-world wall 1 has outward normal at wall1_normal_azimuth.
-            // We need to rotate the sun azimuth from ENU (real-world) into simplified coords.
-            // The rotation angle is: wall1_normal_azimuth - 180° (inward normal direction).
-            const wall1NormalAz = config.walls?.find(w => w.id === 'wall_1')?.normal_azimuth || 210;
-            const rotation = wall1NormalAz - 180;  // 210 - 180 = 30° for default config
-            const rotatedAzimuth = azimuthDeg - rotation;
-
-            const azRad = rotatedAzimuth * Math.PI / 180;
-            const elRad = elevationDeg * Math.PI / 180;
-            return [
-                Math.sin(azRad) * Math.cos(elRad),
-                Math.cos(azRad) * Math.cos(elRad),
-                Math.sin(elRad)
-            ];
-        }}
-
-        function rayIntersectsWindowTunnel(origin, direction, window) {{
-            // Check sun is on correct side of wall
-            const azRad = window.wall_normal_azimuth * Math.PI / 180;
-            const wallNormal = [Math.sin(azRad), Math.cos(azRad), 0];
-            const sunSideCheck = direction[0]*wallNormal[0] + direction[1]*wallNormal[1];
-            if (sunSideCheck <= 0) return false;
-
-            // Determine plane axis (wall 1 at y=0, wall 2 at x=0)
-            const axis = getWindowAxis(window);
-            const isWall1 = axis === 'x';
-            const planeAxis = isWall1 ? 1 : 0;
-            const innerCoord = window.center ? window.center[planeAxis] : 0;
-            const thickness = window.wall_thickness || 0;
-            const outerCoord = innerCoord - thickness;
-            const centerAlongWall = getWindowCenterAlongWall(window);
-
-            // Helper to check intersection with axis-aligned plane
-            function checkPlaneIntersection(planeCoord) {{
-                if (Math.abs(direction[planeAxis]) < 1e-10) return null;
-                const t = (planeCoord - origin[planeAxis]) / direction[planeAxis];
-                if (t < 0) return null;
-
-                const intersection = [
-                    origin[0] + t * direction[0],
-                    origin[1] + t * direction[1],
-                    origin[2] + t * direction[2]
-                ];
-
-                // Check bounds
-                const localH = isWall1
-                    ? intersection[0] - centerAlongWall
-                    : intersection[1] - centerAlongWall;
-                const localV = intersection[2] - window.center[2];
+        }
 
-                const withinH = Math.abs(localH) <= window.width / 2 + 1e-6;
-                const withinV = Math.abs(localV) <= window.height / 2 + 1e-6;
+        // Per-window constants of the tunnel test, computed once per
+        // recalculation instead of once per ray
+        function packWindows(windows) {
+            return windows.map(window => {
+                const azRad = window.wall_normal_azimuth * Math.PI / 180;
+                // Determine plane axis (wall 1 at y=0, wall 2 at x=0)
+                const isWall1 = getWindowAxis(window) === 'x';
+                const planeAxis = isWall1 ? 1 : 0;
+                const innerCoord = window.center ? window.center[planeAxis] : 0;
+                const thickness = window.wall_thickness || 0;
+                return {
+                    id: window.id,
+                    normalX: Math.sin(azRad),
+                    normalY: Math.cos(azRad),
+                    isWall1,
+                    innerCoord,
+                    outerCoord: innerCoord - thickness,
+                    thickness,
+                    centerAlongWall: getWindowCenterAlongWall(window),
+                    centerZ: window.center[2],
+                    halfWidth: window.width / 2 + 1e-6,
+                    halfHeight: window.height / 2 + 1e-6,
+                };
+            });
+        }
 
-                return withinH && withinV ? intersection : null;
-            }}
+        // Whether the ray (origin o, direction d, passed as scalars so the hot
+        // loop allocates nothing) crosses the axis-aligned plane at planeCoord
+        // within the window bounds. Wall 1 windows lie in a y plane and extend
+        // along x; wall 2 windows the reverse.
+        function crossesWindowPlane(ox, oy, oz, dx, dy, dz, w, planeCoord) {
+            const dPlane = w.isWall1 ? dy : dx;
+            if (Math.abs(dPlane) < 1e-10) return false;
+            const t = (planeCoord - (w.isWall1 ? oy : ox)) / dPlane;
+            if (t < 0) return false;
+
+            const localH = w.isWall1
+                ? (ox + t * dx) - w.centerAlongWall
+                : (oy + t * dy) - w.centerAlongWall;
+            const localV = (oz + t * dz) - w.centerZ;
+            return Math.abs(localH) <= w.halfWidth && Math.abs(localV) <= w.halfHeight;
+        }
 
+        // Callers pass only windows on the sunlit side of their wall
+        function rayIntersectsWindowTunnel(ox, oy, oz, dx, dy, dz, w) {
             // Check inner plane
-            const innerHit = checkPlaneIntersection(innerCoord);
-            if (!innerHit) return false;
+            if (!crossesWindowPlane(ox, oy, oz, dx, dy, dz, w, w.innerCoord)) return false;
 
             // If no thickness, single plane is enough
-            if (thickness <= 0) return true;
+            if (w.thickness <= 0) return true;
 
             // Check outer plane for tunnel model
-            const outerHit = checkPlaneIntersection(outerCoord);
-            return outerHit !== null;
-        }}
+            return crossesWindowPlane(ox, oy, oz, dx, dy, dz, w, w.outerCoord);
+        }
 
-        function checkSunHitsPlant(azimuthDeg, elevationDeg) {{
-            if (elevationDeg <= 0) {{
-                return {{ is_hit: false, reason: 'sun_below_horizon', sun_direction: null, window_id: null, hit_points: [] }};
-            }}
+        function checkSunHitsPlant(elevationDeg, sunDir, samplePoints, windows) {
+            if (elevationDeg <= 0) {
+                return { is_hit: false, reason: 'sun_below_horizon', sun_direction: null, window_id: null, hit_points: [] };
+            }
 
-            const sunDir = sunDirectionFromAngles(azimuthDeg, elevationDeg);
-            const samplePoints = generatePlantSamplePoints();
             const hitPoints = [];
             let hitWindowId = null;
 
-            for (const pt of samplePoints) {{
-                for (const window of config.windows) {{
-                    if (rayIntersectsWindowTunnel(pt, sunDir, window)) {{
-                        hitPoints.push(pt);
+            const dx = sunDir[0], dy = sunDir[1], dz = sunDir[2];
+            // The sun side check is the same for every sample point, so windows
+            // facing away from the sun are dropped once per timestamp
+            const liveWindows = windows.filter(w => dx*w.normalX + dy*w.normalY > 0);
+            for (let p = 0; p < samplePoints.length; p += 3) {
+                const ox = samplePoints[p], oy = samplePoints[p + 1], oz = samplePoints[p + 2];
+                for (const window of liveWindows) {
+                    if (rayIntersectsWindowTunnel(ox, oy, oz, dx, dy, dz, window)) {
+                        hitPoints.push([ox, oy, oz]);
                         if (!hitWindowId) hitWindowId = window.id;
                         break;
-                    }}
-                }}
-            }}
+                    }
+                }
+            }
 
-            return {{
+            return {
                 is_hit: hitPoints.length > 0,
                 window_id: hitWindowId,
                 hit_points: hitPoints,
                 sun_direction: sunDir,
                 reason: hitPoints.length === 0 ? 'no_window_path' : null
-            }};
-        }}
+            };
+        }
 
-        function recalculateAllResults() {{
-            results = sunPositions.map(sp => {{
-                const hit = checkSunHitsPlant(sp.azimuth, sp.elevation);
-                return {{
+        function computeAllResults() {
+            // Sample points and window constants are the same for every timestamp
+            const samplePoints = generatePlantSamplePoints();
+            const windows = packWindows(config.windows);
+            return sunPositions.map((sp, i) => {
+                // Directions were computed in Python; copied out so each result
+                // owns a small array rather than a view of the whole buffer
+                const sunDir = Array.from(sunDirections.subarray(3 * i, 3 * i + 3));
+                const hit = checkSunHitsPlant(sp.elevation, sunDir, samplePoints, windows);
+                return {
                     timestamp: sp.timestamp,
                     azimuth: sp.azimuth,
                     elevation: sp.elevation,
                     ...hit
-                }};
-            }});
-        }}
+                };
+            });
+        }
+
+        // ========== BACKGROUND RECALCULATION (Web Worker) ==========
+
+        // Hit points travel as one flat Float64Array whose buffer is
+        // transferred, rather than structured-cloning every point array
+        function packResults(jobId, results) {
+            let total = 0;
+            results.forEach(r => total += r.hit_points.length);
+            const coords = new Float64Array(total * 3);
+            let k = 0;
+            results.forEach(r => {
+                r.hit_points.forEach(pt => { coords.set(pt, k); k += 3; });
+                r.n_hit_points = r.hit_points.length;
+                delete r.hit_points;
+            });
+            return { message: { jobId, results, coords }, transfer: [coords.buffer] };
+        }
+
+        function unpackResults(results, coords) {
+            let k = 0;
+            results.forEach(r => {
+                r.hit_points = [];
+                for (let i = 0; i < r.n_hit_points; i++, k += 3) {
+                    r.hit_points.push(coords.subarray(k, k + 3));
+                }
+                delete r.n_hit_points;
+            });
+            return results;
+        }
+
+        // The worker runs the ray-casting functions above, serialized from
+        // this page, against the config and settings sent with each request
+        const WORKER_SOURCE = [
+            getWindowAxis, getWindowPositionAlongWall, getWindowCenterAlongWall,
+            generatePlantSamplePoints, packWindows, crossesWindowPlane, rayIntersectsWindowTunnel,
+            checkSunHitsPlant, computeAllResults, packResults,
+        ].map(fn => fn.toString()).join('\\n\\n') + `
+
+        let config, simSettings, sunPositions, sunDirections;
+        self.onmessage = e => {
+            if (e.data.sunPositions) {
+                sunPositions = e.data.sunPositions;
+                sunDirections = e.data.sunDirections;
+                return;
+            }
+            config = e.data.config;
+            simSettings = e.data.simSettings;
+            const packed = packResults(e.data.jobId, computeAllResults());
+            self.postMessage(packed.message, packed.transfer);
+        };`;
+
+        let worker = null;
+        let latestJobId = 0;
+
+        function startWorker() {
+            try {
+                const blob = new Blob([WORKER_SOURCE], { type: 'application/javascript' });
+                worker = new Worker(URL.createObjectURL(blob));
+            } catch (e) {
+                console.warn('Web Worker unavailable, recalculating on the main thread:', e);
+                worker = null;
+                return;
+            }
+            worker.onmessage = e => {
+                // Drop results of requests superseded by a later apply
+                if (e.data.jobId !== latestJobId) return;
+                results = unpackResults(e.data.results, e.data.coords);
+                updatePlot(currentIndex);
+            };
+            worker.onerror = e => {
+                console.warn('Web Worker failed, recalculating on the main thread:', e.message);
+                worker.terminate();
+                worker = null;
+                recalculateAllResults();
+            };
+            worker.postMessage({
+                sunPositions: sunPositions.map(sp => ({
+                    timestamp: sp.timestamp, azimuth: sp.azimuth, elevation: sp.elevation
+                })),
+                sunDirections,
+            });
+        }
+
+        // Recompute every timestamp off the main thread, then redraw
+        function recalculateAllResults() {
+            sceneTraces = {};
+            if (!worker) {
+                results = computeAllResults();
+                updatePlot(currentIndex);
+                return;
+            }
+            latestJobId += 1;
+            worker.postMessage({ jobId: latestJobId, config, simSettings });
+        }
 
         // Check if sun shines into a window based on wall normal azimuth
         // Sun shines through window if sun direction is opposite to outward normal
-        function windowReceivesSun(wallNormalAzimuth, sunDir) {{
+        function windowReceivesSun(wallNormalAzimuth, sunDir) {
             if (!sunDir) return false;
 
             // Convert wall normal azimuth to direction vector
@@ -831,52 +986,70 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
             // Or: sunDir dot outwardNormal > 0 (sun is on the outside)
             const dot = sunDir[0] * outwardNormal[0] + sunDir[1] * outwardNormal[1];
             return dot > 0.1;  // Sun is in direction of outward normal (outside the room)
-        }}
-
-        function createPlotData(index) {{
-            const result = results[index];
-            const traces = [];
-            const sunDir = result.sun_direction;
-            const wallThickness = config.windows[0]?.wall_thickness || 0;
-            const wallHeight = 6;
-
-            // Get wall info
-            const wall1 = config.walls?.find(w => w.id === 'wall_1') || {{ normal_azimuth: 210, thickness: 0.3, draw_length: 15 }};
-            const wall2 = config.walls?.find(w => w.id === 'wall_2') || {{ normal_azimuth: 300, thickness: 0.3, draw_length: 15 }};
-            const wall1Length = typeof wall1.draw_length === 'number' ? wall1.draw_length : 15;
-            const wall2Length = typeof wall2.draw_length === 'number' ? wall2.draw_length : 15;
+        }
 
-            // ========== COMPASS (ENU: X=East, Y=North) ==========
-            const compassCenter = [ROOM_OFFSET_X - 3, ROOM_OFFSET_Y - 3, 0.1];
-            const compassLen = 2;
+        // ========== COMPASS (ENU: X=East, Y=North) ==========
+        // Drawn identically in every frame, so the traces are built once
+        const compassCenter = [ROOM_OFFSET_X - 3, ROOM_OFFSET_Y - 3, 0.1];
+        const compassLen = 2;
+        const COMPASS_TRACES = [
             // North arrow (Y+ direction)
-            traces.push({{
+            {
                 type: 'scatter3d',
                 mode: 'lines+text',
                 x: [compassCenter[0], compassCenter[0]],
                 y: [compassCenter[1], compassCenter[1] + compassLen],
                 z: [compassCenter[2], compassCenter[2]],
-                line: {{ color: 'red', width: 5 }},
+                line: { color: 'red', width: 5 },
                 text: ['', 'N'],
                 textposition: 'top center',
-                textfont: {{ size: 16, color: 'red' }},
+                textfont: { size: 16, color: 'red' },
                 name: 'North',
                 showlegend: false,
-            }});
+            },
             // East arrow (X+ direction)
-            traces.push({{
+            {
                 type: 'scatter3d',
                 mode: 'lines+text',
                 x: [compassCenter[0], compassCenter[0] + compassLen],
                 y: [compassCenter[1], compassCenter[1]],
                 z: [compassCenter[2], compassCenter[2]],
-                line: {{ color: 'blue', width: 5 }},
+                line: { color: 'blue', width: 5 },
                 text: ['', 'E'],
                 textposition: 'middle right',
-                textfont: {{ size: 16, color: 'blue' }},
+                textfont: { size: 16, color: 'blue' },
                 name: 'East',
                 showlegend: false,
-            }});
+            },
+        ];
+
+        // Walls, floor and plant depend only on the applied config, so they are
+        // built on the first frame after a change and reused while sliding
+        let sceneTraces = {};
+
+        // Appends segment a-b to a polyline trace; the null breaks the line so
+        // many disjoint segments share a single trace
+        function pushSegment(trace, a, b) {
+            trace.x.push(a[0], b[0], null);
+            trace.y.push(a[1], b[1], null);
+            trace.z.push(a[2], b[2], null);
+        }
+
+        function createPlotData(index) {
+            const result = results[index];
+            const traces = [];
+            const sunDir = result.sun_direction;
+            const wallThickness = config.windows[0]?.wall_thickness || 0;
+            const wallHeight = 6;
+
+            // Get wall info
+            const wall1 = config.walls?.find(w => w.id === 'wall_1') || { normal_azimuth: 210, thickness: 0.3, draw_length: 15 };
+            const wall2 = config.walls?.find(w => w.id === 'wall_2') || { normal_azimuth: 300, thickness: 0.3, draw_length: 15 };
+            const wall1Length = typeof wall1.draw_length === 'number' ? wall1.draw_length : 15;
+            const wall2Length = typeof wall2.draw_length === 'number' ? wall2.draw_length : 15;
+
+            // Compass does not change between frames
+            traces.push(...COMPASS_TRACES);
 
             // ========== WALL GEOMETRY (simplified axis-aligned) ==========
             // In the simplified coordinate system:
@@ -903,133 +1076,138 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
             const cornerX = plantVizX - plant.center_x;
             const cornerY = plantVizY - plant.center_y;
 
-            // ========== WALL 1 (at y=0, runs along X) ==========
-            // Wall runs from corner along wall1Dir
-            const w1InnerStart = [cornerX, cornerY];
-            const w1InnerEnd = [cornerX + wall1Length * wall1Dir[0], cornerY + wall1Length * wall1Dir[1]];
-            const w1OuterStart = [cornerX - wallThickness * wall1Normal[0], cornerY - wallThickness * wall1Normal[1]];
-            const w1OuterEnd = [w1InnerEnd[0] - wallThickness * wall1Normal[0], w1InnerEnd[1] - wallThickness * wall1Normal[1]];
-
-            // Inner surface
-            traces.push({{
-                type: 'mesh3d',
-                x: [w1InnerStart[0], w1InnerEnd[0], w1InnerEnd[0], w1InnerStart[0]],
-                y: [w1InnerStart[1], w1InnerEnd[1], w1InnerEnd[1], w1InnerStart[1]],
-                z: [0, 0, wallHeight, wallHeight],
-                i: [0, 0],
-                j: [1, 2],
-                k: [2, 3],
-                color: 'rgba(180, 180, 180, 0.3)',
-                name: 'Wall 1 Inner',
-                showlegend: false,
-                hoverinfo: 'name',
-            }});
+            if (!sceneTraces.room) {
+                sceneTraces.room = [];
 
-            // Outer surface
-            if (wallThickness > 0) {{
-                traces.push({{
+                // ========== WALL 1 (at y=0, runs along X) ==========
+                // Wall runs from corner along wall1Dir
+                const w1InnerStart = [cornerX, cornerY];
+                const w1InnerEnd = [cornerX + wall1Length * wall1Dir[0], cornerY + wall1Length * wall1Dir[1]];
+                const w1OuterStart = [cornerX - wallThickness * wall1Normal[0], cornerY - wallThickness * wall1Normal[1]];
+                const w1OuterEnd = [w1InnerEnd[0] - wallThickness * wall1Normal[0], w1InnerEnd[1] - wallThickness * wall1Normal[1]];
+
+                // Inner surface
+                sceneTraces.room.push({
                     type: 'mesh3d',
-                    x: [w1OuterStart[0], w1OuterEnd[0], w1OuterEnd[0], w1OuterStart[0]],
-                    y: [w1OuterStart[1], w1OuterEnd[1], w1OuterEnd[1], w1OuterStart[1]],
+                    x: [w1InnerStart[0], w1InnerEnd[0], w1InnerEnd[0], w1InnerStart[0]],
+                    y: [w1InnerStart[1], w1InnerEnd[1], w1InnerEnd[1], w1InnerStart[1]],
                     z: [0, 0, wallHeight, wallHeight],
                     i: [0, 0],
                     j: [1, 2],
                     k: [2, 3],
-                    color: 'rgba(150, 150, 150, 0.2)',
-                    name: 'Wall 1 Outer',
+                    color: 'rgba(180, 180, 180, 0.3)',
+                    name: 'Wall 1 Inner',
                     showlegend: false,
                     hoverinfo: 'name',
-                }});
-            }}
+                });
 
-            // Wall 1 frame
-            traces.push({{
-                type: 'scatter3d',
-                mode: 'lines',
-                x: [w1InnerStart[0], w1InnerEnd[0], w1InnerEnd[0], w1InnerStart[0], w1InnerStart[0]],
-                y: [w1InnerStart[1], w1InnerEnd[1], w1InnerEnd[1], w1InnerStart[1], w1InnerStart[1]],
-                z: [0, 0, wallHeight, wallHeight, 0],
-                line: {{ color: '#2E7D32', width: 4 }},
-                name: `Wall 1 (azimuth ${{wall1.normal_azimuth}}°)`,
-                showlegend: true,
-            }});
-
-            // ========== WALL 2 (normal at azimuth ${{wall2.normal_azimuth}}°) ==========
-            // Wall runs from corner along wall2Dir
-            const w2InnerStart = [cornerX, cornerY];
-            const w2InnerEnd = [cornerX + wall2Length * wall2Dir[0], cornerY + wall2Length * wall2Dir[1]];
-            const w2OuterStart = [cornerX - wallThickness * wall2Normal[0], cornerY - wallThickness * wall2Normal[1]];
-            const w2OuterEnd = [w2InnerEnd[0] - wallThickness * wall2Normal[0], w2InnerEnd[1] - wallThickness * wall2Normal[1]];
-
-            // Inner surface
-            traces.push({{
-                type: 'mesh3d',
-                x: [w2InnerStart[0], w2InnerEnd[0], w2InnerEnd[0], w2InnerStart[0]],
-                y: [w2InnerStart[1], w2InnerEnd[1], w2InnerEnd[1], w2InnerStart[1]],
-                z: [0, 0, wallHeight, wallHeight],
-                i: [0, 0],
-                j: [1, 2],
-                k: [2, 3],
-                color: 'rgba(180, 180, 180, 0.3)',
-                name: 'Wall 2 Inner',
-                showlegend: false,
-                hoverinfo: 'name',
-            }});
+                // Outer surface
+                if (wallThickness > 0) {
+                    sceneTraces.room.push({
+                        type: 'mesh3d',
+                        x: [w1OuterStart[0], w1OuterEnd[0], w1OuterEnd[0], w1OuterStart[0]],
+                        y: [w1OuterStart[1], w1OuterEnd[1], w1OuterEnd[1], w1OuterStart[1]],
+                        z: [0, 0, wallHeight, wallHeight],
+                        i: [0, 0],
+                        j: [1, 2],
+                        k: [2, 3],
+                        color: 'rgba(150, 150, 150, 0.2)',
+                        name: 'Wall 1 Outer',
+                        showlegend: false,
+                        hoverinfo: 'name',
+                    });
+                }
 
-            // Outer surface
-            if (wallThickness > 0) {{
-                traces.push({{
+                // Wall 1 frame
+                sceneTraces.room.push({
+                    type: 'scatter3d',
+                    mode: 'lines',
+                    x: [w1InnerStart[0], w1InnerEnd[0], w1InnerEnd[0], w1InnerStart[0], w1InnerStart[0]],
+                    y: [w1InnerStart[1], w1InnerEnd[1], w1InnerEnd[1], w1InnerStart[1], w1InnerStart[1]],
+                    z: [0, 0, wallHeight, wallHeight, 0],
+                    line: { color: '#2E7D32', width: 4 },
+                    name: `Wall 1 (azimuth ${wall1.normal_azimuth}°)`,
+                    showlegend: true,
+                });
+
+                // ========== WALL 2 (normal at azimuth ${wall2.normal_azimuth}°) ==========
+                // Wall runs from corner along wall2Dir
+                const w2InnerStart = [cornerX, cornerY];
+                const w2InnerEnd = [cornerX + wall2Length * wall2Dir[0], cornerY + wall2Length * wall2Dir[1]];
+                const w2OuterStart = [cornerX - wallThickness * wall2Normal[0], cornerY - wallThickness * wall2Normal[1]];
+                const w2OuterEnd = [w2InnerEnd[0] - wallThickness * wall2Normal[0], w2InnerEnd[1] - wallThickness * wall2Normal[1]];
+
+                // Inner surface
+                sceneTraces.room.push({
                     type: 'mesh3d',
-                    x: [w2OuterStart[0], w2OuterEnd[0], w2OuterEnd[0], w2OuterStart[0]],
-                    y: [w2OuterStart[1], w2OuterEnd[1], w2OuterEnd[1], w2OuterStart[1]],
+                    x: [w2InnerStart[0], w2InnerEnd[0], w2InnerEnd[0], w2InnerStart[0]],
+                    y: [w2InnerStart[1], w2InnerEnd[1], w2InnerEnd[1], w2InnerStart[1]],
                     z: [0, 0, wallHeight, wallHeight],
                     i: [0, 0],
                     j: [1, 2],
                     k: [2, 3],
-                    color: 'rgba(150, 150, 150, 0.2)',
-                    name: 'Wall 2 Outer',
+                    color: 'rgba(180, 180, 180, 0.3)',
+                    name: 'Wall 2 Inner',
                     showlegend: false,
                     hoverinfo: 'name',
-                }});
-            }}
+                });
 
-            // Wall 2 frame
-            traces.push({{
-                type: 'scatter3d',
-                mode: 'lines',
-                x: [w2InnerStart[0], w2InnerEnd[0], w2InnerEnd[0], w2InnerStart[0], w2InnerStart[0]],
-                y: [w2InnerStart[1], w2InnerEnd[1], w2InnerEnd[1], w2InnerStart[1], w2InnerStart[1]],
-                z: [0, 0, wallHeight, wallHeight, 0],
-                line: {{ color: '#1565C0', width: 4 }},
-                name: `Wall 2 (azimuth ${{wall2.normal_azimuth}}°)`,
-                showlegend: true,
-            }});
-
-            // ========== FLOOR (triangular, bounded by rotated walls) ==========
-            // Floor is the area between the two walls and extending inward
-            const floorCorners = [
-                [cornerX, cornerY],  // Corner
-                [w1InnerEnd[0], w1InnerEnd[1]],  // End of wall 1
-                [cornerX + wall1Length * wall1Dir[0] + wall2Length * wall2Dir[0],
-                 cornerY + wall1Length * wall1Dir[1] + wall2Length * wall2Dir[1]],  // Far corner
-                [w2InnerEnd[0], w2InnerEnd[1]],  // End of wall 2
-            ];
-            traces.push({{
-                type: 'mesh3d',
-                x: floorCorners.map(c => c[0]),
-                y: floorCorners.map(c => c[1]),
-                z: [0, 0, 0, 0],
-                i: [0, 0],
-                j: [1, 2],
-                k: [2, 3],
-                color: 'rgba(200, 180, 160, 0.3)',
-                name: 'Floor',
-                showlegend: false,
-                hoverinfo: 'name',
-            }});
+                // Outer surface
+                if (wallThickness > 0) {
+                    sceneTraces.room.push({
+                        type: 'mesh3d',
+                        x: [w2OuterStart[0], w2OuterEnd[0], w2OuterEnd[0], w2OuterStart[0]],
+                        y: [w2OuterStart[1], w2OuterEnd[1], w2OuterEnd[1], w2OuterStart[1]],
+                        z: [0, 0, wallHeight, wallHeight],
+                        i: [0, 0],
+                        j: [1, 2],
+                        k: [2, 3],
+                        color: 'rgba(150, 150, 150, 0.2)',
+                        name: 'Wall 2 Outer',
+                        showlegend: false,
+                        hoverinfo: 'name',
+                    });
+                }
+
+                // Wall 2 frame
+                sceneTraces.room.push({
+                    type: 'scatter3d',
+                    mode: 'lines',
+                    x: [w2InnerStart[0], w2InnerEnd[0], w2InnerEnd[0], w2InnerStart[0], w2InnerStart[0]],
+                    y: [w2InnerStart[1], w2InnerEnd[1], w2InnerEnd[1], w2InnerStart[1], w2InnerStart[1]],
+                    z: [0, 0, wallHeight, wallHeight, 0],
+                    line: { color: '#1565C0', width: 4 },
+                    name: `Wall 2 (azimuth ${wall2.normal_azimuth}°)`,
+                    showlegend: true,
+                });
+
+                // ========== FLOOR (triangular, bounded by rotated walls) ==========
+                // Floor is the area between the two walls and extending inward
+                const floorCorners = [
+                    [cornerX, cornerY],  // Corner
+                    [w1InnerEnd[0], w1InnerEnd[1]],  // End of wall 1
+                    [cornerX + wall1Length * wall1Dir[0] + wall2Length * wall2Dir[0],
+                     cornerY + wall1Length * wall1Dir[1] + wall2Length * wall2Dir[1]],  // Far corner
+                    [w2InnerEnd[0], w2InnerEnd[1]],  // End of wall 2
+                ];
+                sceneTraces.room.push({
+                    type: 'mesh3d',
+                    x: floorCorners.map(c => c[0]),
+                    y: floorCorners.map(c => c[1]),
+                    z: [0, 0, 0, 0],
+                    i: [0, 0],
+                    j: [1, 2],
+                    k: [2, 3],
+                    color: 'rgba(200, 180, 160, 0.3)',
+                    name: 'Floor',
+                    showlegend: false,
+                    hoverinfo: 'name',
+                });
+            }
+            traces.push(...sceneTraces.room);
 
             // Add windows with sun exposure coloring (positioned on rotated walls)
-            config.windows.forEach((w, i) => {{
+            config.windows.forEach((w, i) => {
                 const axis = getWindowAxis(w);
                 const isWall1 = axis === 'x';
                 const receivesSun = windowReceivesSun(w.wall_normal_azimuth, sunDir);
@@ -1037,15 +1215,15 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
 
                 // Colors: bright yellow/orange if receiving sun, otherwise default
                 let color, frameColor, outerColor;
-                if (receivesSun) {{
+                if (receivesSun) {
                     color = 'rgba(255, 200, 50, 0.8)';  // Bright yellow - sun hitting
                     outerColor = 'rgba(255, 220, 100, 0.6)';
                     frameColor = '#FF8C00';  // Dark orange frame
-                }} else {{
+                } else {
                     color = isWall1 ? 'rgba(144, 238, 144, 0.5)' : 'rgba(135, 206, 235, 0.5)';
                     outerColor = isWall1 ? 'rgba(144, 238, 144, 0.3)' : 'rgba(135, 206, 235, 0.3)';
                     frameColor = isWall1 ? '#228B22' : '#4169E1';
-                }}
+                }
 
                 // Window position along wall (from config x_position or y_position)
                 const wallPos = getWindowCenterAlongWall(w);
@@ -1076,7 +1254,7 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
                 ]);
 
                 // Inner window mesh
-                traces.push({{
+                traces.push({
                     type: 'mesh3d',
                     x: innerCorners.map(c => c[0]),
                     y: innerCorners.map(c => c[1]),
@@ -1088,27 +1266,27 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
                     name: w.id + ' (inner)',
                     showlegend: false,
                     hoverinfo: 'name',
-                }});
+                });
 
                 // Inner window frame
                 const innerFrameX = [...innerCorners.map(c => c[0]), innerCorners[0][0]];
                 const innerFrameY = [...innerCorners.map(c => c[1]), innerCorners[0][1]];
                 const innerFrameZ = [...innerCorners.map(c => c[2]), innerCorners[0][2]];
-                traces.push({{
+                traces.push({
                     type: 'scatter3d',
                     mode: 'lines',
                     x: innerFrameX,
                     y: innerFrameY,
                     z: innerFrameZ,
-                    line: {{ color: frameColor, width: 3 }},
+                    line: { color: frameColor, width: 3 },
                     name: w.id,
                     showlegend: i === 0,
-                }});
+                });
 
                 // Outer window (only if wall has thickness)
-                if (thickness > 0) {{
+                if (thickness > 0) {
                     // Outer window mesh
-                    traces.push({{
+                    traces.push({
                         type: 'mesh3d',
                         x: outerCorners.map(c => c[0]),
                         y: outerCorners.map(c => c[1]),
@@ -1120,85 +1298,90 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
                         name: w.id + ' (outer)',
                         showlegend: false,
                         hoverinfo: 'name',
-                    }});
+                    });
 
                     // Outer window frame
                     const outerFrameX = [...outerCorners.map(c => c[0]), outerCorners[0][0]];
                     const outerFrameY = [...outerCorners.map(c => c[1]), outerCorners[0][1]];
                     const outerFrameZ = [...outerCorners.map(c => c[2]), outerCorners[0][2]];
-                    traces.push({{
+                    traces.push({
                         type: 'scatter3d',
                         mode: 'lines',
                         x: outerFrameX,
                         y: outerFrameY,
                         z: outerFrameZ,
-                        line: {{ color: frameColor, width: 2, dash: 'dot' }},
+                        line: { color: frameColor, width: 2, dash: 'dot' },
                         name: w.id + ' outer frame',
                         showlegend: false,
-                    }});
+                    });
 
                     // Tunnel edges (connect inner to outer corners)
-                    for (let ci = 0; ci < 4; ci++) {{
-                        traces.push({{
-                            type: 'scatter3d',
-                            mode: 'lines',
-                            x: [innerCorners[ci][0], outerCorners[ci][0]],
-                            y: [innerCorners[ci][1], outerCorners[ci][1]],
-                            z: [innerCorners[ci][2], outerCorners[ci][2]],
-                            line: {{ color: frameColor, width: 1 }},
-                            showlegend: false,
-                            hoverinfo: 'skip',
-                        }});
-                    }}
-                }}
-            }});
-
-            // Add plant cylinder
-            // Plant is positioned at the room offset center (plantVizX, plantVizY)
-            // This was calculated earlier: corner + plant.center = plantViz position
-            const plantX = plantVizX;
-            const plantY = plantVizY;
-            const nPts = 20;
-            const theta = Array.from({{length: nPts}}, (_, i) => 2 * Math.PI * i / nPts);
-
-            // Bottom circle
-            const xBottom = theta.map(t => plantX + plant.radius * Math.cos(t));
-            const yBottom = theta.map(t => plantY + plant.radius * Math.sin(t));
-            const zBottom = theta.map(() => plant.z_min);
-
-            // Top circle
-            const xTop = theta.map(t => plantX + plant.radius * Math.cos(t));
-            const yTop = theta.map(t => plantY + plant.radius * Math.sin(t));
-            const zTop = theta.map(() => plant.z_max);
-
-            // Combine for mesh
-            const allX = [...xBottom, ...xTop];
-            const allY = [...yBottom, ...yTop];
-            const allZ = [...zBottom, ...zTop];
-
-            const iIdx = [], jIdx = [], kIdx = [];
-            for (let idx = 0; idx < nPts; idx++) {{
-                const next = (idx + 1) % nPts;
-                iIdx.push(idx, next);
-                jIdx.push(next, next + nPts);
-                kIdx.push(idx + nPts, idx + nPts);
-            }}
-
-            traces.push({{
-                type: 'mesh3d',
-                x: allX,
-                y: allY,
-                z: allZ,
-                i: iIdx,
-                j: jIdx,
-                k: kIdx,
-                color: 'rgba(34, 139, 34, 0.8)',
-                name: 'Plant',
-                showlegend: true,
-            }});
+                    const tunnelEdges = {
+                        type: 'scatter3d',
+                        mode: 'lines',
+                        x: [], y: [], z: [],
+                        line: { color: frameColor, width: 1 },
+                        showlegend: false,
+                        hoverinfo: 'skip',
+                    };
+                    for (let ci = 0; ci < 4; ci++) {
+                        pushSegment(tunnelEdges, innerCorners[ci], outerCorners[ci]);
+                    }
+                    traces.push(tunnelEdges);
+                }
+            });
+
+            if (!sceneTraces.plant) {
+                sceneTraces.plant = [];
+
+                // Add plant cylinder
+                // Plant is positioned at the room offset center (plantVizX, plantVizY)
+                // This was calculated earlier: corner + plant.center = plantViz position
+                const plantX = plantVizX;
+                const plantY = plantVizY;
+                const nPts = 20;
+                const theta = Array.from({length: nPts}, (_, i) => 2 * Math.PI * i / nPts);
+
+                // Bottom circle
+                const xBottom = theta.map(t => plantX + plant.radius * Math.cos(t));
+                const yBottom = theta.map(t => plantY + plant.radius * Math.sin(t));
+                const zBottom = theta.map(() => plant.z_min);
+
+                // Top circle
+                const xTop = theta.map(t => plantX + plant.radius * Math.cos(t));
+                const yTop = theta.map(t => plantY + plant.radius * Math.sin(t));
+                const zTop = theta.map(() => plant.z_max);
+
+                // Combine for mesh
+                const allX = [...xBottom, ...xTop];
+                const allY = [...yBottom, ...yTop];
+                const allZ = [...zBottom, ...zTop];
+
+                const iIdx = [], jIdx = [], kIdx = [];
+                for (let idx = 0; idx < nPts; idx++) {
+                    const next = (idx + 1) % nPts;
+                    iIdx.push(idx, next);
+                    jIdx.push(next, next + nPts);
+                    kIdx.push(idx + nPts, idx + nPts);
+                }
+
+                sceneTraces.plant.push({
+                    type: 'mesh3d',
+                    x: allX,
+                    y: allY,
+                    z: allZ,
+                    i: iIdx,
+                    j: jIdx,
+                    k: kIdx,
+                    color: 'rgba(34, 139, 34, 0.8)',
+                    name: 'Plant',
+                    showlegend: true,
+                });
+            }
+            traces.push(...sceneTraces.plant);
 
             // Helper function to find ray-window intersection (with rotated walls)
-            function rayWindowIntersection(origin, direction, window) {{
+            function rayWindowIntersection(origin, direction, window) {
                 // Get actual wall normal from config azimuth
                 const azRad = window.wall_normal_azimuth * Math.PI / 180;
                 const normal = [Math.sin(azRad), Math.cos(azRad), 0];
@@ -1231,16 +1414,42 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
                     origin[1] + t * direction[1],
                     origin[2] + t * direction[2]
                 ];
-            }}
+            }
 
             // Draw sun rays from far away through windows that receive sunlight
-            if (result.sun_direction) {{
+            if (result.sun_direction) {
                 const sunDir = result.sun_direction;
                 const sunDist = 80;
                 const roomCenter = [ROOM_OFFSET_X + 8, ROOM_OFFSET_Y + 8, 5];
 
+                // One trace per ray style, holding the segments of every window
+                const incomingRays = {
+                    type: 'scatter3d',
+                    mode: 'lines',
+                    x: [], y: [], z: [],
+                    line: { color: 'rgba(255, 215, 0, 0.6)', width: 3 },
+                    name: 'Sun ray (incoming)',
+                    showlegend: true,
+                };
+                const roomRays = {
+                    type: 'scatter3d',
+                    mode: 'lines',
+                    x: [], y: [], z: [],
+                    line: { color: '#FFD700', width: 4 },
+                    name: 'Sunlight in room',
+                    showlegend: true,
+                };
+                const entryPoints = {
+                    type: 'scatter3d',
+                    mode: 'markers',
+                    x: [], y: [], z: [],
+                    marker: { size: 6, color: '#FF6600', symbol: 'circle' },
+                    name: '',
+                    showlegend: false,
+                };
+
                 // Draw rays through each window that receives sun
-                config.windows.forEach((w, wIdx) => {{
+                config.windows.forEach(w => {
                     const receivesSunRay = windowReceivesSun(w.wall_normal_azimuth, sunDir);
                     if (!receivesSunRay) return;
 
@@ -1272,97 +1481,77 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
                     ];
 
                     // Only draw up to floor level (z >= 0)
-                    if (roomEnd[2] < 0) {{
+                    if (roomEnd[2] < 0) {
                         const t = windowCenter[2] / (windowCenter[2] - roomEnd[2]);
                         roomEnd[0] = windowCenter[0] + t * (roomEnd[0] - windowCenter[0]);
                         roomEnd[1] = windowCenter[1] + t * (roomEnd[1] - windowCenter[1]);
                         roomEnd[2] = 0;
-                    }}
+                    }
+
+                    // Incoming ray from sun to window (bright yellow), the ray
+                    // passing through the window into the room (brighter), and
+                    // where the light enters the window
+                    pushSegment(incomingRays, sunStart, windowCenter);
+                    pushSegment(roomRays, windowCenter, roomEnd);
+                    entryPoints.x.push(windowCenter[0]);
+                    entryPoints.y.push(windowCenter[1]);
+                    entryPoints.z.push(windowCenter[2]);
+                });
+
+                if (entryPoints.x.length > 0) {
+                    traces.push(incomingRays, roomRays, entryPoints);
+                }
 
-                    // Draw the incoming ray from sun to window (bright yellow)
-                    traces.push({{
-                        type: 'scatter3d',
-                        mode: 'lines',
-                        x: [sunStart[0], windowCenter[0]],
-                        y: [sunStart[1], windowCenter[1]],
-                        z: [sunStart[2], windowCenter[2]],
-                        line: {{ color: 'rgba(255, 215, 0, 0.6)', width: 3 }},
-                        name: wIdx === 0 ? 'Sun ray (incoming)' : '',
-                        showlegend: wIdx === 0,
-                    }});
-
-                    // Draw ray passing through window into room (brighter)
-                    traces.push({{
+                // Also draw rays to plant hit points if plant is hit
+                if (result.is_hit && result.hit_points) {
+                    const hitWindow = config.windows.find(w => w.id === result.window_id);
+                    const plantRays = {
                         type: 'scatter3d',
                         mode: 'lines',
-                        x: [windowCenter[0], roomEnd[0]],
-                        y: [windowCenter[1], roomEnd[1]],
-                        z: [windowCenter[2], roomEnd[2]],
-                        line: {{ color: '#FFD700', width: 4 }},
-                        name: wIdx === 0 ? 'Sunlight in room' : '',
-                        showlegend: wIdx === 0,
-                    }});
-
-                    // Mark where light enters window
-                    traces.push({{
+                        x: [], y: [], z: [],
+                        line: { color: '#FF4500', width: 5 },
+                        name: 'Ray hitting plant',
+                        showlegend: true,
+                    };
+                    const plantHits = {
                         type: 'scatter3d',
                         mode: 'markers',
-                        x: [windowCenter[0]],
-                        y: [windowCenter[1]],
-                        z: [windowCenter[2]],
-                        marker: {{ size: 6, color: '#FF6600', symbol: 'circle' }},
-                        name: '',
-                        showlegend: false,
-                    }});
-                }});
-
-                // Also draw rays to plant hit points if plant is hit
-                if (result.is_hit && result.hit_points) {{
-                    const hitWindow = config.windows.find(w => w.id === result.window_id);
-
-                    result.hit_points.forEach((pt, i) => {{
-                        if (i < 3) {{ // Limit rays shown
+                        x: [], y: [], z: [],
+                        marker: { size: 8, color: '#FF0000', symbol: 'diamond' },
+                        name: 'Plant hit',
+                        showlegend: true,
+                    };
+
+                    result.hit_points.forEach((pt, i) => {
+                        if (i < 3) { // Limit rays shown
                             // Convert hit point from ENU to visualization coordinates
                             const ptOffset = [pt[0] + cornerX, pt[1] + cornerY, pt[2]];
 
                             // Find window intersection for this ray
                             let windowPt = null;
-                            if (hitWindow) {{
+                            if (hitWindow) {
                                 windowPt = rayWindowIntersection(ptOffset, sunDir, hitWindow);
-                            }}
-
-                            if (windowPt) {{
-                                // Draw ray from window to plant (showing light hitting plant)
-                                traces.push({{
-                                    type: 'scatter3d',
-                                    mode: 'lines',
-                                    x: [windowPt[0], ptOffset[0]],
-                                    y: [windowPt[1], ptOffset[1]],
-                                    z: [windowPt[2], ptOffset[2]],
-                                    line: {{ color: '#FF4500', width: 5 }},
-                                    name: i === 0 ? 'Ray hitting plant' : '',
-                                    showlegend: i === 0,
-                                }});
-
-                                // Mark hit point on plant
-                                traces.push({{
-                                    type: 'scatter3d',
-                                    mode: 'markers',
-                                    x: [ptOffset[0]],
-                                    y: [ptOffset[1]],
-                                    z: [ptOffset[2]],
-                                    marker: {{ size: 8, color: '#FF0000', symbol: 'diamond' }},
-                                    name: i === 0 ? 'Plant hit' : '',
-                                    showlegend: i === 0,
-                                }});
-                            }}
-                        }}
-                    }});
-                }}
-            }}
+                            }
+
+                            if (windowPt) {
+                                // Ray from window to plant (showing light hitting
+                                // plant) and the hit point on the plant
+                                pushSegment(plantRays, windowPt, ptOffset);
+                                plantHits.x.push(ptOffset[0]);
+                                plantHits.y.push(ptOffset[1]);
+                                plantHits.z.push(ptOffset[2]);
+                            }
+                        }
+                    });
+
+                    if (plantHits.x.length > 0) {
+                        traces.push(plantRays, plantHits);
+                    }
+                }
+            }
 
             // Add sun indicator - far away so rays appear parallel (from "infinity")
-            if (result.sun_direction) {{
+            if (result.sun_direction) {
                 const sunDir = result.sun_direction;
                 // Sun very far away - rays will appear nearly parallel
                 const sunDist = 80;
@@ -1374,104 +1563,110 @@ def build_interactive_html(config: Config, results: list[dict], date_str: str =
                 ];
 
                 // Sun marker (larger since it's further away)
-                traces.push({{
+                traces.push({
                     type: 'scatter3d',
                     mode: 'markers',
                     x: [sunPos[0]],
                     y: [sunPos[1]],
                     z: [sunPos[2]],
-                    marker: {{ size: 25, color: '#FFD700', symbol: 'circle',
-                              line: {{ color: '#FFA500', width: 3 }} }},
-                    name: `Sun (El: ${{result.elevation.toFixed(0)}}°)`,
+                    marker: { size: 25, color: '#FFD700', symbol: 'circle',
+                              line: { color: '#FFA500', width: 3 } },
+                    name: `Sun (El: ${result.elevation.toFixed(0)}°)`,
                     showlegend: true,
-                }});
+                });
 
                 // Draw line from room center toward sun to show direction
-                traces.push({{
+                traces.push({
                     type: 'scatter3d',
                     mode: 'lines',
                     x: [roomCenter[0], sunPos[0]],
                     y: [roomCenter[1], sunPos[1]],
                     z: [roomCenter[2], sunPos[2]],
-                    line: {{ color: 'rgba(255, 215, 0, 0.4)', width: 3, dash: 'dot' }},
+                    line: { color: 'rgba(255, 215, 0, 0.4)', width: 3, dash: 'dot' },
                     name: 'Sun direction',
                     showlegend: false,
-                }});
-            }}
+                });
+            }
 
             return traces;
-        }}
+        }
 
-        function updatePlot(index) {{
+        function updatePlot(index) {
             const result = results[index];
+            if (!result) return;  // First results still being computed
             const traces = createPlotData(index);
 
             // Update info displays
             document.getElementById('currentTime').textContent = result.timestamp;
             document.getElementById('sunInfo').textContent =
-                `Sun: Az ${{result.azimuth.toFixed(0)}}°, El ${{result.elevation.toFixed(0)}}°`;
+                `Sun: Az ${result.azimuth.toFixed(0)}°, El ${result.elevation.toFixed(0)}°`;
 
             const statusEl = document.getElementById('statusDisplay');
-            if (result.is_hit) {{
+            if (result.is_hit) {
                 statusEl.textContent = '☀️ SUNLIGHT HITTING PLANT';
                 statusEl.className = 'status hit';
-                document.getElementById('windowInfo').textContent = `Through: ${{result.window_id}}`;
+                document.getElementById('windowInfo').textContent = `Through: ${result.window_id}`;
                 const totalSamples = simSettings.sampleAngular * simSettings.sampleVertical;
                 const hitCount = result.hit_points ? result.hit_points.length : 0;
-                document.getElementById('hitPointsInfo').textContent = `Hits: ${{hitCount}}/${{totalSamples}} (${{Math.round(100*hitCount/totalSamples)}}%)`;
-            }} else {{
+                document.getElementById('hitPointsInfo').textContent = `Hits: ${hitCount}/${totalSamples} (${Math.round(100*hitCount/totalSamples)}%)`;
+            } else {
                 statusEl.textContent = 'No direct sunlight';
                 statusEl.className = 'status miss';
                 document.getElementById('windowInfo').textContent = '';
                 document.getElementById('hitPointsInfo').textContent = '';
-            }}
+            }
 
-            Plotly.react('plot3d', traces, {{
-                scene: {{
-                    xaxis: {{ title: 'X (meters)', range: [-30, 120] }},
-                    yaxis: {{ title: 'Y (meters)', range: [-30, 120] }},
-                    zaxis: {{ title: 'Z (meters)', range: [0, 80] }},
+            Plotly.react('plot3d', traces, {
+                scene: {
+                    xaxis: { title: 'X (meters)', range: [-30, 120] },
+                    yaxis: { title: 'Y (meters)', range: [-30, 120] },
+                    zaxis: { title: 'Z (meters)', range: [0, 80] },
                     aspectmode: 'cube',
-                    camera: {{
-                        eye: {{ x: 1.2, y: 1.2, z: 0.7 }}
-                    }}
-                }},
-                title: `Sun-Plant Simulation - ${{result.timestamp}}`,
+                    camera: {
+                        eye: { x: 1.2, y: 1.2, z: 0.7 }
+                    }
+                },
+                title: `Sun-Plant Simulation - ${result.timestamp}`,
                 showlegend: true,
-                legend: {{ x: 0.02, y: 0.98 }},
-            }});
-        }}
+                legend: { x: 0.02, y: 0.98 },
+            });
+        }
 
         // Initialize
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             // Load saved config from localStorage
             loadConfigFromStorage();
 
             // Populate form fields with current config
             populateConfigFields();
 
-            // Calculate initial results with current config
+            // Calculate initial results with current config; the first
+            // plot is drawn when they arrive
+            startWorker();
             recalculateAllResults();
 
             const slider = document.getElementById('timeSlider');
 
-            slider.addEventListener('input', function() {{
+            // Slider events can outpace rendering; draw at most once per frame
+            let plotPending = false;
+            slider.addEventListener('input', function() {
                 currentIndex = parseInt(this.value);
-                updatePlot(currentIndex);
-            }});
+                if (plotPending) return;
+                plotPending = true;
+                requestAnimationFrame(() => {
+                    plotPending = false;
+                    updatePlot(currentIndex);
+                });
+            });
 
             // Auto-apply on Enter key in inputs
-            document.querySelectorAll('.config-field input').forEach(input => {{
-                input.addEventListener('keypress', function(e) {{
+            document.querySelectorAll('.config-field input').forEach(input => {
+                input.addEventListener('keypress', function(e) {
                     if (e.key === 'Enter') applyConfig();
-                }});
-            }});
+                });
+            });
 
-            // Initial plot
-            updatePlot(0);
-        }});
+        });
     </script>
 </body>
-</html>'''
-
-    return html
+</html>''')
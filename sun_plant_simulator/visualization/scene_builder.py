@@ -10,7 +10,7 @@ from typing import Optional
 import numpy as np
 import plotly.graph_objects as go
 
-from ..core.geometry import sun_direction_from_angles
+from ..core.geometry import sun_direction_from_angles_cached
 from ..core.models import Config, HitResult, Plant, Window
 
 
@@ -28,9 +28,7 @@ def create_window_mesh(window: Window, color: str = "lightblue", opacity: float
     corners = window.get_corners()
 
     # Extract coordinates
-    x = [c[0] for c in corners]
-    y = [c[1] for c in corners]
-    z = [c[2] for c in corners]
+    x, y, z = corners.T.tolist()
 
     # Define two triangles for the rectangle
     return go.Mesh3d(
@@ -58,13 +56,10 @@ def create_window_frame(window: Window, color: str = "blue", width: int = 3) ->
     Returns:
         Plotly Scatter3d trace.
     """
-    corners = window.get_corners()
     # Close the rectangle by repeating the first corner
-    corners.append(corners[0])
+    corners = window.get_corners()[[0, 1, 2, 3, 0]]
 
-    x = [c[0] for c in corners]
-    y = [c[1] for c in corners]
-    z = [c[2] for c in corners]
+    x, y, z = corners.T.tolist()
 
     return go.Scatter3d(
         x=x,
@@ -164,7 +159,7 @@ def create_sun_indicator(
     Returns:
         Plotly Scatter3d trace.
     """
-    sun_dir = sun_direction_from_angles(sun_azimuth_deg, sun_elevation_deg)
+    sun_dir = np.array(sun_direction_from_angles_cached(sun_azimuth_deg, sun_elevation_deg))
     sun_pos = np.array(center) + distance * sun_dir
 
     return go.Scatter3d(
@@ -203,8 +198,6 @@ def create_sun_rays(
         return traces
 
     sun_dir = hit_result.sun_direction
-    hit_points_set = set(tuple(p.tolist()) for p in hit_result.hit_points)
-
     # Draw rays from hit points
     for point in hit_result.hit_points:
         end = point + ray_length * sun_dir
@@ -240,17 +233,25 @@ def create_sample_points_markers(
     Returns:
         Plotly Scatter3d trace.
     """
-    from ..core.hit_test import generate_plant_sample_points
+    from ..core.hit_test import generate_plant_sample_points_array
 
-    points = generate_plant_sample_points(plant, n_angular, n_vertical)
+    points = generate_plant_sample_points_array(plant, n_angular, n_vertical)
 
-    x = [p[0] for p in points]
-    y = [p[1] for p in points]
-    z = [p[2] for p in points]
+    x = points[:, 0].tolist()
+    y = points[:, 1].tolist()
+    z = points[:, 2].tolist()
 
     # Color based on hit status if available
-    if hit_result and hit_result.hit_points:
-        hit_set = set(tuple(p.tolist()) for p in hit_result.hit_points)
+    hit_mask = hit_result.hit_mask if hit_result is not None else None
+    if (
+        hit_mask is not None
+        and len(hit_mask) == len(points)
+        and np.array_equal(points[hit_mask], hit_result.hit_points)
+    ):
+        # Same sampling as the hit test: the mask lines up with the points
+        colors = np.where(hit_mask, "gold", "darkgreen").tolist()
+    elif hit_result and len(hit_result.hit_points):
+        hit_set = set(map(tuple, np.asarray(hit_result.hit_points).tolist()))
         colors = ["gold" if tuple(p.tolist()) in hit_set else "darkgreen" for p in points]
     else:
         colors = ["darkgreen"] * len(points)
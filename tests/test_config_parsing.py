@@ -1,5 +1,8 @@
 """Tests for config loading behavior related to window positions."""
 
+import json
+import os
+
 import numpy as np
 import pytest
 
@@ -102,4 +105,138 @@ def test_legacy_visualization_block_still_applies_globally():
     data = _base_config_dict()
     data["visualization"] = {"wall_length": 22.5}
     config = Config.from_dict(data)
-    assert all(w.draw_length == pytest.approx(22.5) for w in config.walls)
\ No newline at end of file
+    assert all(w.draw_length == pytest.approx(22.5) for w in config.walls)
+
+
+def test_window_soa_is_built_on_load():
+    data = _base_config_dict()
+    data["windows"] = [
+        {
+            "id": "wall1_window",
+            "wall_id": "wall_1",
+            "x_position": 2.0,
+            "width": 1.0,
+            "height": 1.5,
+            "z_bottom": 4.0,
+            "z_top": 5.0,
+        },
+        {
+            "id": "wall2_window",
+            "wall_id": "wall_2",
+            "y_position": 3.0,
+            "width": 0.8,
+            "height": 1.2,
+            "z_bottom": 1.0,
+            "z_top": 2.2,
+        },
+    ]
+
+    config = Config.from_dict(data)
+    soa = config.window_soa
+
+    assert soa.ids == ["wall1_window", "wall2_window"]
+    assert soa.plane_axis.tolist() == [1, 0]
+    assert np.allclose(soa.inner_coord, [0.0, 0.0])
+    assert np.allclose(soa.center_h, [2.5, 3.4])
+    assert np.allclose(soa.center_z, [4.5, 1.6])
+    assert np.allclose(soa.half_width, [0.5, 0.4])
+    assert np.allclose(soa.thickness, [0.3, 0.25])
+    normals = np.stack([soa.normal_x, soa.normal_y, soa.normal_z], axis=1)
+    assert np.allclose(normals, [w.normal for w in config.windows])
+    assert soa.normal_x.flags.c_contiguous and soa.normal_x.dtype == np.float64
+
+    config.windows[0].wall_thickness = 0.0
+    config.refresh_window_soa()
+    assert np.allclose(config.window_soa.thickness, [0.0, 0.25])
+
+
+def test_window_soa_packs_cached_normals():
+    data = _base_config_dict()
+    data["windows"] = [
+        {"id": "w1", "wall_id": "wall_1", "x_position": 2.0, "width": 1.0,
+         "height": 1.0, "z_bottom": 1.0, "z_top": 2.0},
+        {"id": "w2", "wall_id": "wall_2", "y_position": 3.0, "width": 1.0,
+         "height": 1.0, "z_bottom": 1.0, "z_top": 2.0},
+    ]
+    config = Config.from_dict(data)
+    config.refresh_window_soa()
+
+    # Bit-identical to the per-window normals the scalar ray tests use
+    assert config.window_soa.normal_x.tolist() == [w.normal[0] for w in config.windows]
+    assert config.window_soa.normal_y.tolist() == [w.normal[1] for w in config.windows]
+
+
+def test_from_json_file_reloads_after_edit(tmp_path):
+    path = tmp_path / "config.json"
+    data = _base_config_dict()
+    path.write_text(json.dumps(data))
+
+    first = Config.from_json_file(path)
+    second = Config.from_json_file(path)
+    assert first is not second
+    assert second.plant.radius == pytest.approx(0.3)
+
+    data["plant"]["radius"] = 0.45
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+
+    assert Config.from_json_file(path).plant.radius == pytest.approx(0.45)
+
+
+def test_window_frame_is_cached_and_follows_edits():
+    data = _base_config_dict()
+    data["windows"] = [
+        {"id": "w", "wall_id": "wall_1", "position_along_wall": 1.0,
+         "width": 2.0, "height": 1.0, "z_bottom": 1.0, "z_top": 2.0},
+    ]
+    window = Config.from_dict(data).windows[0]
+
+    assert window.normal is window.normal
+    assert not window.normal.flags.writeable
+    assert window.z_bottom == pytest.approx(1.0)
+    assert window.half_width == pytest.approx(1.0)
+
+    window.wall_normal_azimuth = 90.0
+    window.height = 3.0
+    np.testing.assert_allclose(window.normal, [1.0, 0.0, 0.0], atol=1e-12)
+    np.testing.assert_allclose(window.horizontal_axis, [0.0, 1.0, 0.0], atol=1e-12)
+    assert window.z_top == pytest.approx(3.0)
+    np.testing.assert_allclose(window.get_corners()[:, 2], [0.0, 0.0, 3.0, 3.0])
+
+
+def test_window_corners_array():
+    data = _base_config_dict()
+    data["windows"] = [
+        {"id": "w", "wall_id": "wall_1", "position_along_wall": 1.0,
+         "width": 2.0, "height": 1.0, "z_bottom": 1.0, "z_top": 2.0},
+    ]
+    window = Config.from_dict(data).windows[0]
+
+    corners = window.get_corners()
+    assert corners.shape == (4, 3)
+    assert not corners.flags.writeable
+    np.testing.assert_allclose(corners[:, 2], [1.0, 1.0, 2.0, 2.0])
+    np.testing.assert_allclose(np.linalg.norm(corners[1] - corners[0]), 2.0)
+    as_list = window.get_corners(as_list=True)
+    assert len(as_list) == 4
+    np.testing.assert_array_equal(np.array(as_list), corners)
+
+
+def test_windows_on_one_wall_share_frame_vectors():
+    data = _base_config_dict()
+    data["windows"] = [
+        {"id": "a", "wall_id": "wall_1", "position_along_wall": 1.0,
+         "width": 1.0, "height": 1.0, "z_bottom": 1.0, "z_top": 2.0},
+        {"id": "b", "wall_id": "wall_1", "position_along_wall": 3.0,
+         "width": 1.0, "height": 1.0, "z_bottom": 1.0, "z_top": 2.0},
+        {"id": "c", "wall_id": "wall_2", "position_along_wall": 1.0,
+         "width": 1.0, "height": 1.0, "z_bottom": 1.0, "z_top": 2.0},
+    ]
+    a, b, c = Config.from_dict(data).windows
+
+    assert a.normal is b.normal and a.horizontal_axis is b.horizontal_axis
+    assert a.normal is not c.normal
+
+    b.wall_normal_azimuth = 300.0
+    assert b.normal is c.normal
+    np.testing.assert_allclose(a.normal, [np.sin(np.radians(210)), np.cos(np.radians(210)), 0.0])
@@ -0,0 +1,68 @@
+"""Tests for the coordinate conversion helpers."""
+
+import numpy as np
+import pytest
+
+from sun_plant_simulator.core.coordinates import (
+    position_from_wall_distances,
+    position_from_wall_distances_array,
+    wall_distances_from_position,
+    wall_distances_from_position_array,
+    wall_normal_to_inward_direction,
+)
+
+
+class TestWallNormalToInwardDirection:
+    """Tests for wall_normal_to_inward_direction function."""
+
+    def test_south_facing_wall_points_north(self):
+        """A wall facing South (180 deg) has its room to the North."""
+        dx, dy = wall_normal_to_inward_direction(180)
+
+        assert dx == pytest.approx(0.0)
+        assert dy == pytest.approx(1.0)
+
+
+class TestPositionFromWallDistances:
+    """Tests for position_from_wall_distances function."""
+
+    def test_axis_aligned_walls(self):
+        """With walls facing South and West, distances map directly to y and x."""
+        x, y = position_from_wall_distances(1.5, 2.0, 180, 270, corner_x=1.0, corner_y=1.0)
+
+        assert x == pytest.approx(3.0)
+        assert y == pytest.approx(2.5)
+
+
+class TestWallDistancesFromPosition:
+    """Tests for wall_distances_from_position function."""
+
+    @pytest.mark.parametrize("dist1,dist2", [(1.5, 2.0), (0.0, 3.2), (4.1, 0.7)])
+    def test_roundtrip(self, dist1, dist2):
+        """Converting distances to x/y and back should give the inputs."""
+        x, y = position_from_wall_distances(dist1, dist2, 210, 307, corner_x=1.0, corner_y=-2.0)
+        d1, d2 = wall_distances_from_position(x, y, 210, 307, corner_x=1.0, corner_y=-2.0)
+
+        assert d1 == pytest.approx(dist1)
+        assert d2 == pytest.approx(dist2)
+
+    def test_parallel_walls_raise(self):
+        """Parallel walls do not define a unique position."""
+        with pytest.raises(np.linalg.LinAlgError):
+            wall_distances_from_position(1.0, 1.0, 210, 210)
+
+
+class TestArrayVersions:
+    """The batch helpers must agree with the scalar conversions."""
+
+    def test_match_scalar_versions(self):
+        dist1 = np.array([0.5, 1.5, 3.0])
+        dist2 = np.array([2.0, 0.1, 4.4])
+
+        xs, ys = position_from_wall_distances_array(dist1, dist2, 210, 307, 1.0, 2.0)
+        for d1, d2, x, y in zip(dist1, dist2, xs, ys):
+            assert (x, y) == position_from_wall_distances(d1, d2, 210, 307, 1.0, 2.0)
+
+        back1, back2 = wall_distances_from_position_array(xs, ys, 210, 307, 1.0, 2.0)
+        for x, y, d1, d2 in zip(xs, ys, back1, back2):
+            assert (d1, d2) == wall_distances_from_position(x, y, 210, 307, 1.0, 2.0)
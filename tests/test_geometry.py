@@ -5,11 +5,20 @@ import math
 import numpy as np
 import pytest
 
+from sun_plant_simulator.core import geometry
 from sun_plant_simulator.core.geometry import (
     angle_between_vectors,
     angles_from_sun_direction,
+    cross,
+    dot,
     normalize,
+    project_onto_plane,
+    sun_direction_components,
     sun_direction_from_angles,
+    sun_direction_from_angles_cached,
+    sun_direction_from_angles_array,
+    sun_direction_simplified,
+    sun_direction_simplified_cached,
 )
 
 
@@ -68,6 +77,59 @@ class TestSunDirectionFromAngles:
                 assert abs(length - 1.0) < 1e-10, f"Non-unit vector at az={az}, el={el}"
 
 
+class TestSunDirectionFromAnglesArray:
+    """Tests for the vectorized sun_direction_from_angles_array function."""
+
+    def test_matches_scalar_version(self):
+        """Each row should equal the scalar conversion of the same angles."""
+        azimuths = np.array([0, 45, 90, 180, 270, 359.5])
+        elevations = np.array([0, 10, 30, 45, 60, 89])
+
+        directions = sun_direction_from_angles_array(azimuths, elevations)
+
+        assert directions.shape == (6, 3)
+        for row, az, el in zip(directions, azimuths, elevations):
+            np.testing.assert_array_almost_equal(row, sun_direction_from_angles(az, el))
+
+
+class TestSunDirectionComponents:
+    """Tests for the tuple-returning sun_direction_components function."""
+
+    def test_matches_array_version(self):
+        """Components should equal the array returned by sun_direction_from_angles."""
+        components = sun_direction_components(135, 25)
+
+        assert isinstance(components, tuple)
+        assert components == tuple(sun_direction_from_angles(135, 25))
+
+
+class TestSunDirectionFromAnglesCached:
+    """Tests for the quantized, memoized sun direction."""
+
+    def test_close_to_exact_direction(self):
+        """Rounding to 0.01° keeps the direction within ~1e-4 of the exact one."""
+        cached = sun_direction_from_angles_cached(123.456, 34.567)
+
+        np.testing.assert_allclose(cached, sun_direction_from_angles(123.456, 34.567), atol=3e-4)
+        assert cached == sun_direction_components(123.46, 34.57)
+
+    def test_nearby_inputs_share_entry(self):
+        """Angles that round to the same 0.01° reuse the cached tuple."""
+        assert sun_direction_from_angles_cached(10.001, 20.002) is sun_direction_from_angles_cached(10.002, 20.001)
+
+
+class TestSunDirectionSimplifiedCached:
+    """Tests for the exact-key memoized simplified sun direction."""
+
+    def test_bit_identical_and_read_only(self):
+        """Cached vectors equal the uncached ones exactly and cannot be modified."""
+        cached = sun_direction_simplified_cached(123.456, 34.567, 210.0)
+
+        np.testing.assert_array_equal(cached, sun_direction_simplified(123.456, 34.567, 210.0))
+        assert cached is sun_direction_simplified_cached(123.456, 34.567, 210.0)
+        assert not cached.flags.writeable
+
+
 class TestAnglesFromSunDirection:
     """Tests for angles_from_sun_direction function."""
 
@@ -140,3 +202,35 @@ class TestAngleBetweenVectors:
         a = np.array([1.0, 0.0, 0.0])
         b = np.array([1.0, 1.0, 0.0])
         assert abs(angle_between_vectors(a, b) - 45.0) < 1e-10
+
+    def test_nearly_parallel_vectors(self):
+        """Tiny angles are resolved rather than rounded to zero."""
+        a = np.array([1.0, 0.0, 0.0])
+        b = np.array([1.0, 1e-9, 0.0])
+        assert angle_between_vectors(a, b) == pytest.approx(math.degrees(1e-9), rel=1e-6)
+
+    def test_zero_vector_raises(self):
+        """Zero-length input has no defined angle."""
+        with pytest.raises(ValueError):
+            angle_between_vectors(np.zeros(3), np.array([1.0, 0.0, 0.0]))
+
+
+class TestScalarVectorHelpers:
+    """The scalar 3-vector fast path must agree with NumPy."""
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_matches_numpy(self, monkeypatch, fast):
+        monkeypatch.setattr(geometry, "FAST_SCALAR", fast)
+        a = np.array([0.3, -1.2, 2.5])
+        b = np.array([1.1, 0.4, -0.7])
+
+        assert dot(a, b) == pytest.approx(np.dot(a, b))
+        np.testing.assert_allclose(cross(a, b), np.cross(a, b))
+        np.testing.assert_allclose(normalize(a), a / np.linalg.norm(a))
+
+        projected = project_onto_plane(a, b)
+        assert np.dot(projected, b) == pytest.approx(0.0, abs=1e-12)
+
+    def test_accepts_tuples(self):
+        assert dot((1.0, 2.0, 3.0), (4.0, 5.0, 6.0)) == 32.0
+        np.testing.assert_array_equal(cross((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)), [0.0, 0.0, 1.0])
@@ -4,10 +4,14 @@ import numpy as np
 import pytest
 
 from sun_plant_simulator.core.hit_test import (
+    _plant_sample_points,
     check_sun_hits_plant,
+    check_sun_hits_plant_batch,
     generate_plant_sample_points,
+    generate_plant_sample_points_array,
+    get_detailed_hit_info,
 )
-from sun_plant_simulator.core.models import Plant, Window
+from sun_plant_simulator.core.models import Plant, Window, WindowsSoA
 
 
 def create_test_plant(
@@ -85,6 +89,43 @@ class TestGeneratePlantSamplePoints:
         assert mid_center[2] == pytest.approx((plant.z_min + plant.z_max) / 2)
 
 
+    def test_array_matches_list(self):
+        """Array form should contain the same points in the same order."""
+        plant = create_test_plant(center_x=1, center_y=2, radius=0.4)
+        points = generate_plant_sample_points(plant, n_angular=6, n_vertical=4)
+        array = generate_plant_sample_points_array(plant, n_angular=6, n_vertical=4)
+
+        assert array.shape == (6 * 4 + 2, 3)
+        np.testing.assert_allclose(array, np.array(points))
+
+    def test_single_vertical_division_uses_mid_height(self):
+        """With one vertical division, surface points sit at mid-height."""
+        plant = create_test_plant(z_min=0, z_max=2)
+        array = generate_plant_sample_points_array(plant, n_angular=4, n_vertical=1)
+
+        np.testing.assert_allclose(array[:4, 2], 1.0)
+
+    def test_cached_points_are_shared_and_read_only(self):
+        """Cached points are computed once per geometry and cannot be mutated."""
+        first = _plant_sample_points(create_test_plant(), 8, 3)
+        second = _plant_sample_points(create_test_plant(), 8, 3)
+
+        assert first is second
+        assert not first.flags.writeable
+        np.testing.assert_array_equal(first, generate_plant_sample_points_array(create_test_plant()))
+        assert _plant_sample_points(create_test_plant(radius=0.5), 8, 3) is not first
+
+    def test_cached_points_follow_plant_edits(self):
+        """Changing the plant geometry drops the points memoized on the instance."""
+        plant = create_test_plant()
+        before = _plant_sample_points(plant, 8, 3)
+        plant.center_x = 2.0
+
+        after = _plant_sample_points(plant, 8, 3)
+        assert after is not before
+        np.testing.assert_array_equal(after, generate_plant_sample_points_array(plant))
+
+
 class TestCheckSunHitsPlant:
     """Tests for check_sun_hits_plant function."""
 
@@ -150,6 +191,11 @@ class TestCheckSunHitsPlant:
         assert result.window_id == "test_window"
         assert len(result.hit_points) > 0
 
+        # The mask selects the hit points out of the plant's sample points
+        points = generate_plant_sample_points_array(plant)
+        assert result.hit_mask.shape == (len(points),)
+        np.testing.assert_array_equal(points[result.hit_mask], result.hit_points)
+
     def test_no_window_path(self):
         """Test scenario where sun is on wrong side (no window path)."""
         plant = create_test_plant(center_x=5, center_y=3)
@@ -172,6 +218,29 @@ class TestCheckSunHitsPlant:
         assert not result.is_hit
         assert result.reason == "no_window_path"
 
+    def test_results_have_no_instance_dict(self):
+        """HitResult and the geometry models use slots to keep instances small."""
+        result = check_sun_hits_plant(180, -5, create_test_plant(), [])
+
+        for obj in (result, create_test_plant(), create_test_window(center=(0, 0, 1))):
+            assert not hasattr(obj, "__dict__")
+
+    def test_sun_behind_all_walls_skips_sampling(self, monkeypatch):
+        """With the sun behind every wall the result is decided without sample points."""
+        from sun_plant_simulator.core import hit_test
+
+        def fail(*args):
+            raise AssertionError("sample points should not be needed")
+
+        monkeypatch.setattr(hit_test, "_plant_sample_points", fail)
+        window = create_test_window(center=(5, 0, 1.0), wall_normal_azimuth=180)
+
+        result = check_sun_hits_plant(0, 45, create_test_plant(center_x=5, center_y=3), [window])
+
+        assert not result.is_hit
+        assert result.reason == "no_window_path"
+        assert result.sun_direction is not None
+
     def test_sun_direction_returned(self):
         """Check that sun direction is returned in result."""
         plant = create_test_plant(center_x=5, center_y=3)
@@ -265,3 +334,238 @@ class TestMultipleWindows:
 
         assert result.is_hit
         assert result.window_id == "window_west"
+
+
+class TestCheckSunHitsPlantBatch:
+    """Tests for the batched hit test over many sun positions."""
+
+    def test_matches_single_position_results(self):
+        """Every timestamp should give the same HitResult as check_sun_hits_plant."""
+        plant = create_test_plant(center_x=3, center_y=3)
+        windows = [
+            Window(id="window_south", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="window_west", center=np.array([0, 3, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=270),
+        ]
+        azimuths = np.arange(0, 360, 7.5)
+        elevations = np.tile([-5.0, 0.0, 10.0, 30.0, 60.0], len(azimuths) // 5 + 1)[: len(azimuths)]
+
+        batch = check_sun_hits_plant_batch(
+            azimuths, elevations, plant, windows, wall1_normal_azimuth=180
+        )
+
+        assert len(batch) == len(azimuths)
+        assert batch.point_window.dtype == np.int32
+        assert batch.is_hit.any() and not batch.is_hit.all()
+        for i, (az, el) in enumerate(zip(azimuths, elevations)):
+            expected = check_sun_hits_plant(az, el, plant, windows, wall1_normal_azimuth=180)
+            actual = batch.hit_result(i)
+            assert (actual.is_hit, actual.window_id, actual.reason) == (
+                expected.is_hit, expected.window_id, expected.reason
+            )
+            assert batch.hit_counts[i] == len(expected.hit_points)
+            np.testing.assert_array_equal(np.array(actual.hit_points).reshape(-1, 3),
+                                          np.array(expected.hit_points).reshape(-1, 3))
+            if expected.hit_mask is not None:
+                np.testing.assert_array_equal(actual.hit_mask, expected.hit_mask)
+
+    def test_gpu_falls_back_without_cupy(self, monkeypatch):
+        """use_gpu=True without CuPy gives the CPU result."""
+        from sun_plant_simulator.core import hit_test
+
+        monkeypatch.setattr(hit_test, "_CUPY_AVAILABLE", False)
+        plant = create_test_plant(center_x=3, center_y=3)
+        windows = [Window(id="w", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                          wall_normal_azimuth=180, wall_thickness=0.3)]
+        azimuths = np.arange(90, 270, 5.0)
+        elevations = np.full(len(azimuths), 20.0)
+
+        cpu = check_sun_hits_plant_batch(azimuths, elevations, plant, windows,
+                                         wall1_normal_azimuth=180)
+        gpu = check_sun_hits_plant_batch(azimuths, elevations, plant, windows,
+                                         wall1_normal_azimuth=180, use_gpu=True)
+
+        np.testing.assert_array_equal(gpu.point_window, cpu.point_window)
+
+    def test_gpu_matches_cpu(self):
+        """The CuPy path gives the same first-window table as the CPU path."""
+        pytest.importorskip("cupy")
+        plant = create_test_plant(center_x=3, center_y=3)
+        windows = [
+            Window(id="window_south", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="window_west", center=np.array([0, 3, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=270),
+        ]
+        azimuths = np.arange(0, 360, 2.5)
+        elevations = np.tile([10.0, 30.0, 60.0], len(azimuths) // 3)
+
+        cpu = check_sun_hits_plant_batch(azimuths, elevations, plant, windows,
+                                         wall1_normal_azimuth=180)
+        gpu = check_sun_hits_plant_batch(azimuths, elevations, plant, windows,
+                                         wall1_normal_azimuth=180, use_gpu=True)
+
+        assert cpu.is_hit.any()
+        assert gpu.point_window.dtype == np.int32
+        np.testing.assert_array_equal(gpu.point_window, cpu.point_window)
+
+    def test_empty_input(self):
+        """No sun positions gives empty result arrays."""
+        batch = check_sun_hits_plant_batch([], [], create_test_plant(), [])
+
+        assert len(batch) == 0
+        assert batch.point_window.shape[0] == 0
+
+
+class TestGetDetailedHitInfo:
+    """Tests for the per-point diagnostic output."""
+
+    def test_summary_matches_hit_test(self):
+        """Hit flag, window and hit-point count agree with check_sun_hits_plant."""
+        plant = create_test_plant(center_x=3, center_y=3)
+        windows = [
+            Window(id="window_south", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="window_west", center=np.array([0, 3, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=270),
+        ]
+
+        n_hits = 0
+        for azimuth in range(0, 360, 15):
+            details = get_detailed_hit_info(azimuth, 25, plant, windows)
+            expected = check_sun_hits_plant(azimuth, 25, plant, windows, wall1_normal_azimuth=180)
+
+            assert details["is_hit"] == expected.is_hit
+            assert details["window_id"] == expected.window_id
+            assert details["n_hit_points"] == len(expected.hit_points)
+            assert len(details["points"]) == details["n_sample_points"]
+            n_hits += expected.is_hit
+        assert n_hits > 0
+
+    def test_no_windows(self):
+        """Without windows every point is reported with an empty window list."""
+        details = get_detailed_hit_info(180, 30, create_test_plant(), [])
+
+        assert not details["is_hit"]
+        assert details["n_hit_points"] == 0
+        assert all(p["windows"] == [] for p in details["points"])
+
+
+class TestNumbaKernel:
+    """The optional compiled kernel must agree with the NumPy path."""
+
+    def test_kernel_matches_numpy_path(self):
+        pytest.importorskip("numba")
+        from sun_plant_simulator.core._kernels import _rays_hit_any_window, kernel_window_args
+        from sun_plant_simulator.core.ray_casting import rays_intersect_window
+
+        plant = create_test_plant(center_x=3, center_y=3)
+        windows = [
+            Window(id="south", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="west", center=np.array([0, 3, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=270),
+        ]
+        points = generate_plant_sample_points_array(plant)
+        soa = WindowsSoA.from_windows(windows)
+
+        for azimuth in range(0, 360, 15):
+            for elevation in (5, 20, 40):
+                az, el = np.radians(azimuth), np.radians(elevation)
+                sun_dir = np.array([np.sin(az) * np.cos(el), np.cos(az) * np.cos(el), np.sin(el)])
+
+                first = _rays_hit_any_window(points, sun_dir, *kernel_window_args(soa))
+                masks = np.array([rays_intersect_window(points, sun_dir, w) for w in windows])
+                expected = np.where(masks.any(axis=0), masks.argmax(axis=0), -1)
+
+                np.testing.assert_array_equal(first, expected)
+
+    def test_batch_kernel_matches_single_direction_kernel(self):
+        pytest.importorskip("numba")
+        from sun_plant_simulator.core._kernels import (
+            _rays_hit_any_window,
+            _rays_hit_any_window_batch,
+            kernel_window_args,
+        )
+        from sun_plant_simulator.core.geometry import sun_direction_simplified_array
+
+        plant = create_test_plant(center_x=3, center_y=3)
+        soa = WindowsSoA.from_windows([
+            Window(id="south", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="west", center=np.array([0, 3, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=270),
+        ])
+        points = generate_plant_sample_points_array(plant)
+        azimuths, elevations = np.meshgrid(np.arange(0, 360, 10.0), [5.0, 25.0, 50.0])
+        sun_dirs = sun_direction_simplified_array(azimuths.ravel(), elevations.ravel())
+
+        batch = _rays_hit_any_window_batch(points, sun_dirs, *kernel_window_args(soa))
+        single = [_rays_hit_any_window(points, d, *kernel_window_args(soa)) for d in sun_dirs]
+
+        np.testing.assert_array_equal(batch, np.array(single))
+        assert (batch >= 0).any()
+
+    def test_per_ray_kernel_matches_numpy_path(self):
+        pytest.importorskip("numba")
+        from sun_plant_simulator.core._kernels import (
+            _rays_hit_any_window_per_ray,
+            kernel_window_args,
+        )
+        from sun_plant_simulator.core.ray_casting import _rays_through_windows_soa
+
+        soa = WindowsSoA.from_windows([
+            Window(id="south", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="west", center=np.array([0, 3, 1.0]), width=2.0, height=2.0,
+                   wall_normal_azimuth=270),
+        ])
+        rng = np.random.default_rng(6)
+        origins = rng.uniform([1.0, 1.0, 0.0], [5.0, 5.0, 2.0], size=(2000, 3))
+        directions = rng.normal(size=(2000, 3))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+
+        first = _rays_hit_any_window_per_ray(origins, directions, *kernel_window_args(soa))
+        mask = _rays_through_windows_soa(origins, directions, soa, np.arange(len(soa)))
+        expected = np.where(mask.any(axis=1), mask.argmax(axis=1), -1)
+
+        np.testing.assert_array_equal(first, expected)
+        assert (first >= 0).any()
+
+    def test_batches_from_threads_match_serial(self):
+        """The kernels release the GIL; concurrent batches give the serial results."""
+        pytest.importorskip("numba")
+        from concurrent.futures import ThreadPoolExecutor
+
+        from sun_plant_simulator.core import _kernels
+
+        assert _kernels._rays_hit_any_window_batch.targetoptions["nogil"]
+        plant = create_test_plant(center_x=3, center_y=3)
+        windows = [Window(id="south", center=np.array([3, 0, 1.0]), width=2.0, height=2.0,
+                          wall_normal_azimuth=180, wall_thickness=0.3)]
+        azimuths = np.arange(90, 270, 0.5)
+        chunks = [np.full(len(azimuths), el) for el in (10.0, 25.0, 40.0, 55.0)]
+
+        def run(elevations):
+            return check_sun_hits_plant_batch(azimuths, elevations, plant, windows,
+                                              wall1_normal_azimuth=180).point_window
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(pool.map(run, chunks))
+        for elevations, point_window in zip(chunks, threaded):
+            np.testing.assert_array_equal(point_window, run(elevations))
+
+    def test_kernels_not_used_without_numba(self, monkeypatch):
+        from sun_plant_simulator.core import hit_test
+
+        monkeypatch.setattr(hit_test, "_NUMBA_AVAILABLE", False)
+        assert hit_test._compiled_kernels(load=True) is None
+        assert hit_test.load_compiled_kernels() is False
+
+    def test_loaded_kernels_serve_single_positions(self):
+        pytest.importorskip("numba")
+        from sun_plant_simulator.core import hit_test
+
+        assert hit_test.load_compiled_kernels() is True
+        assert hit_test._compiled_kernels(load=False) is not None
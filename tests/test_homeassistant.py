@@ -0,0 +1,111 @@
+"""Tests for the Home Assistant service functions."""
+
+import json
+import os
+import shutil
+
+from sun_plant_simulator.core.hit_test import check_sun_hits_plant
+from sun_plant_simulator.core.models import Config
+from sun_plant_simulator.homeassistant import service
+
+
+class TestLoadConfig:
+    """Tests for the config cache of the service functions."""
+
+    def setup_method(self):
+        service.clear_config_cache()
+
+    def teardown_method(self):
+        service.clear_config_cache()
+
+    def test_edited_file_is_reloaded(self, tmp_path):
+        """Changing the file's contents and mtime loads the new config."""
+        path = tmp_path / "config.json"
+        shutil.copy(service.DEFAULT_CONFIG_PATH, path)
+        first = service.load_config(path)
+        assert service.load_config(path) is first
+
+        data = json.loads(path.read_text())
+        data["plant"]["radius"] = 0.9
+        path.write_text(json.dumps(data))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = service.load_config(path)
+        assert second is not first
+        assert second.plant.radius == 0.9
+
+    def test_keeps_the_most_recent_configs(self, tmp_path):
+        """Only the most recently used configs stay cached."""
+        paths = []
+        for i in range(service._CONFIG_CACHE_SIZE + 1):
+            paths.append(tmp_path / f"config_{i}.json")
+            shutil.copy(service.DEFAULT_CONFIG_PATH, paths[-1])
+        first = service.load_config(paths[0])
+
+        for path in paths[1:]:
+            service.load_config(path)
+
+        assert len(service._config_cache) == service._CONFIG_CACHE_SIZE
+        assert service.load_config(paths[0]) is not first
+
+
+class TestCachedHitTest:
+    """Tests for the rounded-angle hit-test cache."""
+
+    def setup_method(self):
+        service.clear_config_cache()
+
+    def teardown_method(self):
+        service.clear_config_cache()
+
+    def test_nearby_angles_share_a_result(self):
+        """Angles within the same 0.1 degree bin reuse one hit test."""
+        first = service.get_sunlight_details(215.02, 30.04)
+        second = service.get_sunlight_details(214.98, 29.96)
+
+        info = service._cached_hit.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        assert first["is_hit"] == second["is_hit"]
+        # The reported angles are the caller's, not the rounded ones
+        assert (second["sun_azimuth"], second["sun_elevation"]) == (214.98, 29.96)
+
+    def test_matches_hit_test_at_rounded_angles(self):
+        """Cached results equal a direct hit test at the rounded angles."""
+        config = Config.from_json_file(service.DEFAULT_CONFIG_PATH)
+        for azimuth in range(90, 300, 15):
+            expected = check_sun_hits_plant(
+                float(azimuth), 25.0, config.plant, config.windows,
+                n_angular=config.simulation.sample_points_angular,
+                n_vertical=config.simulation.sample_points_vertical,
+            )
+            assert service.check_sunlight(azimuth + 0.03, 24.98) == expected.is_hit
+
+    def test_night_skips_config_and_geometry(self):
+        """Below the horizon the answer comes without loading the config."""
+        assert service.get_sunlight_state(180.0, -12.0) == "below_horizon"
+        assert service.get_sunlight_details(180.0, 0.0)["reason"] == "sun_below_horizon"
+
+        assert len(service._config_cache) == 0
+        assert service._cached_hit.cache_info().currsize == 0
+
+    def test_below_horizon_details_match_service_payload(self):
+        """The config-free night payload is exactly what get_sunlight_details returns."""
+        assert service.get_below_horizon_details(180.0, -12.0) == service.get_sunlight_details(
+            180.0, -12.0
+        )
+        assert len(service._config_cache) == 0
+
+    def test_sun_just_above_horizon_is_not_below_it(self):
+        """Elevations that round to 0.0 are still tested as daytime."""
+        details = service.get_sunlight_details(180.0, 0.03)
+
+        assert details["reason"] == "no_window_path"
+        assert service.get_sunlight_state(180.0, 0.03) == "no_window_path"
+
+    def test_clearing_config_drops_cached_hits(self):
+        """clear_config_cache also empties the hit cache."""
+        service.check_sunlight(180.0, 45.0)
+        service.clear_config_cache()
+
+        assert service._cached_hit.cache_info().currsize == 0
@@ -3,10 +3,17 @@
 import numpy as np
 import pytest
 
-from sun_plant_simulator.core.models import Window
+from sun_plant_simulator.core.models import Window, WindowsSoA
 from sun_plant_simulator.core.ray_casting import (
+    _rays_through_windows_soa,
+    _windows_reachable,
+    ray_hits_any_window,
     ray_intersects_window,
     ray_window_intersection,
+    rays_hit_any_window,
+    rays_intersect_window,
+    rays_window_intersection,
+    specialize_ray_hits_any_window,
 )
 
 
@@ -270,3 +277,330 @@ class TestRayWindowIntersection:
         origin = np.array([6.1, 3, 5])
         result = ray_window_intersection(origin, direction, window)
         assert not result.intersects
+
+    def test_accepts_tuples(self):
+        """Plain tuples give the same result as arrays."""
+        window = Window(
+            id="test",
+            center=np.array([5, 0, 5]),
+            width=2.0,
+            height=2.0,
+            wall_normal_azimuth=180,
+        )
+
+        from_tuples = ray_window_intersection((5.5, 3.0, 5.2), (0.0, -1.0, 0.0), window)
+        from_arrays = ray_window_intersection(np.array([5.5, 3, 5.2]), np.array([0, -1.0, 0]), window)
+
+        assert from_tuples.intersects and from_arrays.intersects
+        assert from_tuples.t == from_arrays.t
+        np.testing.assert_array_equal(from_tuples.point, from_arrays.point)
+
+    def test_follows_edits_to_cached_planes(self):
+        """Reassigning center or wall_thickness moves the cached tunnel planes."""
+        window = create_test_window(center=(5, 0, 5))
+        origin, direction = (4.4, 2.0, 5.0), (0.6, -0.8, 0.0)
+        assert ray_window_intersection(origin, direction, window).intersects
+
+        # Outer face 1 m further out: the slanted ray leaves the opening
+        window.wall_thickness = 1.0
+        assert not ray_window_intersection(origin, direction, window).intersects
+        assert not ray_intersects_window(origin, direction, window)
+
+        window.wall_thickness = 0.0
+        window.center = np.array([5.0, 1.0, 5.0])
+        result = ray_window_intersection(origin, direction, window)
+        assert result.t == pytest.approx(1.25)
+        np.testing.assert_allclose(result.point, [5.15, 1.0, 5.0])
+
+    @pytest.mark.parametrize("thickness", [0.0, 0.3])
+    def test_bool_check_matches_details(self, thickness):
+        """ray_intersects_window agrees with ray_window_intersection."""
+        window = create_test_window(center=(5, 0, 5))
+        window.wall_thickness = thickness
+        rng = np.random.default_rng(4)
+
+        for _ in range(300):
+            origin = rng.uniform([3, 0.5, 3], [7, 4, 7])
+            direction = rng.normal(size=3)
+            direction /= np.linalg.norm(direction)
+            detailed = ray_window_intersection(origin, direction, window)
+            assert ray_intersects_window(origin, direction, window) == detailed.intersects
+            if detailed.intersects:
+                assert detailed.point.shape == (3,)
+
+
+class TestRaysIntersectWindow:
+    """Tests for the batched rays_intersect_window function."""
+
+    @pytest.mark.parametrize("thickness", [0.0, 0.3])
+    def test_matches_scalar_version(self, thickness):
+        """Batched mask should agree with the per-ray scalar test."""
+        window = Window(
+            id="test",
+            center=np.array([5, 0, 5]),
+            width=2.0,
+            height=2.0,
+            wall_normal_azimuth=180,
+            wall_thickness=thickness,
+        )
+        direction = np.array([0.1, -0.9, 0.4])
+        direction = direction / np.linalg.norm(direction)
+
+        xs, ys, zs = np.meshgrid(
+            np.linspace(3, 7, 9), np.linspace(0.5, 4, 5), np.linspace(2, 5, 7)
+        )
+        origins = np.stack([xs.ravel(), ys.ravel(), zs.ravel()], axis=1)
+
+        mask = rays_intersect_window(origins, direction, window)
+        expected = [ray_intersects_window(o, direction, window) for o in origins]
+
+        assert mask.shape == (len(origins),)
+        assert mask.tolist() == expected
+        assert mask.any()
+
+    def test_sun_on_wrong_side(self):
+        """No ray can pass when the sun is behind the wall."""
+        window = Window(
+            id="test",
+            center=np.array([5, 0, 5]),
+            width=2.0,
+            height=2.0,
+            wall_normal_azimuth=180,
+        )
+        origins = np.array([[5.0, 3.0, 5.0], [5.5, 2.0, 4.5]])
+
+        mask = rays_intersect_window(origins, np.array([0.0, 1.0, 0.0]), window)
+        assert not mask.any()
+
+
+class TestRaysWindowIntersection:
+    """Tests for the batched rays_window_intersection function."""
+
+    @pytest.mark.parametrize("thickness", [0.0, 0.3])
+    def test_matches_scalar_version(self, thickness):
+        """Per-ray details should equal those of ray_window_intersection."""
+        window = Window(
+            id="test",
+            center=np.array([5, 0, 5]),
+            width=2.0,
+            height=2.0,
+            wall_normal_azimuth=180,
+            wall_thickness=thickness,
+        )
+        direction = np.array([0.1, -0.9, 0.4])
+        direction = direction / np.linalg.norm(direction)
+        origins = np.array([[5.0, 3.0, 3.8], [4.2, 1.0, 4.6], [9.0, 2.0, 5.0], [5.0, -1.0, 5.0]])
+
+        batch = rays_window_intersection(origins, direction, window)
+
+        for i, origin in enumerate(origins):
+            expected = ray_window_intersection(origin, direction, window)
+            assert batch.intersects[i] == expected.intersects
+            assert batch.has_point[i] == (expected.point is not None)
+            if expected.point is not None:
+                np.testing.assert_array_equal(batch.points[i], expected.point)
+                assert batch.t[i] == expected.t
+                assert batch.local_h[i] == expected.local_h
+                assert batch.local_v[i] == expected.local_v
+        assert batch.intersects.any() and not batch.intersects.all()
+
+
+class TestRaysThroughWindowsSoA:
+    """Tests for the broadcast all-windows tunnel test."""
+
+    def test_matches_per_window_masks(self):
+        """Each column should equal rays_intersect_window for that window."""
+        windows = [
+            Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="west", center=np.array([0, 4, 2]), width=1.0, height=3.0,
+                   wall_normal_azimuth=270),
+        ]
+        soa = WindowsSoA.from_windows(windows)
+        rng = np.random.default_rng(1)
+        origins = rng.uniform([3.0, 2.0, 0.0], [7.0, 6.0, 3.0], size=(40, 3))
+
+        for direction in rng.normal(size=(200, 3)):
+            direction /= np.linalg.norm(direction)
+            mask = _rays_through_windows_soa(origins, direction, soa, np.array([1, 0]))
+            assert mask.shape == (40, 2)
+            np.testing.assert_array_equal(mask[:, 0], rays_intersect_window(origins, direction, windows[1]))
+            np.testing.assert_array_equal(mask[:, 1], rays_intersect_window(origins, direction, windows[0]))
+
+    def test_all_thin_windows_match_per_window_masks(self):
+        """With no thick window the single-plane shortcut gives the same columns."""
+        windows = [
+            Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180),
+            Window(id="west", center=np.array([0, 4, 2]), width=1.0, height=3.0,
+                   wall_normal_azimuth=270),
+        ]
+        soa = WindowsSoA.from_windows(windows)
+        rng = np.random.default_rng(2)
+        origins = rng.uniform([3.0, 2.0, 0.0], [7.0, 6.0, 3.0], size=(40, 3))
+
+        hits = 0
+        for direction in rng.normal(size=(200, 3)):
+            direction /= np.linalg.norm(direction)
+            mask = _rays_through_windows_soa(origins, direction, soa, np.array([0, 1]))
+            for k, window in enumerate(windows):
+                np.testing.assert_array_equal(mask[:, k], rays_intersect_window(origins, direction, window))
+            hits += int(mask.sum())
+        assert hits > 0
+
+    def test_negative_thickness_is_thin_plane(self):
+        """A non-positive wall thickness falls back to the thin-plane test, as in the scalar path."""
+        window = Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                        wall_normal_azimuth=180, wall_thickness=-0.3)
+        soa = WindowsSoA.from_windows([window])
+        origins = np.array([[5.0, 3.0, 3.8], [4.2, 1.0, 4.6], [5.9, 0.2, 5.0]])
+        direction = np.array([0.3, -0.9, 0.4])
+        direction /= np.linalg.norm(direction)
+
+        mask = _rays_through_windows_soa(origins, direction, soa, np.array([0]))
+        expected = [ray_intersects_window(o, direction, window) for o in origins]
+        assert mask[:, 0].tolist() == expected
+        assert any(expected)
+
+
+class TestRayHitsAnyWindow:
+    """Tests for ray_hits_any_window with lists and packed window tables."""
+
+    def test_packed_windows_match_list(self):
+        """The broadcast path reports the same first window as the per-window loop."""
+        windows = [
+            Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="south_wide", center=np.array([5, 0, 5]), width=6.0, height=6.0,
+                   wall_normal_azimuth=180),
+            Window(id="west", center=np.array([0, 4, 2]), width=1.0, height=3.0,
+                   wall_normal_azimuth=270),
+        ]
+        soa = WindowsSoA.from_windows(windows)
+        rng = np.random.default_rng(2)
+
+        seen = set()
+        for _ in range(300):
+            origin = rng.uniform([3.0, 2.0, 0.0], [7.0, 6.0, 3.0])
+            direction = rng.normal(size=3)
+            direction /= np.linalg.norm(direction)
+            expected = ray_hits_any_window(origin, direction, windows)
+            assert ray_hits_any_window(tuple(origin), direction, soa) == expected
+            seen.add(expected[1])
+        assert len(seen - {None}) >= 2
+
+    def test_empty_table(self):
+        """An empty window table never reports a hit."""
+        soa = WindowsSoA.from_windows([])
+        assert ray_hits_any_window((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), soa) == (False, None)
+
+    def test_batched_rays_with_own_directions(self):
+        """rays_hit_any_window gives, per ray, the first window of ray_hits_any_window."""
+        windows = [
+            Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="west", center=np.array([0, 4, 2]), width=1.0, height=3.0,
+                   wall_normal_azimuth=270),
+        ]
+        soa = WindowsSoA.from_windows(windows)
+        rng = np.random.default_rng(3)
+        origins = rng.uniform([3.0, 2.0, 0.0], [7.0, 6.0, 3.0], size=(500, 3))
+        directions = rng.normal(size=(500, 3))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+
+        hit, window_index = rays_hit_any_window(origins, directions, soa)
+
+        ids = [None] + soa.ids
+        for o, d, h, w in zip(origins, directions, hit, window_index):
+            assert ray_hits_any_window(o, d, windows) == (h, ids[w + 1])
+        assert hit.any() and (window_index[~hit] == -1).all()
+
+
+    def test_windows_facing_away_are_skipped(self):
+        """Indices still refer to the full table when earlier windows face away."""
+        soa = WindowsSoA.from_windows([
+            Window(id="north", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=0),
+            Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180),
+        ])
+        origins = np.array([[5.0, 3.0, 5.0], [9.0, 3.0, 5.0]])
+
+        hit, window_index = rays_hit_any_window(origins, np.array([0.0, -1.0, 0.0]), soa)
+
+        np.testing.assert_array_equal(hit, [True, False])
+        np.testing.assert_array_equal(window_index, [1, -1])
+
+    def test_specialized_function_matches_list(self):
+        """The generated per-table function gives ray_hits_any_window's answers."""
+        windows = [
+            Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="south_wide", center=np.array([5, 0, 5]), width=6.0, height=6.0,
+                   wall_normal_azimuth=180),
+            Window(id="west", center=np.array([0, 4, 2]), width=1.0, height=3.0,
+                   wall_normal_azimuth=270),
+        ]
+        soa = WindowsSoA.from_windows(windows)
+        specialized = specialize_ray_hits_any_window(soa)
+        rng = np.random.default_rng(5)
+
+        seen = set()
+        for _ in range(300):
+            origin = rng.uniform([3.0, 2.0, 0.0], [7.0, 6.0, 3.0])
+            direction = rng.normal(size=3)
+            direction /= np.linalg.norm(direction)
+            expected = ray_hits_any_window(origin, direction, windows)
+            assert specialized(origin, direction) == expected
+            seen.add(expected[1])
+        assert len(seen - {None}) >= 2
+
+        # Same constants reuse the generated function; edits produce a new one
+        assert specialize_ray_hits_any_window(WindowsSoA.from_windows(windows)) is specialized
+        windows[0].width = 3.0
+        assert specialize_ray_hits_any_window(WindowsSoA.from_windows(windows)) is not specialized
+
+    def test_specialized_function_without_windows(self):
+        """An empty table gives a function that never reports a hit."""
+        specialized = specialize_ray_hits_any_window(WindowsSoA.from_windows([]))
+        assert specialized((0.0, 0.0, 0.0), (0.0, 0.0, 1.0)) == (False, None)
+
+    def test_direction_count_must_match_origins(self):
+        """Per-ray directions need one row per origin."""
+        soa = WindowsSoA.from_windows([create_test_window()])
+        with pytest.raises(ValueError):
+            rays_hit_any_window(np.zeros((3, 3)), np.tile([0.0, -1.0, 0.0], (2, 1)), soa)
+
+class TestWindowsReachable:
+    """Tests for the bounding-box early-out used by the hit test."""
+
+    def test_never_rejects_a_window_that_is_hit(self):
+        """Culling must be conservative: any window actually hit stays a candidate."""
+        windows = [
+            Window(id="south", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                   wall_normal_azimuth=180, wall_thickness=0.3),
+            Window(id="west", center=np.array([0, 4, 2]), width=1.0, height=3.0,
+                   wall_normal_azimuth=270),
+        ]
+        soa = WindowsSoA.from_windows(windows)
+        origins = np.array([[4.0, 3.0, 1.0], [6.0, 5.0, 2.5], [5.0, 4.0, 4.0]])
+
+        rng = np.random.default_rng(0)
+        directions = rng.normal(size=(500, 3))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+
+        reachable = _windows_reachable(origins, directions, soa)
+        assert reachable.shape == (500, 2)
+        for w_idx, window in enumerate(windows):
+            hit = rays_intersect_window(origins, directions, window).any(axis=1)
+            assert not (hit & ~reachable[:, w_idx]).any()
+        assert not reachable.all()
+
+    def test_window_behind_rays_is_culled(self):
+        """Rays heading away from a window's box cannot reach it."""
+        window = Window(id="test", center=np.array([5, 0, 5]), width=2.0, height=2.0,
+                        wall_normal_azimuth=180)
+        origins = np.array([[5.0, 3.0, 5.0]])
+
+        reachable = _windows_reachable(origins, np.array([0.0, 1.0, 0.0]), WindowsSoA.from_windows([window]))
+        assert reachable.tolist() == [False]
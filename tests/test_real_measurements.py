@@ -289,7 +289,7 @@ class TestMeasurement15h08:
         print(f"  Plant ENU: ({CONFIG.plant.center_x}, {CONFIG.plant.center_y})")
         print(f"  Is hit: {result.is_hit}")
         print(f"  Window: {result.window_id}")
-        print(f"  Hit points: {len(result.hit_points) if result.hit_points else 0}")
+        print(f"  Hit points: {len(result.hit_points)}")
 
         assert result.is_hit, "Plant should receive direct light at 15:08"
 
@@ -0,0 +1,221 @@
+"""Tests for the sun position module."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from sun_plant_simulator.core.sun_position import (
+    calculate_sun_position,
+    calculate_sun_position_array,
+    generate_sun_data_for_date,
+    get_sunrise_sunset,
+    resolve_timezone_offset,
+)
+
+
+class TestCalculateSunPosition:
+    """Tests for calculate_sun_position."""
+
+    def test_midnight_sun_is_in_the_north(self):
+        """Past solar midnight the hour angle wraps, and the sun is still due North."""
+        pos = calculate_sun_position(78.2, 15.6, datetime(2026, 6, 21, 0, 30), timezone_offset=2.0)
+
+        assert pos.elevation_deg > 0
+        assert min(pos.azimuth_deg, 360 - pos.azimuth_deg) < 10
+        assert 0 <= pos.azimuth_deg < 360
+
+    def test_day_of_year_matches_timetuple(self):
+        """The cached day-of-year lookup agrees with datetime, leap years included."""
+        from sun_plant_simulator.core.sun_position import _day_of_year
+
+        for dt in (datetime(2024, 2, 29, 5), datetime(2024, 12, 31), datetime(1900, 3, 1),
+                   datetime(2000, 12, 31, 23, 59), date(2026, 1, 1)):
+            assert _day_of_year(dt) == (dt.timetuple().tm_yday,
+                                        366 if dt.year in (2000, 2024) else 365)
+
+    def test_morning_and_afternoon_sides(self):
+        """The sun is East of South in the morning and West of it in the afternoon."""
+        morning = calculate_sun_position(40.7, -74.0, datetime(2026, 3, 20, 9, 0), -5.0)
+        afternoon = calculate_sun_position(40.7, -74.0, datetime(2026, 3, 20, 15, 0), -5.0)
+
+        assert 90 < morning.azimuth_deg < 180 < afternoon.azimuth_deg < 270
+
+
+class TestCalculateSunPositionArray:
+    """Tests for the batched sun position calculation."""
+
+    def test_matches_scalar_calculation(self):
+        """Each element matches calculate_sun_position, including leap days."""
+        times = [
+            datetime(2024, 2, 29, 6, 15, 30),
+            datetime(2024, 12, 31, 12, 0),
+            datetime(2026, 6, 21, 17, 45),
+            datetime(2026, 1, 1, 23, 59, 59),
+        ]
+        offsets = np.array([-5.0, -5.0, -4.0, 1.0])
+
+        azimuths, elevations = calculate_sun_position_array(28.35, -81.25, times, offsets)
+
+        for t, offset, az, el in zip(times, offsets, azimuths, elevations):
+            expected = calculate_sun_position(28.35, -81.25, t, offset)
+            assert az == pytest.approx(expected.azimuth_deg, abs=1e-9)
+            assert el == pytest.approx(expected.elevation_deg, abs=1e-9)
+
+    def test_accepts_datetime64_array(self):
+        """datetime64 input gives the same positions as datetime objects."""
+        times = np.arange(np.datetime64("2026-03-20T05:00"), np.datetime64("2026-03-20T21:00"),
+                          np.timedelta64(30, "m"))
+
+        from_datetime64 = calculate_sun_position_array(40.0, -74.0, times, -5.0)
+        from_datetimes = calculate_sun_position_array(40.0, -74.0, times.tolist(), -5.0)
+
+        np.testing.assert_array_equal(from_datetime64, from_datetimes)
+
+
+class TestCompiledSunPosition:
+    """Tests for the optional Numba-compiled solar position arithmetic."""
+
+    def test_compiled_core_matches_python(self):
+        """The compiled core gives bit-identical positions."""
+        pytest.importorskip("numba")
+        from sun_plant_simulator.core import _kernels, sun_position
+
+        for lat_rad, day, hour, minute, second, longitude, offset, days in [
+            (0.49, 60, 6, 15, 30, -81.25, -5.0, 366),
+            (-0.6, 355, 12, 0, 0, 151.2, 10.0, 365),
+            (1.2, 172, 23, 59, 59, 18.0, 1.0, 365),
+            (0.0, 80, 12, 0, 0, 0.0, 0.0, 365),
+        ]:
+            eqtime, decl = sun_position._solar_params(day, hour, days)
+            args = (lat_rad, eqtime, decl, hour, minute, second, longitude, offset)
+            assert _kernels._sun_position_core(*args) == sun_position._sun_position_core(*args)
+
+    def test_loaded_kernels_serve_calculate_sun_position(self):
+        """Once the kernels are loaded, calculate_sun_position uses the compiled core."""
+        pytest.importorskip("numba")
+        from sun_plant_simulator.core import _kernels, sun_position
+        from sun_plant_simulator.core.hit_test import load_compiled_kernels
+
+        assert load_compiled_kernels() is True
+        assert sun_position._position_core() is _kernels._sun_position_core
+
+
+class TestDailySolarParams:
+    """Tests for the cached per-hour solar parameters."""
+
+    def test_shared_within_an_hour(self):
+        """Timestamps in the same hour reuse one cache entry."""
+        from sun_plant_simulator.core import sun_position
+
+        sun_position._daily_solar_params.cache_clear()
+        for minute in range(0, 60, 5):
+            calculate_sun_position(28.35, -81.25, datetime(2026, 6, 21, 9, minute), -4.0)
+        calculate_sun_position(28.35, -81.25, datetime(2026, 6, 21, 10, 0), -4.0)
+
+        info = sun_position._daily_solar_params.cache_info()
+        assert (info.misses, info.hits) == (2, 11)
+
+
+class TestGenerateSunDataForDate:
+    """Tests for generate_sun_data_for_date."""
+
+    def test_includes_end_hour_on_whole_steps_only(self):
+        """The end hour is included when the interval lands on it."""
+        on_step = generate_sun_data_for_date(28.35, -81.25, date(2026, 6, 21),
+                                             interval_minutes=30, start_hour=10, end_hour=12)
+        off_step = generate_sun_data_for_date(28.35, -81.25, date(2026, 6, 21),
+                                              interval_minutes=25, start_hour=10, end_hour=12)
+
+        assert [d["timestamp"] for d in on_step] == ["10:00", "10:30", "11:00", "11:30", "12:00"]
+        assert [d["timestamp"] for d in off_step] == ["10:00", "10:25", "10:50", "11:15", "11:40"]
+
+    def test_datetime_input_ignores_time_of_day(self):
+        """A datetime gives the same data as its date, not one shifted by its time."""
+        from_date = generate_sun_data_for_date(28.35, -81.25, date(2024, 6, 21), -4.0)
+        from_datetime = generate_sun_data_for_date(28.35, -81.25, datetime(2024, 6, 21, 15, 30), -4.0)
+
+        assert from_date
+        assert from_datetime == from_date
+
+    def test_timestamps_are_zero_padded(self):
+        """Timestamps keep the strftime("%H:%M") format for single-digit hours and minutes."""
+        data = generate_sun_data_for_date(0.0, 0.0, date(2026, 3, 20), timezone_offset=0.0,
+                                          interval_minutes=5, start_hour=0, end_hour=23)
+
+        expected = [f"{m // 60:02d}:{m % 60:02d}" for m in range(0, 23 * 60 + 1, 5)]
+        timestamps = [d["timestamp"] for d in data]
+        assert "06:05" in timestamps
+        assert timestamps == [t for t in expected if t in timestamps]
+        assert all(datetime.strptime(t, "%H:%M").strftime("%H:%M") == t for t in timestamps)
+
+
+class TestSunPositionFromMinutes:
+    """Tests for the datetime-free sun position used by the day searches."""
+
+    def test_matches_calculate_sun_position(self):
+        """Minutes of a known day give exactly the datetime-based result."""
+        from sun_plant_simulator.core.sun_position import _sun_position_from_minutes
+
+        for minute_of_day in (0, 5 * 60 + 35, 12 * 60, 23 * 60 + 59):
+            hour, minute = divmod(minute_of_day, 60)
+            expected = calculate_sun_position(28.35, -81.25, datetime(2024, 2, 29, hour, minute), -5.0)
+            assert _sun_position_from_minutes(28.35, -81.25, 60, 366, minute_of_day, -5.0) == (
+                expected.azimuth_deg, expected.elevation_deg
+            )
+
+
+class TestGetSunriseSunset:
+    """Tests for get_sunrise_sunset."""
+
+    @staticmethod
+    def _scan(latitude, longitude, day, offset):
+        """First 5-minute slot with the sun up, scanning as the search did originally."""
+        def up(hour, minute):
+            dt = datetime(day.year, day.month, day.day, hour, minute)
+            return calculate_sun_position(latitude, longitude, dt, offset).elevation_deg > 0
+
+        morning = [(h, m) for h in range(4, 12) for m in range(0, 60, 5)]
+        evening = [(h, m) for h in range(20, 12, -1) for m in range(55, -1, -5)]
+        found = []
+        for slots in (morning, evening):
+            slot = next((s for s in slots if up(*s)), None)
+            found.append(None if slot is None else datetime(day.year, day.month, day.day, *slot))
+        return tuple(found)
+
+    @pytest.mark.parametrize("latitude, longitude, day, offset", [
+        (28.35, -81.25, date(2026, 6, 21), -4.0),
+        (40.7, -74.0, date(2026, 12, 21), -5.0),
+        (-33.9, 151.2, date(2026, 3, 1), 11.0),
+        (78.2, 15.6, date(2026, 6, 21), 2.0),  # Midnight sun
+        (78.2, 15.6, date(2026, 12, 21), 1.0),  # Polar night
+        (65.0, 40.0, date(2026, 2, 1), -3.0),  # Offset far from local solar time
+    ])
+    def test_matches_linear_scan(self, latitude, longitude, day, offset):
+        """Bisection finds the same slots as scanning every 5 minutes."""
+        assert get_sunrise_sunset(latitude, longitude, day, offset) == self._scan(
+            latitude, longitude, day, offset
+        )
+
+
+class TestResolveTimezoneOffset:
+    """Tests for resolve_timezone_offset function."""
+
+    def test_offset_changes_within_dst_day(self):
+        """Cached offsets must follow the DST switch within a single day."""
+        before = resolve_timezone_offset(datetime(2024, 3, 10, 1, 0), -5.0, "America/New_York")
+        after = resolve_timezone_offset(datetime(2024, 3, 10, 12, 0), -5.0, "America/New_York")
+
+        assert before == pytest.approx(-5.0)
+        assert after == pytest.approx(-4.0)
+
+    def test_ambiguous_time_respects_fold(self):
+        """The repeated hour at the end of DST resolves by fold."""
+        first = datetime(2024, 11, 3, 1, 30)
+
+        assert resolve_timezone_offset(first, -5.0, "America/New_York") == pytest.approx(-4.0)
+        assert resolve_timezone_offset(first.replace(fold=1), -5.0, "America/New_York") == pytest.approx(-5.0)
+
+    def test_unknown_zone_uses_fallback(self):
+        """Unknown zone names fall back to the fixed offset."""
+        assert resolve_timezone_offset(datetime(2024, 6, 1, 12), -3.5, "Not/A_Zone") == -3.5
@@ -0,0 +1,206 @@
+"""Tests for the time-range simulation module."""
+
+import json
+
+import numpy as np
+import pytest
+
+from sun_plant_simulator.core.hit_test import check_sun_hits_plant
+from sun_plant_simulator.core.models import Config, HitResult
+from sun_plant_simulator.simulator import time_range
+from sun_plant_simulator.simulator.time_range import (
+    SunDataPoint,
+    TimestampResult,
+    consolidate_to_intervals,
+    iter_sun_data_from_json,
+    load_sun_data_from_json,
+    simulate_time_range,
+)
+
+
+def load_default_config() -> Config:
+    """Load the default configuration shipped with the project."""
+    return Config.from_json_file("config/default_config.json")
+
+
+class TestSimulateTimeRange:
+    """Tests for simulate_time_range."""
+
+    def test_matches_per_timestamp_hit_test(self):
+        """Batched simulation should agree with calling the hit test per timestamp."""
+        config = load_default_config()
+        sun_data = [
+            SunDataPoint(timestamp=f"{minute // 60:02d}:{minute % 60:02d}",
+                         azimuth_deg=180 + (minute - 720) / 4,
+                         elevation_deg=60 - abs(minute - 720) / 8)
+            for minute in range(300, 1260, 15)
+        ]
+
+        sim = simulate_time_range(sun_data, config)
+
+        assert sim.total_timestamps == len(sun_data)
+        assert sim.hit_count > 0
+        for point, result in zip(sun_data, sim.results):
+            expected = check_sun_hits_plant(
+                sun_azimuth_deg=point.azimuth_deg,
+                sun_elevation_deg=point.elevation_deg,
+                plant=config.plant,
+                windows=config.windows,
+                n_angular=config.simulation.sample_points_angular,
+                n_vertical=config.simulation.sample_points_vertical,
+            )
+            hit = result.hit_result
+            assert hit.is_hit == expected.is_hit
+            assert hit.window_id == expected.window_id
+            assert hit.reason == expected.reason
+            np.testing.assert_array_equal(
+                np.array(hit.hit_points).reshape(-1, 3),
+                np.array(expected.hit_points).reshape(-1, 3),
+            )
+
+    def test_intervals_match_consolidated_results(self):
+        """Intervals equal consolidate_to_intervals over the detailed results."""
+        config = load_default_config()
+        sun_data = [
+            SunDataPoint(timestamp=f"t{minute}", azimuth_deg=90 + minute / 4,
+                         elevation_deg=50 - abs(minute - 360) / 10)
+            for minute in range(0, 720, 5)
+        ]
+
+        detailed = simulate_time_range(sun_data, config)
+        summary = simulate_time_range(sun_data, config, keep_details=False)
+
+        assert detailed.hit_intervals
+        assert summary.hit_intervals == consolidate_to_intervals(detailed.results)
+        assert detailed.hit_intervals == summary.hit_intervals
+        assert summary.results == []
+        assert (summary.hit_count, summary.miss_count) == (detailed.hit_count, detailed.miss_count)
+
+    def test_below_horizon_reason(self):
+        """Timestamps with the sun below the horizon report sun_below_horizon."""
+        config = load_default_config()
+        sun_data = [SunDataPoint(timestamp="night", azimuth_deg=0, elevation_deg=-5)]
+
+        sim = simulate_time_range(sun_data, config)
+
+        assert sim.hit_count == 0
+        assert sim.results[0].hit_result.reason == "sun_below_horizon"
+
+    def test_empty_input(self):
+        """An empty time range produces an empty result."""
+        sim = simulate_time_range([], load_default_config())
+
+        assert sim.total_timestamps == 0
+        assert sim.hit_intervals == []
+
+    def test_accepts_single_pass_iterator(self):
+        """A generator of points gives the same result as the equivalent list."""
+        config = load_default_config()
+        sun_data = [
+            SunDataPoint(timestamp=f"t{minute}", azimuth_deg=90 + minute / 4,
+                         elevation_deg=50 - abs(minute - 360) / 10)
+            for minute in range(0, 720, 15)
+        ]
+
+        streamed = simulate_time_range((p for p in sun_data), config, keep_details=False)
+
+        assert streamed == simulate_time_range(sun_data, config, keep_details=False)
+
+    def test_follows_window_edits_after_loading(self):
+        """Editing, reassigning or dropping windows changes the simulated hits."""
+        with open("config/default_config.json") as f:
+            config = Config.from_dict(json.load(f))
+        sun_data = [
+            SunDataPoint(timestamp=f"{az}/{el}", azimuth_deg=float(az), elevation_deg=float(el))
+            for az in range(90, 330, 6) for el in range(2, 60, 4)
+        ]
+
+        def direct_hits():
+            return sum(
+                check_sun_hits_plant(
+                    p.azimuth_deg, p.elevation_deg, config.plant, config.windows,
+                    n_angular=config.simulation.sample_points_angular,
+                    n_vertical=config.simulation.sample_points_vertical,
+                ).is_hit
+                for p in sun_data
+            )
+
+        before = simulate_time_range(sun_data, config, keep_details=False).hit_count
+        assert before == direct_hits()
+
+        for window in config.windows:
+            window.wall_thickness = 0.0
+        thin = simulate_time_range(sun_data, config, keep_details=False).hit_count
+        assert thin == direct_hits() != before
+
+        config.windows = config.windows[:1]
+        assert simulate_time_range(sun_data, config, keep_details=False).hit_count == direct_hits()
+
+        config.windows.clear()
+        assert simulate_time_range(sun_data, config, keep_details=False).hit_count == 0
+
+    def test_results_have_no_instance_dict(self):
+        """The per-timestamp records use slots to keep instances small."""
+        sun_data = [SunDataPoint(timestamp="noon", azimuth_deg=180, elevation_deg=45)]
+        sim = simulate_time_range(sun_data, load_default_config())
+
+        for obj in (sun_data[0], sim, *sim.results, *sim.hit_intervals):
+            assert not hasattr(obj, "__dict__")
+
+
+class TestLoadSunDataFromJson:
+    """Tests for reading sun data files."""
+
+    POINTS = [
+        {"timestamp": f"2026-06-21T{h:02d}:00:00", "azimuth_deg": 90 + h * 7.25,
+         "elevation_deg": -3.5 + h * 1.0625}
+        for h in range(24)
+    ]
+
+    @pytest.mark.parametrize("document", [
+        POINTS,
+        {"location": {"lat": 28.35, "note": "a \"data\": [] string"}, "data": POINTS, "n": 24},
+    ])
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_stream_matches_json_load(self, tmp_path, monkeypatch, document, chunk_size):
+        """Both file formats stream to the same points as json.load, at any chunk size."""
+        path = tmp_path / "sun.json"
+        path.write_text(json.dumps(document, indent=2))
+        monkeypatch.setattr(time_range, "_JSON_CHUNK_SIZE", chunk_size)
+
+        expected = [SunDataPoint.from_dict(d) for d in self.POINTS]
+        assert list(iter_sun_data_from_json(path)) == expected
+        assert load_sun_data_from_json(path) == expected
+
+    @pytest.mark.parametrize("text", ['{"points": []}', '{"data": {}}', '"data"', "", "[", '{"data" []}'])
+    def test_invalid_format(self, tmp_path, text):
+        """Files without a data array are rejected with ValueError."""
+        path = tmp_path / "sun.json"
+        path.write_text(text)
+
+        with pytest.raises(ValueError):
+            load_sun_data_from_json(path)
+
+
+class TestConsolidateToIntervals:
+    """Tests for consolidate_to_intervals."""
+
+    def test_interval_ends_at_previous_timestamp(self):
+        """Each interval ends at the last hit before a miss, even when misses repeat."""
+        miss = TimestampResult(timestamp="cloud", hit_result=HitResult(is_hit=False))
+        hit = HitResult(is_hit=True, window_id="w1")
+        results = [
+            miss,
+            TimestampResult(timestamp="10:00", hit_result=hit),
+            TimestampResult(timestamp="10:05", hit_result=hit),
+            miss,
+            TimestampResult(timestamp="11:00", hit_result=hit),
+            miss,
+        ]
+
+        intervals = consolidate_to_intervals(results)
+
+        assert [(i.start_timestamp, i.end_timestamp, i.n_timestamps) for i in intervals] == [
+            ("10:00", "10:05", 2),
+            ("11:00", "11:00", 1),
+        ]